@@ -0,0 +1,23 @@
+Feature: Async Operator Generation
+  As a developer of asyncio test services
+  I want to generate operators from remote data without blocking the event loop
+  So that my services stay responsive while the data loads
+
+  Scenario: Concurrent requests share a single download
+    Given a stub HTTP server serving operator data
+    And a generator using the HTTP data source
+    When 20 coroutines generate operators at the same time
+    Then every coroutine should receive operators from the served data
+    And the server should have been asked for the data only once
+
+  Scenario: Stream operators asynchronously
+    Given a stub HTTP server serving operator data
+    And a generator using the HTTP data source
+    When I asynchronously stream 25000 operators in chunks of 10000
+    Then I should receive 25000 operators from the served data
+
+  Scenario: Report an unreachable data source
+    Given a generator using an HTTP data source that is not running
+    When a coroutine generates an operator
+    Then I should receive a clear error message if data sources are unavailable
+    And the error should help me troubleshoot the data source issue
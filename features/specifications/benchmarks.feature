@@ -0,0 +1,18 @@
+Feature: Performance Benchmarks
+  As a maintainer of TelecomFaker
+  I want a benchmark suite with machine-readable results
+  So that I can catch performance regressions between versions
+
+  Scenario: Save benchmark results as JSON
+    When I run a quick benchmark suite and save the results
+    Then the results should cover generation, serialization, data loading and import time
+    And every result should include its timing
+
+  Scenario: Report a regression against a faster baseline
+    Given saved benchmark results from a much faster version
+    When I run a quick benchmark suite compared with those results
+    Then the benchmark run should fail and name the slower benchmarks
+
+  Scenario: Reject a benchmark run without import runs
+    When I run the benchmark suite with 0 import runs
+    Then the benchmark run should be rejected because it needs at least 1 import run
@@ -0,0 +1,42 @@
+Feature: Bulk Operator Generation
+  As a telecom test engineer
+  I want to generate large batches of operator data quickly
+  So that I can build big test fixtures without waiting on the generator
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Generate a large batch of operators in one call
+    When I generate a batch of 10000 operators
+    Then I should receive 10000 complete operators
+    And every operator in the batch should come from the built-in data
+
+  Scenario: Reproduce a large batch with a seed
+    When I generate two batches of 1000 operators with the same seed
+    Then both batches should contain identical operators
+
+  Scenario: Stream operators without building the whole batch
+    When I stream 25000 operators with seed 7
+    Then I should receive 25000 complete operators
+    And the streamed operators should match a batch generated with seed 7
+
+  Scenario: Spread a bulk load over several processes
+    When I generate 210000 operators with seed 5 using 1 worker
+    And I generate 210000 operators with seed 5 using 3 workers
+    Then both batches should contain identical operators
+
+  Scenario: Keep a bulk load over several processes on the data it started with
+    Given a generator reloading a data file of 20 operators
+    When I start streaming 210000 operators with seed 5 using 1 worker and using 2 workers
+    And the generator reloads the data file with 3 other operators before the streams are read
+    Then both batches should contain identical operators
+    And every operator should come from the data the generator loaded
+
+  Scenario: Generate lightweight records for high-volume fixtures
+    When I generate 5000 operators as lightweight records with seed 3
+    Then each record should carry the same details as a full operator generated with seed 3
+    And each record can be converted back to a full operator
+
+  Scenario: Generate operators as columns for data frames
+    When I generate 2000 operators as columns with seed 11
+    Then the columns should describe the same operators as a batch generated with seed 11
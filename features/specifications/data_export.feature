@@ -0,0 +1,48 @@
+Feature: Telecom Data Export
+  As a telecom test engineer
+  I want to export generated operator data from the command line
+  So that I can feed large data sets into other tools and pipelines
+
+  Scenario: Export operators as a JSON array
+    When I export 1200 operators in "json" format
+    Then the export should be a JSON array of 1200 operators
+
+  Scenario: Export operators as newline-delimited JSON
+    When I export 1200 operators in "ndjson" format
+    Then the export should contain 1200 lines with one JSON operator each
+
+  Scenario: Export operators as compact JSON
+    When I export 1200 operators in "json" format with "--compact"
+    Then the export should be a JSON array of 1200 operators
+    And the export should have no whitespace between values
+
+  Scenario: Export the same JSON as the library
+    When I export 1200 operators in "json" format
+    Then the export should match the library's JSON for the same 1200 operators
+
+  Scenario: Export operators as CSV
+    When I export 1200 operators in "csv" format
+    Then the export should be a CSV table with a header and 1200 operators
+
+  Scenario: Export operators to a Parquet file
+    Given the Arrow libraries are installed
+    When I export 1200 operators to a "parquet" file
+    Then the file should hold the same 1200 operators as the CSV export
+
+  Scenario: Start the exporter quickly from shell scripts
+    When I start the command-line exporter in a fresh process
+    Then it should not load the model validation library
+
+  Scenario Outline: Write non-ASCII names the same way whether or not orjson is installed
+    Given a data file with the operator "Telefónica Móviles"
+    When I write 3 operators from it in "<output_format>" format with the default encoder
+    Then the output should match the standard json module, with non-ASCII characters escaped
+
+    Examples:
+      | output_format |
+      | json          |
+      | ndjson        |
+
+  Scenario: Convert operators to the same dictionaries as the models
+    When I convert 20 generated operators and their records to dictionaries
+    Then every dictionary should match the model's own fields
@@ -15,4 +15,88 @@ Feature: Telecom Data Source Management
     Given I am working in an environment with restricted network access
     When I try to generate telecom operator data
     Then I should receive a clear error message if data sources are unavailable
-    And the error should help me troubleshoot the data source issue
\ No newline at end of file
+    And the error should help me troubleshoot the data source issue
+
+  Scenario: Create many generators without reloading the data
+    When I create 500 generators with the built-in data
+    Then they should all share a single copy of the operator table
+    And each generator's data should be a plain dictionary I can change and save as JSON
+
+  Scenario: Generate from built-in data narrowed down by a custom provider
+    Given a data provider that keeps only the built-in operators from "Germany"
+    When I generate 50 operators with that provider
+    Then every generated operator should be from "Germany"
+
+  Scenario: Generate from built-in data I changed
+    Given a built-in data provider whose data I cut down to the operators from "Japan"
+    When I generate 50 operators with that provider
+    Then every generated operator should be from "Japan"
+
+  Scenario: Generate from data changed in place after the first draw
+    Given a built-in data provider whose data I cut down to the operators from "Japan"
+    And I have generated operators with that provider
+    When I cut its data down in place to the operators from "Germany" and invalidate its table
+    And I generate 50 operators with that provider
+    Then every generated operator should be from "Germany"
+
+  Scenario: Pick up changes to a custom data file
+    Given a custom data file listing the operator "Alpha Mobile"
+    And a generator using that data file
+    When the data file is updated to list the operator "Beta Mobile"
+    Then a new generator using that data file should produce "Beta Mobile"
+    And the existing generator should produce "Alpha Mobile" until I refresh its data
+    And after refreshing, the existing generator should produce "Beta Mobile"
+
+  Scenario: Load a large operator list from a compiled snapshot
+    Given a custom data file listing 5000 operators
+    When I load that data through a compiled snapshot
+    Then the snapshot should provide the same 5000 operators as the data file
+    And I should be able to generate operators from the snapshot
+
+  Scenario: Recompile a snapshot written by an older version
+    Given a custom data file listing 100 operators
+    And a snapshot of that data file in an older format
+    When I load that data through a compiled snapshot
+    Then the snapshot should provide the same 100 operators as the data file
+
+  Scenario: Hot-reload a data file while generating
+    Given a custom data file listing 5000 operators
+    And a generator watching that data file for changes
+    When operators are added, removed and changed in the data file while generation continues
+    Then the generator should report 1 added, 1 removed and 1 changed operator
+    And the generator should produce the new and changed operators
+    And generation should never have been interrupted by the reload
+
+  Scenario: Retry a reload that could not be applied
+    Given a custom data file listing 100 operators
+    And a generator reloading that data file
+    When an operator is renamed in the data file but applying the change fails once
+    Then the generator should still use the operators it loaded before
+    And refreshing the data again should apply the renamed operator
+
+  Scenario: Filter by several attributes while the data file is reloaded
+    Given a custom data file listing 2000 operators
+    And a generator reloading that data file
+    When operators are drawn by country and operator type while the data file is reloaded 20 times
+    Then no draw or reload should have failed
+
+  Scenario: Keep serving operators when an updated data file is broken
+    Given a custom data file listing the operator "Alpha Mobile"
+    And a generator reloading that data file
+    When the data file is overwritten with invalid JSON
+    Then refreshing the data should report the invalid file
+    And the generator should still produce "Alpha Mobile"
+
+  Scenario: The watcher keeps reporting a broken data file until it is fixed
+    Given a custom data file listing the operator "Alpha Mobile"
+    And a generator watching that data file for changes
+    When the data file is overwritten with invalid JSON
+    Then the watcher should still report the invalid file after several checks
+    And the generator should still produce "Alpha Mobile"
+    When the data file is updated to list the operator "Beta Mobile"
+    Then the watcher should stop reporting an error once it has reloaded the file
+
+  Scenario: Load a data file with loosely typed values
+    Given a custom data file where "Loose Mobile" has "is_mvno" set to 1 and "size" set to "LARGE"
+    When I generate an operator from that data file
+    Then the operator should be "Loose Mobile", a large MVNO
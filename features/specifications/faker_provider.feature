@@ -0,0 +1,30 @@
+Feature: Faker Provider
+  As a test engineer using the faker library
+  I want telecom data available on my faker.Faker instance
+  So that my fixtures mix telecom and other fake data from one seeded source
+
+  Background:
+    Given a faker.Faker instance with the telecom provider
+
+  Scenario: Generate telecom values from faker
+    When I ask faker for an operator, an MCC and an IMSI
+    Then the operator should be a known operator
+    And the MCC should belong to a known operator
+    And the IMSI should have 15 digits and start with a known operator's MCC and MNC
+
+  Scenario: Seeding faker makes telecom values reproducible
+    When I ask faker for 20 IMSIs twice after seeding it with 42
+    Then both runs should give the same IMSIs
+
+  Scenario: Filter the generated values
+    When I ask faker for 50 IMSIs with MCC "262"
+    Then every IMSI should start with "262"
+    And an operator from faker for "Germany" should be based in "Germany"
+
+  Scenario: Use faker's unique proxy
+    When I ask faker's unique proxy for 10 operators
+    Then all 10 operators should be different
+
+  Scenario: Generate many values in one call
+    When I ask faker for 5000 IMSIs in one call
+    Then I should receive 5000 IMSIs with 15 digits each
@@ -0,0 +1,26 @@
+Feature: Generation Instrumentation
+  As a telecom test engineer
+  I want to see where generation time and memory go
+  So that I can find out why a large test data run is slow
+
+  Scenario: Time every stage of generation
+    Given a TelecomFaker with stats enabled
+    When I generate a batch of 5000 operators
+    Then the stats should show timings for the load, sample and build stages
+    And the stats should count 5000 sampled and 5000 built rows
+    And the stats should report rows per second and peak memory
+
+  Scenario: Forward timings to a metrics system
+    Given a TelecomFaker with stats enabled and a metrics callback
+    When I generate 3 batches of 1000 operators
+    Then the callback should have received 3 sample timings of 1000 rows each
+
+  Scenario: Stats do not change the generated operators
+    Given a TelecomFaker with stats enabled
+    When I generate 200 operators with seed 7 with and without stats
+    Then both runs should contain identical operators
+
+  Scenario: Print generation stats from the command line
+    When I export 50000 operators in "ndjson" format with "--stats"
+    Then the export should contain 50000 lines with one JSON operator each
+    And the command should report timings for the sample and serialize stages and the rows per second
@@ -0,0 +1,19 @@
+Feature: Operator Filtering
+  As a telecom test engineer
+  I want to generate operators that match specific attributes
+  So that my test scenarios cover exactly the markets and operator types I care about
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Generate operators from a specific country
+    When I ask for 200 operators from "United Kingdom"
+    Then every operator should be based in "United Kingdom"
+
+  Scenario: Combine several filters
+    When I ask for 200 large network operators
+    Then every operator should be a large network operator
+
+  Scenario: Ask for operators that do not exist
+    When I ask for an operator from "Atlantis"
+    Then I should be told that no operators match my filters
@@ -16,4 +16,30 @@ Feature: Telecom Operator Data Generation
     Given I need predictable test data across multiple test runs
     When I use the same seed value for each test run
     Then I should get identical operator data each time
-    And I can rely on this consistency for automated testing
\ No newline at end of file
+    And I can rely on this consistency for automated testing
+
+  Scenario: Keep independently seeded generators isolated
+    Given two generators seeded with different values
+    When I reseed only the second generator while the first is in use
+    Then the first generator should continue its own sequence undisturbed
+
+  Scenario: Derive reproducible child generators for parallel work
+    Given a generator seeded with 42
+    When I derive 4 child generators from it
+    Then each child should produce a different operator sequence
+    And deriving them again from the same seed should reproduce every sequence
+
+  Scenario Outline: Draw the same operators one at a time as in one batch
+    Given a <mode> generator seeded with 7
+    When I draw 25 operators one at a time and 25 in one batch from the same seed
+    Then both draws should return the same operators in the same order
+
+    Examples:
+      | mode     |
+      | uniform  |
+      | weighted |
+
+  Scenario: Keep the seeded sequences of earlier versions
+    Given a uniform generator seeded with 42
+    When I draw 5 operators from it
+    Then I should get "Orange, Vodafone, NTT DoCoMo, Verizon, Verizon" in that order
@@ -0,0 +1,28 @@
+Feature: Operator Lookup
+  As a telecom test engineer
+  I want to identify the operator behind network codes and subscriber identities
+  So that I can enrich call records and IMSIs in my test data with operator details
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Identify an operator by its network codes
+    When I look up the operator for MCC "262" and MNC "02"
+    Then I should get the operator "Vodafone"
+
+  Scenario: Identify the operator that issued an IMSI
+    When I look up the operator for IMSI "310012123456789"
+    Then I should get the operator "Verizon"
+
+  Scenario: Unknown network codes are reported as not found
+    When I look up the operator for MCC "999" and MNC "99"
+    Then I should be told that no operator was found
+
+  Scenario: Identify operators for many IMSIs at once
+    When I look up the operators for these IMSIs:
+      | imsi            |
+      | 234261234567890 |
+      | 234101234567890 |
+      | 999991234567890 |
+      | 208011234567890 |
+    Then I should get the operators "Lycamobile, Giffgaff, none, Orange" in that order
@@ -0,0 +1,30 @@
+Feature: Output Sinks
+  As a telecom test engineer
+  I want to load generated operators straight into databases and compressed files
+  So that I do not have to go through temporary files
+
+  Scenario: Load operators into a SQLite database
+    Given I have access to the TelecomFaker library
+    When I write 120000 operators with seed 3 into a SQLite database in batches of 25000
+    Then the database table should hold the same 120000 operators as the generator with seed 3
+
+  Scenario: Load operators into a SQLite database from the command line
+    When I export 5000 operators to a SQLite database from the command line
+    Then the database table should hold 5000 operators
+
+  Scenario: Export operators in PostgreSQL COPY format
+    When I export 1200 operators in "copy" format
+    Then the export should contain 1200 tab-separated rows with t or f in the last column
+
+  Scenario Outline: Export compressed files
+    When I export 20000 operators in "ndjson" format to a "<suffix>" file
+    Then the file should decompress to the same export as without compression
+
+    Examples:
+      | suffix |
+      | .gz    |
+      | .zst   |
+
+  Scenario: Batch size and double buffering do not change the output
+    When I export 30000 operators in "json" format with batch size 777 and without double buffering
+    Then the export should be identical to the default export of 30000 operators in "json" format
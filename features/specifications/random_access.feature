@@ -0,0 +1,39 @@
+Feature: Random Access Generation
+  As a data engineer
+  I want to get any row of a seeded operator sequence directly
+  So that I can resume exports and regenerate slices in parallel
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Get a row far into the sequence directly
+    When I get row 40000000 of the sequence with seed 42
+    Then it should be the same operator as row 40000000 of a range with seed 42
+
+  Scenario: Slices of the sequence fit together
+    When I generate rows 0 to 1000 of the sequence with seed 7
+    Then it should equal rows 0 to 400 followed by rows 400 to 1000 with seed 7
+
+  Scenario: The sequence is the same in another process
+    When I generate rows 5000 to 5100 of the sequence with seed 7
+    Then a separate Python process should generate the same rows 5000 to 5100 with seed 7
+
+  Scenario: Different seeds give different sequences
+    When I generate rows 0 to 100 of the sequence with seed 1
+    Then it should differ from rows 0 to 100 with seed 2
+
+  Scenario: Filter the sequence
+    When I generate rows 0 to 200 of the sequence with seed 3 for country "United States"
+    Then every operator should be based in "United States"
+
+  Scenario: Rows are spread evenly over the operators
+    When I generate rows 1000000 to 1030000 of the sequence with seed 11
+    Then every operator should appear about equally often
+
+  Scenario: Weighted random access follows market share
+    When I generate rows 0 to 20000 of the weighted sequence with seed 5
+    Then large operators should appear more often than small operators
+
+  Scenario: Reject a negative row
+    When I try to get row -1 of the sequence with seed 42
+    Then I should be told that rows start at 0
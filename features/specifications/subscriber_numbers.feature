@@ -0,0 +1,43 @@
+Feature: Subscriber Number Generation
+  As a telecom test engineer
+  I want valid IMSIs, MSISDNs and ICCIDs for an operator
+  So that I can load subscriber databases with realistic identities
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Generate complete subscriber identities for an operator
+    Given the operator with MCC "262" and MNC "02"
+    When I generate 10000 subscriber identities for that operator
+    Then every IMSI should have 15 digits and start with "26202"
+    And every MSISDN should start with the country calling code "49"
+    And every ICCID should have 19 digits and a valid Luhn check digit
+    And no IMSI, MSISDN or ICCID should appear twice
+
+  Scenario: Numbers stay unique across batches
+    Given the operator with MCC "310" and MNC "012"
+    When I generate 3 batches of 5000 IMSIs from the same number generator
+    Then no IMSI should appear in more than one batch
+
+  Scenario: Reproduce subscriber numbers with a seed
+    Given the operator with MCC "234" and MNC "26"
+    When I generate 100 subscriber identities for that operator twice with seed 42
+    Then both runs should contain identical subscriber identities
+
+  Scenario: Keep subscriber identities lined up after a range runs out
+    Given the operator with MCC "262" and MNC "02"
+    And a number generator with seed 7 and the calling code "9999999999", which leaves room for 10000 ICCIDs
+    When I generate 6000 subscriber identities and then ask for 6000 more
+    Then the second request should be refused because the ICCID range is exhausted
+    And the next 4000 identities should match those of an uninterrupted generator with seed 7
+
+  Scenario Outline: Reject calling codes that are not digits
+    Given the operator with MCC "262" and MNC "02"
+    When I create a number generator with the calling code "<calling_code>"
+    Then I should be told that the calling code must be digits
+
+    Examples:
+      | calling_code |
+      | +49          |
+      | 4 9          |
+      | 4a           |
@@ -0,0 +1,64 @@
+Feature: Traffic Event Generation
+  As a telecom test engineer
+  I want a stream of synthetic call, SMS and data records
+  So that I can feed billing and mediation pipelines with realistic traffic
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Generate timestamped traffic at a target rate
+    When I generate 20000 traffic events at 1000 events per second
+    Then the events should be in timestamp order and span about 20 seconds
+    And every event should belong to a subscriber of a known home operator
+    And the events should include voice calls, SMS and data sessions
+
+  Scenario: Roaming events are made on a network in another country
+    When I generate 20000 traffic events with a roaming rate of 0.3
+    Then every roaming event should be on an operator with a different MCC than the home operator
+    And every other event should be on the home operator's network
+    And about 30 percent of the events should be roaming
+
+  Scenario: Configure the event mix
+    When I generate 2000 traffic events with the mix "sms=1"
+    Then every event should be an SMS without duration or volume
+
+  Scenario Outline: Reject traffic profiles that cannot produce valid records
+    When I create a traffic profile with <setting> set to <value>
+    Then I should be told that the <setting> is invalid
+
+    Examples:
+      | setting               | value |
+      | mean_call_duration    | 0     |
+      | mean_session_duration | 0     |
+      | median_data_volume    | -1    |
+      | data_volume_sigma     | -0.5  |
+
+  Scenario: Draw data sessions and voice calls with their own mean durations
+    When I generate 20000 traffic events with calls of 60 seconds and data sessions of 600 seconds on average
+    Then voice calls should last about 60 seconds and data sessions about 600 seconds on average
+
+  Scenario: Stream traffic in bounded batches
+    When I stream 25000 traffic events in batches of 1000
+    Then I should receive 25 batches of at most 1000 events each
+
+  Scenario: Replay traffic in real time
+    When I replay 5000 traffic events at 1000 events per second
+    Then the replay should wait about 5 seconds in total before handing out the last batch
+
+  Scenario: Reproduce traffic with a seed
+    When I generate 500 traffic events twice with seed 42
+    Then both traffic runs should contain identical events
+
+  Scenario: Generate traffic from the command line
+    When I run the traffic command for 3000 events in "csv" format
+    Then the output should be a CSV table with a header and 3000 traffic events
+
+  Scenario Outline: Reject invalid traffic settings on the command line
+    When I run the traffic command with "<option>" set to "<value>"
+    Then the command should be rejected with "<message>" and no traceback
+
+    Examples:
+      | option         | value    | message                              |
+      | --mix          | voice=-1 | Event shares must not be negative    |
+      | --rate         | 0        | Rate must be greater than zero       |
+      | --roaming-rate | 2        | Roaming rate must be between 0 and 1 |
@@ -0,0 +1,25 @@
+Feature: Unique Operator Sampling
+  As a telecom test engineer
+  I want to draw distinct operators, or every operator once in random order
+  So that my test fixtures never contain accidental duplicates
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Draw distinct operators
+    When I sample 10 unique operators
+    Then no operator should appear twice
+    And every built-in operator should be included
+
+  Scenario: Draw distinct operators that match filters
+    When I sample 2 unique operators from "United Kingdom"
+    Then I should get "Giffgaff" and "Lycamobile" in some order
+
+  Scenario: Ask for more distinct operators than exist
+    When I sample 11 unique operators
+    Then I should be told that only 10 operators match
+
+  Scenario: Visit every operator once in shuffled order
+    When I iterate over the operators in shuffled order with seed 3
+    Then every built-in operator should be included exactly once
+    And the order should be the same when I shuffle again with seed 3
@@ -0,0 +1,21 @@
+Feature: Market Share Weighted Generation
+  As a telecom test engineer
+  I want operators to appear in proportion to their market share
+  So that my load tests see a realistic traffic mix
+
+  Background:
+    Given I have access to the TelecomFaker library
+
+  Scenario: Operators with more subscribers appear more often
+    Given a data file where "Big Mobile" has 9 times the subscribers of "Tiny Mobile"
+    When I generate 20000 operators weighted by market share
+    Then about 90% of them should be "Big Mobile"
+
+  Scenario: Operator size sets the share when the data has no weights
+    When I generate 20000 operators weighted by market share
+    Then large operators should appear more often than small operators
+
+  Scenario: Weighted generation is reproducible across worker processes
+    When I generate 5000 weighted operators with seed 7 using 1 worker
+    And I generate 5000 weighted operators with seed 7 using 2 workers again
+    Then both weighted runs should contain identical operators
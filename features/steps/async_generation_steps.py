@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, has_length, is_in
+from telecomfaker import TelecomFaker
+from telecomfaker.providers import HttpJsonProvider
+
+STUB_OPERATORS = [
+    {"name": "Stub Mobile", "country": "Testland", "mcc": "001", "mnc": "01", "size": "large", "is_mvno": False},
+    {"name": "Stub Telecom", "country": "Testland", "mcc": "001", "mnc": "02", "size": "small", "is_mvno": True},
+]
+
+def start_stub_server(context):
+    """Serve STUB_OPERATORS on a local port, counting the requests."""
+    context.request_count = 0
+    body = json.dumps({"operators": STUB_OPERATORS}).encode('utf-8')
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            context.request_count += 1
+            # Respond slowly so concurrent coroutines overlap with the download
+            time.sleep(0.2)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    context.add_cleanup(server.server_close)
+    context.add_cleanup(server.shutdown)
+    return f"http://127.0.0.1:{server.server_address[1]}/operators.json"
+
+@given('a stub HTTP server serving operator data')
+def step_impl(context):
+    context.url = start_stub_server(context)
+
+@given('a generator using the HTTP data source')
+def step_impl(context):
+    context.faker = TelecomFaker(data_provider=HttpJsonProvider(context.url))
+
+@given('a generator using an HTTP data source that is not running')
+def step_impl(context):
+    context.faker = TelecomFaker(data_provider=HttpJsonProvider("http://127.0.0.1:9/operators.json", timeout=1.0))
+
+@when('{count:d} coroutines generate operators at the same time')
+def step_impl(context, count):
+    async def generate_all():
+        return await asyncio.gather(*(context.faker.agenerate_operators(5) for _ in range(count)))
+
+    context.batches = asyncio.run(generate_all())
+    assert_that(context.batches, has_length(count))
+
+@then('every coroutine should receive operators from the served data')
+def step_impl(context):
+    names = [operator["name"] for operator in STUB_OPERATORS]
+    for batch in context.batches:
+        for operator in batch:
+            assert_that(operator.name, is_in(names))
+
+@then('the server should have been asked for the data only once')
+def step_impl(context):
+    assert_that(context.request_count, equal_to(1))
+
+@when('I asynchronously stream {count:d} operators in chunks of {chunk_size:d}')
+def step_impl(context, count, chunk_size):
+    async def stream():
+        return [operator async for operator in context.faker.aiter_operators(count, chunk_size, record_type="record")]
+
+    context.operators = asyncio.run(stream())
+
+@then('I should receive {count:d} operators from the served data')
+def step_impl(context, count):
+    names = [operator["name"] for operator in STUB_OPERATORS]
+    assert_that(context.operators, has_length(count))
+    assert_that({operator.name for operator in context.operators}, equal_to(set(names)))
+
+@when('a coroutine generates an operator')
+def step_impl(context):
+    context.data = {'error': None, 'operator': None}
+    try:
+        context.data['operator'] = asyncio.run(context.faker.agenerate_operator())
+    except Exception as e:
+        context.data['error'] = str(e)
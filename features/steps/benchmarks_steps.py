@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, has_item, has_key, greater_than, contains_string, is_not
+
+# Wall-clock budgets are too noisy for shared machines; python -m telecomfaker.bench checks them
+QUICK_SUITE = ['--max-count', '1000', '--repeat', '1', '--import-runs', '1', '--no-budget']
+
+def run_bench(*args):
+    return subprocess.run(
+        [sys.executable, '-m', 'telecomfaker.cli', 'bench', *QUICK_SUITE, *args],
+        capture_output=True, text=True
+    )
+
+@when('I run a quick benchmark suite and save the results')
+def step_impl(context):
+    results_file = os.path.join(tempfile.mkdtemp(), 'results.json')
+    result = run_bench('--output', results_file)
+    assert_that(result.returncode, equal_to(0), result.stderr)
+    with open(results_file, 'r', encoding='utf-8') as f:
+        context.report = json.load(f)
+
+@then('the results should cover generation, serialization, data loading and import time')
+def step_impl(context):
+    names = list(context.report['results'])
+    for name in ('generate_operator', 'generate_operators[1]', 'generate_operators[1000]',
+                 'operators_to_json[1000]', 'format_operator_as_text[1000]', 'provider_load', 'import_time'):
+        assert_that(names, has_item(name))
+    assert_that(context.report, has_key('telecomfaker'))
+    assert_that(context.report, has_key('python'))
+
+@then('every result should include its timing')
+def step_impl(context):
+    for result in context.report['results'].values():
+        assert_that(result['seconds'], greater_than(0))
+
+@given('saved benchmark results from a much faster version')
+def step_impl(context):
+    context.baseline_file = os.path.join(tempfile.mkdtemp(), 'baseline.json')
+    baseline = {
+        'telecomfaker': 'fast',
+        'results': {'generate_operator': {'seconds': 1e-9}, 'provider_load': {'seconds': 1e-9}},
+    }
+    with open(context.baseline_file, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f)
+
+@when('I run a quick benchmark suite compared with those results')
+def step_impl(context):
+    context.result = run_bench('--compare', context.baseline_file)
+
+@then('the benchmark run should fail and name the slower benchmarks')
+def step_impl(context):
+    assert_that(context.result.returncode, is_not(equal_to(0)))
+    assert_that(context.result.stderr, contains_string('generate_operator is'))
+    assert_that(context.result.stderr, contains_string('provider_load is'))
+
+@when('I run the benchmark suite with {runs:d} import runs')
+def step_impl(context, runs):
+    context.result = run_bench('--import-runs', str(runs))
+
+@then('the benchmark run should be rejected because it needs at least 1 import run')
+def step_impl(context):
+    assert_that(context.result.returncode, equal_to(2))
+    assert_that(context.result.stderr, contains_string('--import-runs must be at least 1'))
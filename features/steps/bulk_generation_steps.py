@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+from behave import given, when, then
+from telecomfaker import TelecomFaker
+from telecomfaker.providers import ReloadingJsonProvider
+from telecomfaker.models import TelecomOperator
+from telecomfaker.records import operator_to_dict
+from hamcrest import assert_that, equal_to, has_length, instance_of, is_in
+
+@when('I generate a batch of {count:d} operators')
+def step_impl(context, count):
+    context.batch = context.faker.generate_operators(count)
+
+@then('I should receive {count:d} complete operators')
+def step_impl(context, count):
+    assert_that(context.batch, has_length(count))
+    for operator in context.batch:
+        assert_that(operator, instance_of(TelecomOperator))
+
+@then('every operator in the batch should come from the built-in data')
+def step_impl(context):
+    known = {(op['mcc'], op['mnc']) for op in context.faker.data_provider.get_data()['operators']}
+    for operator in context.batch:
+        assert_that((operator.mcc, operator.mnc), is_in(known))
+
+@when('I generate two batches of {count:d} operators with the same seed')
+def step_impl(context, count):
+    context.batches = []
+    for _ in range(2):
+        faker = TelecomFaker()
+        faker.set_seed(42)
+        context.batches.append(faker.generate_operators(count))
+
+@then('both batches should contain identical operators')
+def step_impl(context):
+    first, second = context.batches
+    assert_that([operator_to_dict(op) for op in first], equal_to([operator_to_dict(op) for op in second]))
+
+@when('I stream {count:d} operators with seed {seed:d}')
+def step_impl(context, count, seed):
+    faker = TelecomFaker()
+    faker.set_seed(seed)
+    context.batch = list(faker.iter_operators(count))
+
+@then('the streamed operators should match a batch generated with seed {seed:d}')
+def step_impl(context, seed):
+    faker = TelecomFaker()
+    faker.set_seed(seed)
+    expected = faker.generate_operators(len(context.batch))
+    assert_that([operator_to_dict(op) for op in context.batch], equal_to([operator_to_dict(op) for op in expected]))
+
+@when('I generate {count:d} operators with seed {seed:d} using {workers:d} worker')
+@when('I generate {count:d} operators with seed {seed:d} using {workers:d} workers')
+def step_impl(context, count, seed, workers):
+    if not hasattr(context, 'batches'):
+        context.batches = []
+    context.batches.append(context.faker.generate_operators_parallel(count, workers=workers, seed=seed))
+
+def write_operators_file(path, prefix, count):
+    operators = [{"name": f"{prefix} {index}", "country": "Testland", "mcc": "001", "mnc": f"{index:02d}",
+                  "size": "medium", "is_mvno": False} for index in range(count)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f)
+
+@given('a generator reloading a data file of {count:d} operators')
+def step_impl(context, count):
+    context.data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    write_operators_file(context.data_file, "Loaded", count)
+    context.faker = TelecomFaker(data_provider=ReloadingJsonProvider(context.data_file))
+    context.loaded_names = {record.name for record in context.faker.data_provider.get_table().records}
+
+@when('I start streaming {count:d} operators with seed {seed:d} using {first:d} worker and using {second:d} workers')
+def step_impl(context, count, seed, first, second):
+    context.streams = [context.faker.iter_operators_parallel(count, workers=workers, seed=seed, record_type='record')
+                       for workers in (first, second)]
+
+@when('the generator reloads the data file with {count:d} other operators before the streams are read')
+def step_impl(context, count):
+    write_operators_file(context.data_file, "Changed", count)
+    stat = os.stat(context.data_file)
+    # Make sure the change is visible even on filesystems with coarse timestamps
+    os.utime(context.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    context.faker.data_provider.refresh()
+    context.batches = [list(stream) for stream in context.streams]
+
+@then('every operator should come from the data the generator loaded')
+def step_impl(context):
+    for batch in context.batches:
+        assert_that({operator.name for operator in batch} - context.loaded_names, equal_to(set()))
+    assert_that({operator.name for operator in context.batches[0]}, equal_to(context.loaded_names))
+
+@when('I generate {count:d} operators as lightweight records with seed {seed:d}')
+def step_impl(context, count, seed):
+    context.records = TelecomFaker(seed=seed).generate_operators(count, record_type='record')
+
+@then('each record should carry the same details as a full operator generated with seed {seed:d}')
+def step_impl(context, seed):
+    operators = TelecomFaker(seed=seed).generate_operators(len(context.records))
+    assert_that([record._asdict() for record in context.records], equal_to([operator_to_dict(op) for op in operators]))
+
+@then('each record can be converted back to a full operator')
+def step_impl(context):
+    for record in context.records[:100]:
+        operator = record.to_pydantic()
+        assert_that(operator, instance_of(TelecomOperator))
+        assert_that(operator_to_dict(operator), equal_to(record._asdict()))
+
+@when('I generate {count:d} operators as columns with seed {seed:d}')
+def step_impl(context, count, seed):
+    context.columns = TelecomFaker(seed=seed).generate_columns(count)
+    assert_that(len(context.columns), equal_to(count))
+
+@then('the columns should describe the same operators as a batch generated with seed {seed:d}')
+def step_impl(context, seed):
+    operators = TelecomFaker(seed=seed).generate_operators(len(context.columns))
+    expected = {
+        field: [operator_to_dict(op)[field] for op in operators]
+        for field in ('name', 'country', 'mcc', 'mnc', 'is_mvno')
+    }
+    expected['size'] = [op.size.value for op in operators]
+    assert_that(context.columns.to_pydict(), equal_to(expected))
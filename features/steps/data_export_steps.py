@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, has_length, instance_of
+from telecomfaker import TelecomFaker
+from telecomfaker.providers import LocalJsonProvider
+from telecomfaker.records import operator_to_dict
+from telecomfaker.serialize import operators_to_json
+
+OPERATOR_FIELDS = ('name', 'country', 'mcc', 'mnc', 'size', 'is_mvno')
+
+def run_cli_process(*args):
+    return subprocess.run(
+        [sys.executable, '-m', 'telecomfaker.cli', *args],
+        capture_output=True, text=True, check=True
+    )
+
+def run_cli(*args):
+    return run_cli_process(*args).stdout
+
+def assert_is_operator(record):
+    assert_that(sorted(record), equal_to(sorted(OPERATOR_FIELDS)))
+
+@when('I export {count:d} operators in "{output_format}" format')
+def step_impl(context, count, output_format):
+    context.export = run_cli('--count', str(count), '--format', output_format, '--seed', '1')
+
+@when('I export {count:d} operators in "{output_format}" format with "{option}"')
+def step_impl(context, count, output_format, option):
+    result = run_cli_process('--count', str(count), '--format', output_format, '--seed', '1', option)
+    context.export, context.stderr = result.stdout, result.stderr
+
+@then('the export should have no whitespace between values')
+def step_impl(context):
+    assert_that(context.export, equal_to(json.dumps(json.loads(context.export), separators=(',', ':')) + '\n'))
+
+@then("the export should match the library's JSON for the same {count:d} operators")
+def step_impl(context, count):
+    operators = TelecomFaker(seed=1).iter_operators_parallel(count)
+    assert_that(context.export, equal_to(operators_to_json(operators) + '\n'))
+
+@then('the export should be a JSON array of {count:d} operators')
+def step_impl(context, count):
+    records = json.loads(context.export)
+    assert_that(records, instance_of(list))
+    assert_that(records, has_length(count))
+    for record in records:
+        assert_is_operator(record)
+
+@then('the export should contain {count:d} lines with one JSON operator each')
+def step_impl(context, count):
+    lines = context.export.splitlines()
+    assert_that(lines, has_length(count))
+    for line in lines:
+        assert_is_operator(json.loads(line))
+
+@then('the export should be a CSV table with a header and {count:d} operators')
+def step_impl(context, count):
+    rows = list(csv.DictReader(io.StringIO(context.export)))
+    assert_that(rows, has_length(count))
+    for row in rows:
+        assert_is_operator(row)
+
+@given('the Arrow libraries are installed')
+def step_impl(context):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        context.scenario.skip("pyarrow is not installed")
+
+@when('I export {count:d} operators to a "{output_format}" file')
+def step_impl(context, count, output_format):
+    directory = tempfile.mkdtemp()
+    context.export_path = os.path.join(directory, f"operators.{output_format}")
+    run_cli('--count', str(count), '--format', output_format, '--seed', '1', '--output', context.export_path)
+
+@then('the file should hold the same {count:d} operators as the CSV export')
+def step_impl(context, count):
+    import pyarrow.parquet as pq
+    records = pq.read_table(context.export_path).to_pylist()
+    expected = list(csv.DictReader(io.StringIO(run_cli('--count', str(count), '--format', 'csv', '--seed', '1'))))
+    assert_that(records, has_length(count))
+    for record, row in zip(records, expected):
+        assert_that(record['name'], equal_to(row['name']))
+        assert_that(record['mnc'], equal_to(row['mnc']))
+        assert_that(str(record['is_mvno']), equal_to(row['is_mvno']))
+
+@when('I start the command-line exporter in a fresh process')
+def step_impl(context):
+    script = (
+        "import sys, io, contextlib\n"
+        "from telecomfaker import cli\n"
+        "sys.argv = ['telecomfaker', '--count', '3', '--format', 'ndjson']\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    cli.main()\n"
+        "print('pydantic' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    context.loaded_pydantic = result.stdout.strip()
+
+@then('it should not load the model validation library')
+def step_impl(context):
+    assert_that(context.loaded_pydantic, equal_to('False'))
+
+@given('a data file with the operator "{operator_name}"')
+def step_impl(context, operator_name):
+    context.data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    operators = [{"name": operator_name, "country": "España", "mcc": "214", "mnc": "07",
+                  "size": "large", "is_mvno": False}]
+    with open(context.data_file, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f, ensure_ascii=False)
+
+@when('I write {count:d} operators from it in "{output_format}" format with the default encoder')
+def step_impl(context, count, output_format):
+    faker = TelecomFaker(data_provider=LocalJsonProvider(context.data_file), seed=1)
+    out = io.StringIO()
+    faker.write_operators(out, count, output_format)
+    context.output_format = output_format
+    context.operators = faker.generate_operators(count)
+    context.export = out.getvalue()
+
+@then('the output should match the standard json module, with non-ASCII characters escaped')
+def step_impl(context):
+    dicts = [operator_to_dict(operator) for operator in context.operators]
+    for record in dicts:
+        record['size'] = record['size'].value
+    if context.output_format == 'json':
+        expected = json.dumps(dicts, indent=2)
+    else:
+        expected = ''.join(json.dumps(record) + '\n' for record in dicts)
+    assert_that(context.export, equal_to(expected))
+    assert_that(context.export.isascii(), equal_to(True))
+
+@when('I convert {count:d} generated operators and their records to dictionaries')
+def step_impl(context, count):
+    context.models = TelecomFaker(seed=1).generate_operators(count)
+    records = TelecomFaker(seed=1).generate_operators(count, record_type="record")
+    context.model_dicts = [operator_to_dict(operator) for operator in context.models]
+    context.record_dicts = [operator_to_dict(record) for record in records]
+
+@then("every dictionary should match the model's own fields")
+def step_impl(context):
+    expected = [dict(operator) for operator in context.models]
+    assert_that(context.model_dicts, equal_to(expected))
+    assert_that(context.record_dicts, equal_to(expected))
@@ -1,7 +1,13 @@
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
 from behave import given, when, then
 from telecomfaker import TelecomFaker
-from telecomfaker.providers import DataProvider
-from hamcrest import assert_that, is_not, none, contains_string, greater_than, has_length
+from telecomfaker.providers import DataProvider, LocalJsonProvider, ReloadingJsonProvider, SnapshotProvider
+from hamcrest import assert_that, is_not, none, contains_string, greater_than, has_length, equal_to, same_instance
 
 @given('I have installed the TelecomFaker package')
 def step_impl(context):
@@ -67,4 +73,333 @@ def step_impl(context):
 
 @then('the error should help me troubleshoot the data source issue')
 def step_impl(context):
-    assert_that(context.data['error'], contains_string('data source')) 
\ No newline at end of file
+    assert_that(context.data['error'], contains_string('data source')) 
+
+@when('I create {count:d} generators with the built-in data')
+def step_impl(context, count):
+    context.fakers = [TelecomFaker() for _ in range(count)]
+    for faker in context.fakers:
+        faker.generate_operator()
+
+@then('they should all share a single copy of the operator table')
+def step_impl(context):
+    first = context.fakers[0].data_provider.get_table()
+    for faker in context.fakers:
+        assert_that(faker.data_provider.get_table(), same_instance(first))
+
+@then("each generator's data should be a plain dictionary I can change and save as JSON")
+def step_impl(context):
+    first, second = (faker.data_provider.get_data() for faker in context.fakers[:2])
+    first['operators'].append({"name": "Extra Mobile"})
+    assert_that(json.loads(json.dumps(first)), equal_to(first))
+    assert_that(second['operators'], has_length(len(first['operators']) - 1))
+
+class CountryProvider(LocalJsonProvider):
+    """Built-in data narrowed down to one country by overriding get_data()."""
+
+    def __init__(self, country):
+        super().__init__()
+        self.country = country
+
+    def get_data(self):
+        data = super().get_data()
+        return {**data, 'operators': [op for op in data['operators'] if op['country'] == self.country]}
+
+@given('a data provider that keeps only the built-in operators from "{country}"')
+def step_impl(context, country):
+    context.custom_provider = CountryProvider(country)
+
+@given('a built-in data provider whose data I cut down to the operators from "{country}"')
+def step_impl(context, country):
+    provider = LocalJsonProvider()
+    data = provider.get_data()
+    data['operators'] = [op for op in data['operators'] if op['country'] == country]
+    context.custom_provider = provider
+
+@given('I have generated operators with that provider')
+def step_impl(context):
+    context.provider_faker = TelecomFaker(context.custom_provider)
+    context.provider_faker.generate_operators(10)
+
+@when('I cut its data down in place to the operators from "{country}" and invalidate its table')
+def step_impl(context, country):
+    provider = context.custom_provider
+    operators = provider.get_data()['operators']
+    operators[:] = [op for op in LocalJsonProvider().get_data()['operators'] if op['country'] == country]
+    provider.invalidate_table()
+
+@when('I generate {count:d} operators with that provider')
+def step_impl(context, count):
+    context.generated = TelecomFaker(context.custom_provider).generate_operators(count)
+
+@then('every generated operator should be from "{country}"')
+def step_impl(context, country):
+    assert_that({operator.country for operator in context.generated}, equal_to({country}))
+
+def write_data_file(path, operator_name):
+    operators = [{"name": operator_name, "country": "Testland", "mcc": "001", "mnc": "01",
+                  "size": "small", "is_mvno": False}]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f)
+
+@given('a custom data file listing the operator "{operator_name}"')
+def step_impl(context, operator_name):
+    context.data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    write_data_file(context.data_file, operator_name)
+
+@given('a generator using that data file')
+def step_impl(context):
+    context.faker = TelecomFaker(data_provider=LocalJsonProvider(context.data_file))
+    context.faker.generate_operator()
+
+@when('the data file is updated to list the operator "{operator_name}"')
+def step_impl(context, operator_name):
+    stat = os.stat(context.data_file)
+    write_data_file(context.data_file, operator_name)
+    # Make sure the change is visible even on filesystems with coarse timestamps
+    os.utime(context.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+@then('a new generator using that data file should produce "{operator_name}"')
+def step_impl(context, operator_name):
+    faker = TelecomFaker(data_provider=LocalJsonProvider(context.data_file))
+    assert_that(faker.generate_operator().name, equal_to(operator_name))
+
+@then('the existing generator should produce "{operator_name}" until I refresh its data')
+def step_impl(context, operator_name):
+    assert_that(context.faker.generate_operator().name, equal_to(operator_name))
+    context.faker.data_provider.invalidate()
+
+@then('after refreshing, the existing generator should produce "{operator_name}"')
+def step_impl(context, operator_name):
+    assert_that(context.faker.generate_operator().name, equal_to(operator_name))
+
+@given('a custom data file listing {count:d} operators')
+def step_impl(context, count):
+    sizes = ('small', 'medium', 'large')
+    context.data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    operators = [
+        {"name": f"Operator {index}", "country": f"Country {index % 50}", "mcc": str(200 + index // 1000),
+         "mnc": f"{index % 1000:03d}", "size": sizes[index % 3], "is_mvno": index % 4 == 0,
+         "weight": index % 7 + 1}
+        for index in range(count)
+    ]
+    with open(context.data_file, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f)
+
+@given('a snapshot of that data file in an older format')
+def step_impl(context):
+    snapshot_file = f"{context.data_file}.snapshot"
+    with open(snapshot_file, 'wb') as f:
+        f.write(b"TFSNAP\x00\x01" + struct.pack("<III", 2, 0, 0))
+    touch_later(snapshot_file)
+
+@when('I load that data through a compiled snapshot')
+def step_impl(context):
+    snapshot_file = f"{context.data_file}.snapshot"
+    context.faker = TelecomFaker(data_provider=SnapshotProvider(snapshot_file, source_path=context.data_file))
+
+@then('the snapshot should provide the same {count:d} operators as the data file')
+def step_impl(context, count):
+    with open(context.data_file, 'r', encoding='utf-8') as f:
+        expected = json.load(f)['operators']
+    operators = context.faker.data_provider.get_data()['operators']
+    assert_that(operators, has_length(count))
+    assert_that(operators, equal_to(expected))
+
+@then('I should be able to generate operators from the snapshot')
+def step_impl(context):
+    operator = context.faker.generate_operator()
+    assert_that(operator.name, contains_string('Operator'))
+
+def touch_later(path):
+    # Make sure a change is visible even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+@given('a generator watching that data file for changes')
+def step_impl(context):
+    context.reloads = []
+    context.reloaded = threading.Event()
+
+    def on_reload(changes):
+        context.reloads.append(changes)
+        context.reloaded.set()
+
+    provider = ReloadingJsonProvider(context.data_file, on_reload=on_reload)
+    provider.watch(interval=0.05)
+    context.add_cleanup(provider.stop)
+    context.faker = TelecomFaker(data_provider=provider)
+
+@when('operators are added, removed and changed in the data file while generation continues')
+def step_impl(context):
+    context.generation_errors = []
+    stop = threading.Event()
+
+    def generate():
+        faker = context.faker.spawn()
+        while not stop.is_set():
+            try:
+                assert_that(faker.generate_operators(100, record_type="record"), has_length(100))
+            except Exception as e:
+                context.generation_errors.append(e)
+
+    worker = threading.Thread(target=generate)
+    worker.start()
+    try:
+        with open(context.data_file, 'r', encoding='utf-8') as f:
+            operators = json.load(f)['operators']
+        context.removed = operators.pop(0)
+        operators[0] = {**operators[0], "name": "Renamed Mobile"}
+        context.changed = operators[0]
+        operators.append({"name": "Newcomer Mobile", "country": "Testland", "mcc": "999", "mnc": "99",
+                          "size": "large", "is_mvno": False})
+        with open(context.data_file, 'w', encoding='utf-8') as f:
+            json.dump({"operators": operators}, f)
+        touch_later(context.data_file)
+        assert context.reloaded.wait(10), "The data file was not reloaded"
+    finally:
+        stop.set()
+        worker.join()
+
+@then('the generator should report {added:d} added, {removed:d} removed and {changed:d} changed operator')
+def step_impl(context, added, removed, changed):
+    changes = context.reloads[-1]
+    assert_that(changes.added, has_length(added))
+    assert_that(changes.removed, has_length(removed))
+    assert_that(changes.changed, has_length(changed))
+
+@then('the generator should produce the new and changed operators')
+def step_impl(context):
+    assert_that(context.faker.lookup("999", "99").name, equal_to("Newcomer Mobile"))
+    assert_that(context.faker.lookup(context.changed["mcc"], context.changed["mnc"]).name, equal_to("Renamed Mobile"))
+    names = {operator.name for operator in context.faker.data_provider.get_table().records}
+    assert_that(context.removed["name"] in names, equal_to(False))
+
+@then('generation should never have been interrupted by the reload')
+def step_impl(context):
+    assert_that(context.generation_errors, equal_to([]))
+
+@given('a generator reloading that data file')
+def step_impl(context):
+    context.faker = TelecomFaker(data_provider=ReloadingJsonProvider(context.data_file))
+
+def rename_operator(path, index, name):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['operators'][index]['name'] = name
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    touch_later(path)
+
+@when('an operator is renamed in the data file but applying the change fails once')
+def step_impl(context):
+    provider = context.faker.data_provider
+    context.loaded_keys = list(provider._keys)
+    context.loaded_table = provider.get_table()
+    rename_operator(context.data_file, 5, "Renamed Operator")
+
+    def fail_once(*args):
+        del provider._apply
+        raise RuntimeError("Simulated failure while applying a reload")
+
+    provider._apply = fail_once
+    try:
+        provider.refresh()
+        raise AssertionError("The simulated failure should have been raised")
+    except RuntimeError:
+        pass
+
+@then('the generator should still use the operators it loaded before')
+def step_impl(context):
+    provider = context.faker.data_provider
+    assert_that(provider.get_table(), same_instance(context.loaded_table))
+    assert_that(provider._keys, equal_to(context.loaded_keys))
+    assert_that(provider.last_error, is_not(none()))
+
+@then('refreshing the data again should apply the renamed operator')
+def step_impl(context):
+    provider = context.faker.data_provider
+    changes = provider.refresh()
+    assert_that(changes.changed, has_length(1))
+    assert_that(provider.get_table().records[5].name, equal_to("Renamed Operator"))
+    assert_that(provider.last_error, none())
+
+@when('operators are drawn by country and operator type while the data file is reloaded {count:d} times')
+def step_impl(context, count):
+    context.generation_errors = []
+    stop = threading.Event()
+
+    def generate():
+        faker = context.faker.spawn()
+        index = 0
+        while not stop.is_set():
+            index += 1
+            try:
+                faker.generate_operators(5, country=f"Country {index % 50}", is_mvno=index % 2 == 0)
+            except Exception as e:
+                context.generation_errors.append(e)
+
+    thread = threading.Thread(target=generate)
+    thread.start()
+    try:
+        for index in range(count):
+            rename_operator(context.data_file, index, f"Renamed {index}")
+            context.faker.data_provider.refresh()
+    except Exception as e:
+        context.generation_errors.append(e)
+    finally:
+        stop.set()
+        thread.join()
+
+@then('no draw or reload should have failed')
+def step_impl(context):
+    assert_that(context.generation_errors, equal_to([]))
+
+@when('the data file is overwritten with invalid JSON')
+def step_impl(context):
+    with open(context.data_file, 'w', encoding='utf-8') as f:
+        f.write('{"operators": [')
+    touch_later(context.data_file)
+
+@then('refreshing the data should report the invalid file')
+def step_impl(context):
+    try:
+        context.faker.data_provider.refresh()
+        raise AssertionError("Refreshing an invalid data file should fail")
+    except ValueError as e:
+        assert_that(str(e), contains_string("Invalid JSON"))
+
+@then('the watcher should still report the invalid file after several checks')
+def step_impl(context):
+    provider = context.faker.data_provider
+    # The watcher checks every 0.05 seconds
+    time.sleep(0.5)
+    assert_that(provider.last_error, is_not(none()))
+    assert_that(str(provider.last_error), contains_string("Invalid JSON"))
+
+@then('the watcher should stop reporting an error once it has reloaded the file')
+def step_impl(context):
+    assert context.reloaded.wait(5), "The watcher did not reload the fixed file"
+    assert_that(context.faker.data_provider.last_error, none())
+
+@then('the generator should still produce "{operator_name}"')
+def step_impl(context, operator_name):
+    assert_that(context.faker.generate_operator().name, equal_to(operator_name))
+
+@given('a custom data file where "{operator_name}" has "is_mvno" set to {is_mvno:d} and "size" set to "{size}"')
+def step_impl(context, operator_name, is_mvno, size):
+    context.data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    operators = [{"name": operator_name, "country": "Testland", "mcc": "001", "mnc": "01",
+                  "size": size, "is_mvno": is_mvno}]
+    with open(context.data_file, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f)
+
+@when('I generate an operator from that data file')
+def step_impl(context):
+    context.operator = TelecomFaker(data_provider=LocalJsonProvider(context.data_file)).generate_operator()
+
+@then('the operator should be "{operator_name}", a large MVNO')
+def step_impl(context, operator_name):
+    assert_that(context.operator.name, equal_to(operator_name))
+    assert_that(context.operator.size.value, equal_to('large'))
+    assert_that(context.operator.is_mvno, equal_to(True))
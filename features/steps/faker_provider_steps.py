@@ -0,0 +1,79 @@
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, has_length, is_not, none
+from telecomfaker import TelecomFaker
+
+@given('a faker.Faker instance with the telecom provider')
+def step_impl(context):
+    try:
+        from faker import Faker
+        from telecomfaker.faker_provider import TelecomProvider
+    except ImportError:
+        context.scenario.skip("faker is not installed")
+        return
+    context.fake = Faker()
+    context.fake.add_provider(TelecomProvider)
+    context.faker = TelecomFaker()
+
+@when('I ask faker for an operator, an MCC and an IMSI')
+def step_impl(context):
+    context.operator = context.fake.telecom_operator()
+    context.mcc = context.fake.mcc()
+    context.imsi = context.fake.imsi()
+
+@then('the operator should be a known operator')
+def step_impl(context):
+    assert_that(context.faker.lookup(context.operator.mcc, context.operator.mnc, record_type="record"),
+                equal_to(context.operator))
+
+@then('the MCC should belong to a known operator')
+def step_impl(context):
+    assert_that(context.faker.generate_operator(mcc=context.mcc), is_not(none()))
+
+@then("the IMSI should have 15 digits and start with a known operator's MCC and MNC")
+def step_impl(context):
+    assert_that(context.imsi, has_length(15))
+    assert context.imsi.isdigit(), context.imsi
+    assert_that(context.faker.lookup_imsi(context.imsi), is_not(none()))
+
+@when('I ask faker for {count:d} IMSIs twice after seeding it with {seed:d}')
+def step_impl(context, count, seed):
+    context.runs = []
+    for _ in range(2):
+        context.fake.seed_instance(seed)
+        context.runs.append([context.fake.imsi() for _ in range(count)])
+
+@then('both runs should give the same IMSIs')
+def step_impl(context):
+    first, second = context.runs
+    assert_that(first, equal_to(second))
+
+@when('I ask faker for {count:d} IMSIs with MCC "{mcc}"')
+def step_impl(context, count, mcc):
+    context.imsis = [context.fake.imsi(mcc=mcc) for _ in range(count)]
+
+@then('every IMSI should start with "{prefix}"')
+def step_impl(context, prefix):
+    for imsi in context.imsis:
+        assert imsi.startswith(prefix), imsi
+
+@then('an operator from faker for "{country}" should be based in "{expected}"')
+def step_impl(context, country, expected):
+    assert_that(context.fake.telecom_operator(country=country).country, equal_to(expected))
+
+@when("I ask faker's unique proxy for {count:d} operators")
+def step_impl(context, count):
+    context.operators = [context.fake.unique.telecom_operator() for _ in range(count)]
+
+@then('all {count:d} operators should be different')
+def step_impl(context, count):
+    assert_that(set(context.operators), has_length(count))
+
+@when('I ask faker for {count:d} IMSIs in one call')
+def step_impl(context, count):
+    context.imsis = context.fake.imsis(count)
+
+@then('I should receive {count:d} IMSIs with 15 digits each')
+def step_impl(context, count):
+    assert_that(context.imsis, has_length(count))
+    for imsi in context.imsis:
+        assert_that(imsi, has_length(15))
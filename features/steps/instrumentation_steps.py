@@ -0,0 +1,61 @@
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, greater_than, has_items, has_length, is_not, none, contains_string
+from telecomfaker import TelecomFaker
+from telecomfaker.instrumentation import GenerationStats
+from telecomfaker.records import operator_to_dict
+
+@given('a TelecomFaker with stats enabled')
+def step_impl(context):
+    context.stats = GenerationStats()
+    context.faker = TelecomFaker(stats=context.stats)
+
+@given('a TelecomFaker with stats enabled and a metrics callback')
+def step_impl(context):
+    context.timings = []
+    context.stats = GenerationStats(callbacks=[lambda stage, seconds, rows: context.timings.append((stage, rows))])
+    context.faker = TelecomFaker(stats=context.stats)
+
+@when('I generate {batches:d} batches of {count:d} operators')
+def step_impl(context, batches, count):
+    for _ in range(batches):
+        context.faker.generate_operators(count)
+
+@then('the stats should show timings for the load, sample and build stages')
+def step_impl(context):
+    context.snapshot = context.stats.snapshot()
+    stages = context.snapshot['stages']
+    assert_that(list(stages), has_items('load', 'sample', 'build'))
+    for stage in ('load', 'sample', 'build'):
+        assert_that(stages[stage]['count'], greater_than(0))
+        assert_that(sum(stages[stage]['buckets'].values()), equal_to(stages[stage]['count']))
+
+@then('the stats should count {sampled:d} sampled and {built:d} built rows')
+def step_impl(context, sampled, built):
+    assert_that(context.snapshot['stages']['sample']['rows'], equal_to(sampled))
+    assert_that(context.snapshot['stages']['build']['rows'], equal_to(built))
+
+@then('the stats should report rows per second and peak memory')
+def step_impl(context):
+    assert_that(context.snapshot['rows_per_sec'], greater_than(0))
+    assert_that(context.snapshot['peak_rss'], is_not(none()))
+
+@then('the callback should have received {calls:d} sample timings of {rows:d} rows each')
+def step_impl(context, calls, rows):
+    samples = [timing for timing in context.timings if timing[0] == 'sample']
+    assert_that(samples, equal_to([('sample', rows)] * calls))
+
+@when('I generate {count:d} operators with seed {seed:d} with and without stats')
+def step_impl(context, count, seed):
+    context.faker.set_seed(seed)
+    context.with_stats = [operator_to_dict(op) for op in context.faker.generate_operators(count)]
+    context.without_stats = [operator_to_dict(op) for op in TelecomFaker(seed=seed).generate_operators(count)]
+
+@then('both runs should contain identical operators')
+def step_impl(context):
+    assert_that(context.with_stats, has_length(len(context.without_stats)))
+    assert_that(context.with_stats, equal_to(context.without_stats))
+
+@then('the command should report timings for the sample and serialize stages and the rows per second')
+def step_impl(context):
+    for text in ('sample', 'serialize', 'rows/sec', 'peak RSS'):
+        assert_that(context.stderr, contains_string(text))
@@ -0,0 +1,36 @@
+from behave import when, then
+from hamcrest import assert_that, equal_to, has_length, is_not, none, contains_string
+
+@when('I ask for {count:d} operators from "{country}"')
+def step_impl(context, count, country):
+    context.operators = context.faker.generate_operators(count, country=country)
+    assert_that(context.operators, has_length(count))
+
+@then('every operator should be based in "{country}"')
+def step_impl(context, country):
+    for operator in context.operators:
+        assert_that(operator.country, equal_to(country))
+
+@when('I ask for {count:d} large network operators')
+def step_impl(context, count):
+    context.operators = context.faker.generate_operators(count, size='large', is_mvno=False)
+    assert_that(context.operators, has_length(count))
+
+@then('every operator should be a large network operator')
+def step_impl(context):
+    for operator in context.operators:
+        assert_that(operator.size.value, equal_to('large'))
+        assert_that(operator.is_mvno, equal_to(False))
+
+@when('I ask for an operator from "{country}"')
+def step_impl(context, country):
+    context.error = None
+    try:
+        context.faker.generate_operator(country=country)
+    except ValueError as e:
+        context.error = str(e)
+
+@then('I should be told that no operators match my filters')
+def step_impl(context):
+    assert_that(context.error, is_not(none()))
+    assert_that(context.error, contains_string('No operators match'))
@@ -1,6 +1,7 @@
 from behave import given, when, then
 from telecomfaker import TelecomFaker
 from telecomfaker.models import TelecomOperator
+from telecomfaker.records import operator_to_dict
 from hamcrest import assert_that, equal_to, has_property, is_not, none, contains_string, instance_of
 
 @given('I have access to the TelecomFaker library')
@@ -108,3 +109,71 @@ def step_impl(context):
     
     # This demonstrates that the seed provides consistent results
     # across different instances, which is essential for automated testing
+
+@given('two generators seeded with different values')
+def step_impl(context):
+    context.first_generator = TelecomFaker(seed=1)
+    context.second_generator = TelecomFaker(seed=2)
+    # What the first generator produces when nothing else interferes
+    context.expected_sequence = [op.dict() for op in TelecomFaker(seed=1).generate_operators(20)]
+
+@when('I reseed only the second generator while the first is in use')
+def step_impl(context):
+    context.actual_sequence = []
+    for _ in range(20):
+        context.second_generator.set_seed(99)
+        context.second_generator.generate_operator()
+        context.actual_sequence.append(context.first_generator.generate_operators(1)[0].dict())
+
+@then('the first generator should continue its own sequence undisturbed')
+def step_impl(context):
+    assert_that(context.actual_sequence, equal_to(context.expected_sequence))
+
+@given('a generator seeded with {seed:d}')
+def step_impl(context, seed):
+    context.seed_value = seed
+    context.parent_generator = TelecomFaker(seed=seed)
+
+@when('I derive {count:d} child generators from it')
+def step_impl(context, count):
+    context.child_count = count
+    children = [context.parent_generator.spawn() for _ in range(count)]
+    context.child_sequences = [[op.dict() for op in child.generate_operators(50)] for child in children]
+
+@then('each child should produce a different operator sequence')
+def step_impl(context):
+    for index, sequence in enumerate(context.child_sequences):
+        for other in context.child_sequences[index + 1:]:
+            assert_that(sequence, is_not(equal_to(other)))
+
+@then('deriving them again from the same seed should reproduce every sequence')
+def step_impl(context):
+    parent = TelecomFaker(seed=context.seed_value)
+    children = [parent.spawn() for _ in range(context.child_count)]
+    sequences = [[op.dict() for op in child.generate_operators(50)] for child in children]
+    assert_that(sequences, equal_to(context.child_sequences))
+
+@given('a {mode} generator seeded with {seed:d}')
+def step_impl(context, mode, seed):
+    context.seed_value = seed
+    context.weighted = mode == "weighted"
+
+@when('I draw {count:d} operators one at a time and {batch:d} in one batch from the same seed')
+def step_impl(context, count, batch):
+    single = TelecomFaker(seed=context.seed_value, weighted=context.weighted)
+    context.single_draws = [operator_to_dict(single.generate_operator()) for _ in range(count)]
+    batched = TelecomFaker(seed=context.seed_value, weighted=context.weighted)
+    context.batch_draws = [operator_to_dict(op) for op in batched.generate_operators(batch)]
+
+@then('both draws should return the same operators in the same order')
+def step_impl(context):
+    assert_that(context.single_draws, equal_to(context.batch_draws))
+
+@when('I draw {count:d} operators from it')
+def step_impl(context, count):
+    faker = TelecomFaker(seed=context.seed_value, weighted=context.weighted)
+    context.drawn_names = [op.name for op in faker.generate_operators(count)]
+
+@then('I should get "{names}" in that order')
+def step_impl(context, names):
+    assert_that(context.drawn_names, equal_to(names.split(", ")))
@@ -0,0 +1,29 @@
+from behave import when, then
+from hamcrest import assert_that, equal_to, is_not, none
+
+@when('I look up the operator for MCC "{mcc}" and MNC "{mnc}"')
+def step_impl(context, mcc, mnc):
+    context.found = context.faker.lookup(mcc, mnc)
+
+@when('I look up the operator for IMSI "{imsi}"')
+def step_impl(context, imsi):
+    context.found = context.faker.lookup_imsi(imsi)
+
+@then('I should get the operator "{name}"')
+def step_impl(context, name):
+    assert_that(context.found, is_not(none()))
+    assert_that(context.found.name, equal_to(name))
+
+@then('I should be told that no operator was found')
+def step_impl(context):
+    assert_that(context.found, none())
+
+@when('I look up the operators for these IMSIs:')
+def step_impl(context):
+    context.found = context.faker.lookup_imsis(row['imsi'] for row in context.table)
+
+@then('I should get the operators "{names}" in that order')
+def step_impl(context, names):
+    expected = [name.strip() for name in names.split(',')]
+    actual = ['none' if operator is None else operator.name for operator in context.found]
+    assert_that(actual, equal_to(expected))
@@ -0,0 +1,89 @@
+import gzip
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from behave import when, then
+from hamcrest import assert_that, equal_to, has_length, is_in
+from telecomfaker import TelecomFaker
+from telecomfaker.sinks import SqliteSink
+
+def run_cli(*args):
+    result = subprocess.run(
+        [sys.executable, '-m', 'telecomfaker.cli', *args],
+        capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+def read_database(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT name, country, mcc, mnc, size, is_mvno FROM operators").fetchall()
+    finally:
+        connection.close()
+
+@when('I write {count:d} operators with seed {seed:d} into a SQLite database in batches of {batch_size:d}')
+def step_impl(context, count, seed, batch_size):
+    context.database = os.path.join(tempfile.mkdtemp(), 'operators.db')
+    written = context.faker.write_to(SqliteSink(context.database, batch_size=batch_size), count, seed=seed)
+    assert_that(written, equal_to(count))
+
+@then('the database table should hold the same {count:d} operators as the generator with seed {seed:d}')
+def step_impl(context, count, seed):
+    rows = read_database(context.database)
+    expected = [(op.name, op.country, op.mcc, op.mnc, op.size.value, int(op.is_mvno))
+                for op in TelecomFaker().iter_operators_parallel(count, seed=seed, record_type="record")]
+    assert_that(rows, has_length(count))
+    assert_that(rows, equal_to(expected))
+
+@when('I export {count:d} operators to a SQLite database from the command line')
+def step_impl(context, count):
+    context.database = os.path.join(tempfile.mkdtemp(), 'operators.db')
+    run_cli('--count', str(count), '--format', 'sqlite', '--output', context.database, '--seed', '1')
+
+@then('the database table should hold {count:d} operators')
+def step_impl(context, count):
+    assert_that(read_database(context.database), has_length(count))
+
+@then('the export should contain {count:d} tab-separated rows with t or f in the last column')
+def step_impl(context, count):
+    lines = context.export.splitlines()
+    assert_that(lines, has_length(count))
+    for line in lines:
+        fields = line.split('\t')
+        assert_that(fields, has_length(6))
+        assert_that(fields[-1], is_in(('t', 'f')))
+
+@when('I export {count:d} operators in "{output_format}" format to a "{suffix}" file')
+def step_impl(context, count, output_format, suffix):
+    context.export_path = os.path.join(tempfile.mkdtemp(), f'operators.{output_format}{suffix}')
+    context.export_args = ('--count', str(count), '--format', output_format, '--seed', '1')
+    run_cli(*context.export_args, '--output', context.export_path)
+
+def decompress(path):
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+    import zstandard
+    with open(path, 'rb') as f:
+        return zstandard.ZstdDecompressor().stream_reader(f).read().decode('utf-8')
+
+@then('the file should decompress to the same export as without compression')
+def step_impl(context):
+    if context.export_path.endswith('.zst'):
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            context.scenario.skip("zstandard is not installed")
+            return
+    assert_that(decompress(context.export_path), equal_to(run_cli(*context.export_args)))
+
+@when('I export {count:d} operators in "{output_format}" format with batch size {batch_size:d} and without double buffering')
+def step_impl(context, count, output_format, batch_size):
+    context.export = run_cli('--count', str(count), '--format', output_format, '--seed', '1',
+                             '--batch-size', str(batch_size), '--no-double-buffer')
+
+@then('the export should be identical to the default export of {count:d} operators in "{output_format}" format')
+def step_impl(context, count, output_format):
+    assert_that(context.export, equal_to(run_cli('--count', str(count), '--format', output_format, '--seed', '1')))
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from collections import Counter
+
+from behave import when, then
+from hamcrest import assert_that, equal_to, is_not, close_to, contains_string
+from telecomfaker import TelecomFaker
+
+@when('I get row {index:d} of the sequence with seed {seed:d}')
+def step_impl(context, index, seed):
+    context.operator = context.faker.operator_at(seed, index)
+
+@then('it should be the same operator as row {index:d} of a range with seed {seed:d}')
+def step_impl(context, index, seed):
+    operators = context.faker.operators_range(seed, index - 1, index + 2)
+    assert_that(context.operator, equal_to(operators[1]))
+
+@when('I generate rows {start:d} to {stop:d} of the sequence with seed {seed:d}')
+def step_impl(context, start, stop, seed):
+    context.operators = context.faker.operators_range(seed, start, stop, record_type="record")
+
+@when('I generate rows {start:d} to {stop:d} of the sequence with seed {seed:d} for country "{country}"')
+def step_impl(context, start, stop, seed, country):
+    context.operators = context.faker.operators_range(seed, start, stop, country=country)
+
+@when('I generate rows {start:d} to {stop:d} of the weighted sequence with seed {seed:d}')
+def step_impl(context, start, stop, seed):
+    faker = TelecomFaker(weighted=True)
+    context.operators = faker.operators_range(seed, start, stop, record_type="record")
+
+@then('it should equal rows {start:d} to {middle:d} followed by rows {middle:d} to {stop:d} with seed {seed:d}')
+def step_impl(context, start, middle, stop, seed):
+    # A fresh generator, generating the later slice first, so nothing carries over between calls
+    faker = TelecomFaker()
+    tail = faker.operators_range(seed, middle, stop, record_type="record")
+    head = faker.operators_range(seed, start, middle, record_type="record")
+    assert_that(head + tail, equal_to(context.operators))
+
+@then('a separate Python process should generate the same rows {start:d} to {stop:d} with seed {seed:d}')
+def step_impl(context, start, stop, seed):
+    script = ("from telecomfaker import TelecomFaker\n"
+              f"for operator in TelecomFaker().operators_range({seed}, {start}, {stop}, record_type='record'):\n"
+              "    print(operator.mcc, operator.mnc)\n")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    expected = "".join(f"{operator.mcc} {operator.mnc}\n" for operator in context.operators)
+    assert_that(result.stdout, equal_to(expected))
+
+@then('it should differ from rows {start:d} to {stop:d} with seed {seed:d}')
+def step_impl(context, start, stop, seed):
+    assert_that(context.faker.operators_range(seed, start, stop, record_type="record"),
+                is_not(equal_to(context.operators)))
+
+@then('every operator should appear about equally often')
+def step_impl(context):
+    table = context.faker.data_provider.get_table()
+    counts = Counter(context.operators)
+    expected = len(context.operators) / len(table.records)
+    assert_that(len(counts), equal_to(len(table.records)))
+    for count in counts.values():
+        assert_that(count, close_to(expected, expected * 0.3))
+
+@when('I try to get row {index:d} of the sequence with seed {seed:d}')
+def step_impl(context, index, seed):
+    context.error = None
+    try:
+        context.faker.operator_at(seed, index)
+    except ValueError as e:
+        context.error = str(e)
+
+@then('I should be told that rows start at 0')
+def step_impl(context):
+    assert_that(context.error, contains_string('must not be negative'))
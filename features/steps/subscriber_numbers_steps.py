@@ -0,0 +1,98 @@
+from behave import given, when, then
+from hamcrest import assert_that, contains_string, equal_to, has_length, is_not, none
+from telecomfaker import TelecomFaker
+from telecomfaker.numbering import luhn_check_digit
+
+@given('the operator with MCC "{mcc}" and MNC "{mnc}"')
+def step_impl(context, mcc, mnc):
+    context.operator = context.faker.lookup(mcc, mnc)
+    assert_that(context.operator, is_not(none()))
+
+@when('I generate {count:d} subscriber identities for that operator')
+def step_impl(context, count):
+    context.identities = context.faker.numbering(context.operator).identities(count)
+    assert_that(context.identities, has_length(count))
+
+@then('every IMSI should have 15 digits and start with "{prefix}"')
+def step_impl(context, prefix):
+    for identity in context.identities:
+        assert_that(len(identity.imsi), equal_to(15))
+        assert identity.imsi.isdigit() and identity.imsi.startswith(prefix), identity.imsi
+
+@then('every MSISDN should start with the country calling code "{code}"')
+def step_impl(context, code):
+    for identity in context.identities:
+        assert identity.msisdn.isdigit() and identity.msisdn.startswith(code), identity.msisdn
+
+@then('every ICCID should have 19 digits and a valid Luhn check digit')
+def step_impl(context):
+    for identity in context.identities:
+        assert_that(len(identity.iccid), equal_to(19))
+        assert_that(int(identity.iccid[-1]), equal_to(luhn_check_digit(identity.iccid[:-1])))
+
+@then('no IMSI, MSISDN or ICCID should appear twice')
+def step_impl(context):
+    for field in ('imsi', 'msisdn', 'iccid'):
+        numbers = {getattr(identity, field) for identity in context.identities}
+        assert_that(numbers, has_length(len(context.identities)))
+
+@when('I generate {batches:d} batches of {count:d} IMSIs from the same number generator')
+def step_impl(context, batches, count):
+    numbers = context.faker.numbering(context.operator)
+    context.batches = [numbers.imsis(count) for _ in range(batches)]
+
+@then('no IMSI should appear in more than one batch')
+def step_impl(context):
+    all_imsis = [imsi for batch in context.batches for imsi in batch]
+    assert_that(set(all_imsis), has_length(len(all_imsis)))
+
+@when('I generate {count:d} subscriber identities for that operator twice with seed {seed:d}')
+def step_impl(context, count, seed):
+    context.runs = [
+        TelecomFaker(seed=seed).numbering(context.operator).identities(count)
+        for _ in range(2)
+    ]
+
+@then('both runs should contain identical subscriber identities')
+def step_impl(context):
+    first, second = context.runs
+    assert_that(second, equal_to(first))
+
+@given('a number generator with seed {seed:d} and the calling code "{calling_code}", which leaves room for {count:d} ICCIDs')
+def step_impl(context, seed, calling_code, count):
+    context.seed_value = seed
+    context.calling_code = calling_code
+    context.numbering = TelecomFaker(seed=seed).numbering(context.operator, calling_code=calling_code)
+
+@when('I generate {count:d} subscriber identities and then ask for {more:d} more')
+def step_impl(context, count, more):
+    context.identities = context.numbering.identities(count)
+    context.error = None
+    try:
+        context.numbering.identities(more)
+    except ValueError as e:
+        context.error = str(e)
+
+@then('the second request should be refused because the ICCID range is exhausted')
+def step_impl(context):
+    assert_that(context.error, is_not(none()))
+    assert_that(context.error, contains_string('iccid range'))
+
+@then('the next {count:d} identities should match those of an uninterrupted generator with seed {seed:d}')
+def step_impl(context, count, seed):
+    uninterrupted = TelecomFaker(seed=seed).numbering(context.operator, calling_code=context.calling_code)
+    expected = uninterrupted.identities(len(context.identities) + count)
+    assert_that(context.identities + context.numbering.identities(count), equal_to(expected))
+
+@when('I create a number generator with the calling code "{calling_code}"')
+def step_impl(context, calling_code):
+    context.error = None
+    try:
+        context.faker.numbering(context.operator, calling_code=calling_code)
+    except ValueError as e:
+        context.error = str(e)
+
+@then('I should be told that the calling code must be digits')
+def step_impl(context):
+    assert_that(context.error, is_not(none()))
+    assert_that(context.error, contains_string('must be digits'))
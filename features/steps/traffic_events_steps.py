@@ -0,0 +1,149 @@
+import csv
+import io
+import subprocess
+import sys
+from behave import when, then
+from hamcrest import assert_that, equal_to, has_length, close_to, is_not, none, less_than_or_equal_to, contains_string
+from telecomfaker import TelecomFaker
+from telecomfaker.traffic import EVENT_FIELDS, TrafficProfile
+
+START = 1700000000.0
+
+@when('I generate {count:d} traffic events at {rate:d} events per second')
+def step_impl(context, count, rate):
+    context.events = context.faker.traffic(rate=rate, start=START).batch(count)
+
+@when('I generate {count:d} traffic events with a roaming rate of {roaming_rate:f}')
+def step_impl(context, count, roaming_rate):
+    traffic = context.faker.traffic(profile=TrafficProfile(roaming_rate=roaming_rate), start=START)
+    context.events = traffic.batch(count)
+
+@when('I generate {count:d} traffic events with the mix "{mix}"')
+def step_impl(context, count, mix):
+    shares = {name: float(share) for name, share in (item.split('=') for item in mix.split(','))}
+    context.events = context.faker.traffic(profile=TrafficProfile(mix=shares), start=START).batch(count)
+
+@then('the events should be in timestamp order and span about {seconds:d} seconds')
+def step_impl(context, seconds):
+    stamps = [event.timestamp for event in context.events]
+    assert_that(stamps, equal_to(sorted(stamps)))
+    assert_that(stamps[-1] - START, close_to(seconds, seconds * 0.05))
+
+@then('every event should belong to a subscriber of a known home operator')
+def step_impl(context):
+    for event in context.events:
+        assert_that(context.faker.lookup(event.home_mcc, event.home_mnc), is_not(none()))
+        assert event.imsi.startswith(event.home_mcc + event.home_mnc), event
+
+@then('the events should include voice calls, SMS and data sessions')
+def step_impl(context):
+    assert_that({event.event_type for event in context.events}, equal_to({'voice', 'sms', 'data'}))
+
+@then('every roaming event should be on an operator with a different MCC than the home operator')
+def step_impl(context):
+    for event in context.events:
+        if event.roaming:
+            assert event.visited_mcc != event.home_mcc, event
+            assert_that(context.faker.lookup(event.visited_mcc, event.visited_mnc), is_not(none()))
+
+@then("every other event should be on the home operator's network")
+def step_impl(context):
+    for event in context.events:
+        if not event.roaming:
+            assert_that((event.visited_mcc, event.visited_mnc), equal_to((event.home_mcc, event.home_mnc)))
+
+@then('about {percent:d} percent of the events should be roaming')
+def step_impl(context, percent):
+    share = sum(event.roaming for event in context.events) / len(context.events)
+    assert_that(share, close_to(percent / 100, 0.02))
+
+@then('every event should be an SMS without duration or volume')
+def step_impl(context):
+    for event in context.events:
+        assert_that((event.event_type, event.duration, event.volume), equal_to(('sms', 0, 0)))
+
+@when('I stream {count:d} traffic events in batches of {batch_size:d}')
+def step_impl(context, count, batch_size):
+    context.batches = [len(batch) for batch in context.faker.traffic().stream(count, batch_size)]
+
+@then('I should receive {batches:d} batches of at most {size:d} events each')
+def step_impl(context, batches, size):
+    assert_that(context.batches, has_length(batches))
+    assert_that(max(context.batches), less_than_or_equal_to(size))
+
+@when('I replay {count:d} traffic events at {rate:d} events per second')
+def step_impl(context, count, rate):
+    # A simulated clock, so the scenario does not have to wait in real time
+    context.now = 0.0
+    context.sleeps = []
+    def sleep(seconds):
+        context.sleeps.append(seconds)
+        context.now += seconds
+    traffic = context.faker.traffic(rate=rate, start=START)
+    batches = list(traffic.replay(count, batch_size=500, clock=lambda: context.now, sleep=sleep))
+    context.span = batches[-1][-1].timestamp - START
+
+@then('the replay should wait about {seconds:d} seconds in total before handing out the last batch')
+def step_impl(context, seconds):
+    assert_that(sum(context.sleeps), close_to(context.span, 1e-6))
+    assert_that(sum(context.sleeps), close_to(seconds, seconds * 0.1))
+
+@when('I generate {count:d} traffic events twice with seed {seed:d}')
+def step_impl(context, count, seed):
+    context.runs = [TelecomFaker(seed=seed).traffic(start=START).batch(count) for _ in range(2)]
+
+@then('both traffic runs should contain identical events')
+def step_impl(context):
+    assert_that(context.runs[0], equal_to(context.runs[1]))
+
+@when('I run the traffic command for {count:d} events in "{output_format}" format')
+def step_impl(context, count, output_format):
+    result = subprocess.run(
+        [sys.executable, '-m', 'telecomfaker.cli', 'traffic', '--count', str(count), '--format', output_format,
+         '--seed', '1'],
+        capture_output=True, text=True, check=True
+    )
+    context.output = result.stdout
+
+@then('the output should be a CSV table with a header and {count:d} traffic events')
+def step_impl(context, count):
+    rows = list(csv.DictReader(io.StringIO(context.output)))
+    assert_that(rows, has_length(count))
+    assert_that(tuple(rows[0]), equal_to(EVENT_FIELDS))
+
+@when('I create a traffic profile with {setting} set to {value:g}')
+def step_impl(context, setting, value):
+    context.error = None
+    try:
+        TrafficProfile(**{setting: value})
+    except ValueError as e:
+        context.error = str(e)
+
+@then('I should be told that the {setting} is invalid')
+def step_impl(context, setting):
+    assert_that(context.error, is_not(none()))
+    assert_that(context.error.lower(), contains_string(setting.replace('_', ' ')))
+
+@when('I generate {count:d} traffic events with calls of {call:d} seconds and data sessions of {session:d} seconds on average')
+def step_impl(context, count, call, session):
+    profile = TrafficProfile(mix={"voice": 1, "data": 1}, mean_call_duration=call, mean_session_duration=session)
+    context.events = context.faker.traffic(profile=profile, start=START).batch(count)
+
+@then('voice calls should last about {call:d} seconds and data sessions about {session:d} seconds on average')
+def step_impl(context, call, session):
+    for event_type, mean in (('voice', call), ('data', session)):
+        durations = [event.duration for event in context.events if event.event_type == event_type]
+        assert_that(sum(durations) / len(durations), close_to(mean, mean * 0.1))
+
+@when('I run the traffic command with "{option}" set to "{value}"')
+def step_impl(context, option, value):
+    context.result = subprocess.run(
+        [sys.executable, '-m', 'telecomfaker.cli', 'traffic', '--count', '10', f'{option}={value}'],
+        capture_output=True, text=True
+    )
+
+@then('the command should be rejected with "{message}" and no traceback')
+def step_impl(context, message):
+    assert_that(context.result.returncode, equal_to(2))
+    assert_that(context.result.stderr, contains_string(message))
+    assert_that(context.result.stderr, is_not(contains_string('Traceback')))
@@ -0,0 +1,48 @@
+from behave import when, then
+from hamcrest import assert_that, equal_to, has_length, contains_inanyorder, contains_string
+from telecomfaker import TelecomFaker
+
+def built_in_names(context):
+    return [record.name for record in context.faker.data_provider.get_table().records]
+
+@when('I sample {count:d} unique operators')
+def step_impl(context, count):
+    try:
+        context.operators = context.faker.sample_operators(count)
+    except ValueError as e:
+        context.error = e
+
+@when('I sample {count:d} unique operators from "{country}"')
+def step_impl(context, count, country):
+    context.operators = context.faker.sample_operators(count, country=country)
+
+@then('no operator should appear twice')
+def step_impl(context):
+    names = [operator.name for operator in context.operators]
+    assert_that(set(names), has_length(len(names)))
+
+@then('every built-in operator should be included')
+def step_impl(context):
+    names = [operator.name for operator in context.operators]
+    assert_that(names, contains_inanyorder(*built_in_names(context)))
+
+@then('I should get "{first}" and "{second}" in some order')
+def step_impl(context, first, second):
+    assert_that([operator.name for operator in context.operators], contains_inanyorder(first, second))
+
+@then('I should be told that only {count:d} operators match')
+def step_impl(context, count):
+    assert_that(str(context.error), contains_string(f"only {count} operators match"))
+
+@when('I iterate over the operators in shuffled order with seed {seed:d}')
+def step_impl(context, seed):
+    context.operators = list(TelecomFaker(seed=seed).iter_shuffled(record_type="record"))
+
+@then('every built-in operator should be included exactly once')
+def step_impl(context):
+    assert_that([operator.name for operator in context.operators], contains_inanyorder(*built_in_names(context)))
+
+@then('the order should be the same when I shuffle again with seed {seed:d}')
+def step_impl(context, seed):
+    again = list(TelecomFaker(seed=seed).iter_shuffled(record_type="record"))
+    assert_that(again, equal_to(context.operators))
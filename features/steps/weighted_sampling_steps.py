@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+from collections import Counter
+
+from behave import given, when, then
+from hamcrest import assert_that, equal_to, close_to, greater_than
+from telecomfaker import TelecomFaker
+from telecomfaker.providers import LocalJsonProvider
+
+@given('a data file where "{big}" has 9 times the subscribers of "{tiny}"')
+def step_impl(context, big, tiny):
+    data_file = os.path.join(tempfile.mkdtemp(), 'operators.json')
+    operators = [
+        {"name": big, "country": "Testland", "mcc": "001", "mnc": "01", "size": "small",
+         "is_mvno": False, "subscribers": 9000000},
+        {"name": tiny, "country": "Testland", "mcc": "001", "mnc": "02", "size": "large",
+         "is_mvno": True, "subscribers": 1000000},
+    ]
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump({"operators": operators}, f)
+    context.faker = TelecomFaker(data_provider=LocalJsonProvider(data_file))
+
+@when('I generate {count:d} operators weighted by market share')
+def step_impl(context, count):
+    faker = TelecomFaker(data_provider=context.faker.data_provider, seed=42, weighted=True)
+    context.operators = faker.generate_operators(count, record_type="record")
+
+@then('about {percent:d}% of them should be "{name}"')
+def step_impl(context, percent, name):
+    share = sum(operator.name == name for operator in context.operators) / len(context.operators)
+    assert_that(share, close_to(percent / 100, 0.02))
+
+@then('large operators should appear more often than small operators')
+def step_impl(context):
+    table = context.faker.data_provider.get_table()
+    sizes = Counter(operator.size.value for operator in context.operators)
+    available = Counter(record.size.value for record in table.records)
+    # Compare the share per operator so the result does not depend on how many of each size exist
+    assert_that(sizes['large'] / available['large'], greater_than(sizes['small'] / available['small']))
+
+@when('I generate {count:d} weighted operators with seed {seed:d} using {workers:d} worker')
+@when('I generate {count:d} weighted operators with seed {seed:d} using {workers:d} workers again')
+def step_impl(context, count, seed, workers):
+    faker = TelecomFaker(weighted=True)
+    operators = faker.generate_operators_parallel(count, workers=workers, seed=seed, record_type="record")
+    context.weighted_runs = getattr(context, 'weighted_runs', []) + [operators]
+
+@then('both weighted runs should contain identical operators')
+def step_impl(context):
+    first, second = context.weighted_runs
+    assert_that(second, equal_to(first))
@@ -46,8 +46,13 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "pydantic>=1.10.8,<=2.11.3",
-        "setuptools>=42.0.0",  # For pkg_resources
     ],
+    extras_require={
+        "arrow": ["pyarrow>=8.0.0"],
+        "fast": ["orjson>=3"],
+        "faker": ["faker>=8.0.0"],
+        "zstd": ["zstandard>=0.15"],
+    },
     entry_points={
         "console_scripts": [
             "telecomfaker=telecomfaker.cli:main",
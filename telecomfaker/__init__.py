@@ -1,5 +1,13 @@
 from telecomfaker.faker import TelecomFaker
-from telecomfaker.models import TelecomOperator, OperatorSize
+from telecomfaker.records import OperatorSize, OperatorRecord
 
 __version__ = "0.1.1"
-__all__ = ['TelecomFaker', 'TelecomOperator', 'OperatorSize']
\ No newline at end of file
+__all__ = ['TelecomFaker', 'TelecomOperator', 'OperatorSize', 'OperatorRecord']
+
+
+def __getattr__(name):
+    # Import the pydantic model lazily to keep the package import fast
+    if name == 'TelecomOperator':
+        from telecomfaker.models import TelecomOperator
+        return TelecomOperator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for TelecomFaker.
+
+Run with: telecomfaker bench --output results.json
+      or: python -m telecomfaker.bench --output results.json
+
+Results can be saved as JSON and compared with a saved baseline, e.g. from
+the previous release, with --compare baseline.json.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Any, List, Optional
+
+from telecomfaker import TelecomFaker, __version__
+
+# Regression budget for the cumulative import time of the CLI, in milliseconds
+IMPORT_BUDGET_MS = 100.0
+
+# Batch sizes of the generate_operators benchmarks
+BATCH_SIZES = (1, 1000, 1000000)
+
+# Number of operators serialized by the formatting benchmarks
+FORMAT_COUNT = 1000
+
+# Default slowdown, as a fraction, that counts as a regression against a baseline
+DEFAULT_TOLERANCE = 0.25
+
+# Version of the results file layout
+RESULTS_FORMAT = 1
+
+
+def measure(func: Callable[[], Any], rows: int) -> Dict[str, float]:
+    """
+    Time a single call that produces a number of rows.
+
+    Args:
+        func: A callable producing the rows
+        rows: Number of rows the callable produces
+
+    Returns:
+        A dictionary with the elapsed seconds and rows per second
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "rows_per_sec": rows / elapsed if elapsed else float("inf")}
+
+
+def measure_best(func: Callable[[], Any], rows: int, repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """
+    Time a call repeatedly and keep the fastest run, like timeit.
+
+    Fast calls are looped until one run takes at least min_time, so timer
+    resolution does not distort the result.
+
+    Args:
+        func: A callable producing the rows
+        rows: Number of rows one call produces
+        repeat: Number of timed runs
+        min_time: Minimum duration of one timed run, in seconds
+
+    Returns:
+        A dictionary with the seconds per call, rows per second and the number of calls per run
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 10
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+
+    seconds = best / number
+    return {"seconds": seconds, "rows_per_sec": rows / seconds if seconds else float("inf"), "calls": number}
+
+
+def bench_generation(count: int, seed: int = 42) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the per-row generation loop with the batch path.
+
+    Args:
+        count: Number of operators to generate in each run
+        seed: Random seed used for both runs
+
+    Returns:
+        A dictionary of results keyed by benchmark name
+    """
+    faker = TelecomFaker()
+    faker.set_seed(seed)
+    # Load the data up front so both runs measure generation only
+    faker.generate_operator()
+
+    return {
+        "per_row_loop": measure(lambda: [faker.generate_operator() for _ in range(count)], count),
+        "generate_operators": measure(lambda: faker.generate_operators(count), count),
+    }
+
+
+def measure_memory(func: Callable[[], Any]) -> int:
+    """
+    Measure the memory held by the result of a call.
+
+    Args:
+        func: A callable returning the object to measure
+
+    Returns:
+        The number of bytes still allocated while the result is alive
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def bench_record_types(count: int, seed: int = 42) -> Dict[str, Dict[str, float]]:
+    """
+    Compare throughput and memory of the pydantic and record output types.
+
+    Args:
+        count: Number of operators to generate in each run
+        seed: Random seed used for all runs
+
+    Returns:
+        A dictionary of results keyed by record type
+    """
+    faker = TelecomFaker(seed=seed)
+    faker.generate_operator()
+
+    results = {}
+    for record_type in ("pydantic", "record"):
+        result = measure(lambda: faker.generate_operators(count, record_type=record_type), count)
+        result["bytes_per_row"] = measure_memory(lambda: faker.generate_operators(count, record_type=record_type)) / count
+        results[f"record_type={record_type}"] = result
+    return results
+
+
+def bench_import_time(module: str = "telecomfaker.cli", runs: int = 5) -> Dict[str, float]:
+    """
+    Measure the cold import time of a module with python -X importtime.
+
+    Each run uses a fresh interpreter; the fastest run is reported to reduce noise.
+
+    Args:
+        module: The module to import
+        runs: Number of interpreter runs
+
+    Returns:
+        A dictionary with the import time and the budget in milliseconds
+
+    Raises:
+        ValueError: If runs is less than 1
+    """
+    if runs < 1:
+        raise ValueError("Import time needs at least 1 run")
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True
+        )
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                timings.append(int(parts[1]) / 1000)
+    return {"milliseconds": min(timings), "budget_ms": IMPORT_BUDGET_MS}
+
+
+def bench_provider_load(repeat: int = 5) -> Dict[str, float]:
+    """
+    Time loading the bundled data and building its operator table, bypassing the cache.
+
+    Args:
+        repeat: Number of timed loads
+
+    Returns:
+        A dictionary with the seconds per load and operators loaded per second
+    """
+    from telecomfaker.providers import LocalJsonProvider
+
+    rows = len(LocalJsonProvider().get_table())
+    return measure_best(lambda: LocalJsonProvider(use_cache=False).get_table(), rows, repeat=repeat)
+
+
+def run_suite(max_count: int = max(BATCH_SIZES), repeat: int = 5, import_runs: int = 5,
+              seed: int = 42) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark of the suite.
+
+    Args:
+        max_count: Largest generate_operators batch to run; bigger batch sizes are skipped
+        repeat: Number of timed runs per benchmark
+        import_runs: Number of interpreters started to measure import time
+        seed: Random seed for generation
+
+    Returns:
+        A dictionary of results keyed by benchmark name
+    """
+    from telecomfaker.serialize import format_operator_as_text, operators_to_json
+
+    faker = TelecomFaker(seed=seed)
+    faker.generate_operator()
+
+    results = {"generate_operator": measure_best(faker.generate_operator, 1, repeat=repeat)}
+    for count in BATCH_SIZES:
+        if count <= max_count:
+            # Huge batches are timed once; repeating them only adds run time
+            runs = repeat if count < 100000 else 1
+            results[f"generate_operators[{count}]"] = measure_best(lambda: faker.generate_operators(count),
+                                                                    count, repeat=runs, min_time=0)
+
+    operators = faker.generate_operators(FORMAT_COUNT)
+    results[f"operators_to_json[{FORMAT_COUNT}]"] = measure_best(lambda: operators_to_json(operators),
+                                                                 FORMAT_COUNT, repeat=repeat)
+    results[f"format_operator_as_text[{FORMAT_COUNT}]"] = measure_best(
+        lambda: [format_operator_as_text(operator) for operator in operators], FORMAT_COUNT, repeat=repeat)
+    results["provider_load"] = bench_provider_load(repeat)
+
+    import_time = bench_import_time(runs=import_runs)
+    results["import_time"] = {"seconds": import_time["milliseconds"] / 1000, "budget_ms": import_time["budget_ms"]}
+    return results
+
+
+def build_report(results: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    """
+    Wrap suite results with the details needed to compare runs.
+
+    Args:
+        results: The results of run_suite()
+
+    Returns:
+        A JSON-serializable report
+    """
+    return {
+        "format": RESULTS_FORMAT,
+        "telecomfaker": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Find benchmarks that got slower than a baseline report.
+
+    Args:
+        report: The current report
+        baseline: A report saved by an earlier run
+        tolerance: The slowdown, as a fraction, that is still accepted
+
+    Returns:
+        A description of every regression; empty if there are none
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("seconds"):
+            continue
+        ratio = result["seconds"] / previous["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name} is {ratio:.2f}x slower than baseline ({baseline.get('telecomfaker', '?')})")
+    return regressions
+
+
+def format_result(name: str, result: Dict[str, float]) -> str:
+    """Format one result as a line of the summary table."""
+    if "rows_per_sec" not in result:
+        return f"{name:<34} {result['seconds'] * 1000:>14.1f} ms"
+    line = f"{name:<34} {result['rows_per_sec']:>14,.0f} rows/sec  ({result['seconds'] * 1e6:,.1f} us/call)"
+    if "bytes_per_row" in result:
+        line += f"  {result['bytes_per_row']:,.1f} bytes/row"
+    return line
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark suite and print the results."""
+    parser = argparse.ArgumentParser(prog="telecomfaker bench", description="Benchmark TelecomFaker.")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare with results saved by an earlier run")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Accepted slowdown against the baseline (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--max-count", type=int, default=max(BATCH_SIZES),
+                        help=f"Largest batch size to benchmark (default: {max(BATCH_SIZES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--import-runs", type=int, default=5, help="Interpreters started to time imports (default: 5)")
+    parser.add_argument("--count", type=int, help="Also compare the per-row loop, batch path and record types at this size")
+    parser.add_argument("--no-budget", dest="budget", action="store_false",
+                        help=f"Do not fail when the import time is over budget ({IMPORT_BUDGET_MS:.0f} ms)")
+    args = parser.parse_args(argv)
+    if args.import_runs < 1:
+        parser.error("--import-runs must be at least 1")
+
+    results = run_suite(args.max_count, args.repeat, args.import_runs)
+    if args.count:
+        results.update(bench_generation(args.count))
+        results.update(bench_record_types(args.count))
+    report = build_report(results)
+
+    for name, result in results.items():
+        print(format_result(name, result))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures = []
+    if args.budget and results["import_time"]["seconds"] * 1000 > IMPORT_BUDGET_MS:
+        failures.append(f"Import time is over budget ({IMPORT_BUDGET_MS:.0f} ms)")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            failures.extend(compare(report, json.load(f), args.tolerance))
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,19 @@ Command-line interface for TelecomFaker.
 """
 
 import argparse
-import json
 import sys
-from typing import List, Dict, Any
+from typing import Iterable, Optional, TYPE_CHECKING
 
 from telecomfaker import TelecomFaker
-from telecomfaker.models import TelecomOperator
+from telecomfaker.columns import OperatorColumns, require_pyarrow
+# format_operator_as_text and operators_to_json are still importable from here
+from telecomfaker.serialize import BACKENDS, format_operator_as_text, operators_to_json  # noqa: F401
+from telecomfaker.sinks import COMPRESSIONS, DEFAULT_BATCH_SIZE, SqliteSink, StreamSink
+
+if TYPE_CHECKING:
+    import cProfile
+    
+    from telecomfaker.instrumentation import GenerationStats
 
 
 def parse_args() -> argparse.Namespace:
@@ -33,9 +40,37 @@ def parse_args() -> argparse.Namespace:
     
     parser.add_argument(
         "--format", 
-        choices=["json", "text"], 
+        choices=["json", "ndjson", "text", "csv", "copy", "sqlite", "parquet", "arrow"], 
         default="text", 
-        help="Output format (default: text)"
+        help="Output format; copy is PostgreSQL's COPY text format; sqlite, parquet "
+             "and arrow require --output (default: text)"
+    )
+    
+    parser.add_argument(
+        "--compact", 
+        action="store_true", 
+        help="Write JSON without indentation or spaces"
+    )
+    
+    parser.add_argument(
+        "--json-backend", 
+        choices=BACKENDS, 
+        default="json", 
+        help="JSON encoder; orjson is faster but writes non-ASCII characters unescaped, "
+             "auto uses it when it is installed (default: json)"
+    )
+    
+    parser.add_argument(
+        "--weighted", 
+        action="store_true", 
+        help="Draw operators by market share instead of uniformly"
+    )
+    
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=1, 
+        help="Number of worker processes; output is identical for any value (default: 1)"
     )
     
     parser.add_argument(
@@ -44,58 +79,182 @@ def parse_args() -> argparse.Namespace:
         help="Output file (default: stdout)"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--compression", 
+        choices=COMPRESSIONS, 
+        default="auto", 
+        help="Compress the output file; auto uses gzip for .gz and zstd for .zst files (default: auto)"
+    )
+    
+    parser.add_argument(
+        "--table", 
+        default="operators", 
+        help="Table to insert into with --format sqlite (default: operators)"
+    )
+    
+    parser.add_argument(
+        "--batch-size", 
+        type=int, 
+        default=DEFAULT_BATCH_SIZE, 
+        help=f"Operators handed to the output at a time (default: {DEFAULT_BATCH_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--no-double-buffer", 
+        dest="double_buffer", 
+        action="store_false", 
+        help="Write output in the generating thread instead of overlapping generation and I/O"
+    )
+    
+    parser.add_argument(
+        "--stats", 
+        action="store_true", 
+        help="Print per-stage timings, rows/sec and peak memory to stderr"
+    )
+    
+    parser.add_argument(
+        "--profile", 
+        action="store_true", 
+        help="Like --stats, and also trace peak allocated memory and print the hottest functions"
+    )
+    
+    args = parser.parse_args()
+    if (args.format in FILE_WRITERS or args.format == "sqlite") and not args.output:
+        parser.error(f"--format {args.format} requires --output")
+    if args.compression not in ("auto", "none") and not args.output:
+        parser.error("--compression requires --output")
+    
+    return args
+
+
+# Number of functions listed by --profile
+PROFILE_LIMIT = 25
 
 
-def format_operator_as_text(operator: TelecomOperator) -> str:
-    """Format an operator as plain text."""
-    mvno_status = "MVNO" if operator.is_mvno else "MNO"
+def write_parquet(batches: Iterable[OperatorColumns], path: str) -> None:
+    """Stream column batches into a Parquet file, one row group per batch."""
+    require_pyarrow()
+    import pyarrow.parquet as pq
     
-    return (
-        f"Operator: {operator.name}\n"
-        f"Country: {operator.country}\n"
-        f"MCC: {operator.mcc}\n"
-        f"MNC: {operator.mnc}\n"
-        f"Size: {operator.size.value}\n"
-        f"Type: {mvno_status}\n"
-    )
+    writer = None
+    try:
+        for batch in batches:
+            table = batch.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
 
 
-def operators_to_json(operators: List[TelecomOperator]) -> str:
-    """Convert operators to JSON string."""
-    # Use Pydantic's built-in JSON serialization
-    return json.dumps(
-        [operator.dict() for operator in operators],
-        indent=2
-    )
+def write_arrow(batches: Iterable[OperatorColumns], path: str) -> None:
+    """Stream column batches into an Arrow IPC file."""
+    pa = require_pyarrow()
+    
+    writer = None
+    try:
+        for batch in batches:
+            table = batch.to_arrow()
+            if writer is None:
+                writer = pa.ipc.new_file(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+# Column writers that write binary files and need an output path
+FILE_WRITERS = {
+    "parquet": write_parquet,
+    "arrow": write_arrow,
+}
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    if sys.argv[1:2] == ["bench"]:
+        # Deferred so generating data never pays for the benchmark module
+        from telecomfaker.bench import main as bench_main
+        
+        bench_main(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["traffic"]:
+        from telecomfaker.traffic import main as traffic_main
+        
+        traffic_main(sys.argv[2:])
+        return
+    
     args = parse_args()
     
+    # Instrumentation is only imported, and only costs anything, when asked for
+    stats = None
+    if args.stats or args.profile:
+        from telecomfaker.instrumentation import GenerationStats
+        
+        stats = GenerationStats(track_memory=args.profile)
+    
     # Initialize TelecomFaker
-    faker = TelecomFaker()
+    faker = TelecomFaker(weighted=args.weighted, stats=stats)
     
     # Set seed if provided
     if args.seed is not None:
         faker.set_seed(args.seed)
     
-    # Generate operators using the new method
-    operators = faker.generate_operators(args.count)
+    profiler = None
+    if args.profile:
+        import cProfile
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        generate(args, faker)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        if stats is not None:
+            report_stats(stats, profiler)
+
+
+def report_stats(stats: 'GenerationStats', profiler: Optional['cProfile.Profile'] = None) -> None:
+    """Print the stats and, if profiled, the hottest functions to stderr."""
+    from telecomfaker.instrumentation import format_stats
+    
+    print(format_stats(stats.snapshot()), file=sys.stderr)
+    stats.close()
+    if profiler is not None:
+        import pstats
+        
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(PROFILE_LIMIT)
+
+
+def generate(args: argparse.Namespace, faker: TelecomFaker) -> None:
+    """Generate the operators requested on the command line and write them out."""
+    stats = faker.stats
     
-    # Format output
-    if args.format == "json":
-        output = operators_to_json(operators)
-    else:  # text format
-        output = "\n".join(format_operator_as_text(op) for op in operators)
+    # Generate operators lazily in seeded shards so output is streamed with
+    # constant memory and does not depend on the number of workers
+    if args.format in FILE_WRITERS:
+        batches = faker.iter_columns_parallel(args.count, workers=args.workers)
+        if stats is not None:
+            # The writers pull batches, so their work is the time between batches
+            batches = stats.timed_consumer("serialize", batches)
+        FILE_WRITERS[args.format](batches, args.output)
+        return
     
-    # Write output
-    if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output)
+    # Other formats go through a sink that writes batches in an I/O thread
+    if args.format == "sqlite":
+        sink = SqliteSink(args.output, args.table, batch_size=args.batch_size, double_buffer=args.double_buffer)
     else:
-        print(output)
+        # Rows are written from fragments pre-encoded once per operator
+        sink = StreamSink(args.output or sys.stdout, args.format, compression=args.compression,
+                          compact=args.compact, backend=args.json_backend, batch_size=args.batch_size,
+                          double_buffer=args.double_buffer)
+    faker.write_to(sink, args.count, workers=args.workers)
+    
+    # Keep the trailing newline that print() used to add
+    if not args.output and args.format not in ("ndjson", "csv", "copy"):
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+from array import array
+from typing import Dict, Any, Iterable, Iterator, List, Sequence, Tuple
+
+from telecomfaker.records import OperatorSize, OperatorRecord
+
+# Size codes used by the size column, in ascending order
+SIZE_CODES: Tuple[OperatorSize, ...] = (OperatorSize.SMALL, OperatorSize.MEDIUM, OperatorSize.LARGE)
+
+# Column names in output order
+COLUMN_NAMES = ("name", "country", "mcc", "mnc", "size", "is_mvno")
+
+# Dictionary-encoded string columns
+STRING_COLUMNS = ("name", "country", "mcc", "mnc")
+
+
+def require_pyarrow():
+    """
+    Import pyarrow, which is an optional dependency.
+
+    Returns:
+        The pyarrow module
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Arrow and Parquet output. Install it with: pip install pyarrow") from e
+
+    return pyarrow
+
+
+def _dictionary_encode(values: Iterable[str]) -> Tuple[Tuple[str, ...], array]:
+    """
+    Dictionary-encode a sequence of strings.
+
+    Returns:
+        The distinct values in order of first appearance, and the code of every value
+    """
+    positions: Dict[str, int] = {}
+    codes = array('I')
+    for value in values:
+        codes.append(positions.setdefault(value, len(positions)))
+    return tuple(positions), codes
+
+
+class ColumnEncoding:
+    """
+    Per-operator column codes for a data set.
+
+    Built once per OperatorTable. Taking a batch of rows only means looking up
+    the precomputed codes of the drawn operator indices.
+    """
+
+    def __init__(self, records: Sequence[OperatorRecord]) -> None:
+        """
+        Encode the columns of a data set.
+
+        Args:
+            records: The operator records of the data set
+        """
+        self.dictionaries: Dict[str, Tuple[str, ...]] = {}
+        self.codes: Dict[str, array] = {}
+        for column in STRING_COLUMNS:
+            self.dictionaries[column], self.codes[column] = _dictionary_encode(getattr(record, column) for record in records)
+        self.codes["size"] = array('B', (SIZE_CODES.index(record.size) for record in records))
+        self.codes["is_mvno"] = array('B', (record.is_mvno for record in records))
+
+    def take(self, indices: Iterable[int]) -> 'OperatorColumns':
+        """
+        Build a column batch for the given operator indices.
+
+        Args:
+            indices: Operator table indices, one per row
+
+        Returns:
+            An OperatorColumns batch
+        """
+        indices = indices if isinstance(indices, (list, array)) else list(indices)
+        columns = {
+            column: array(codes.typecode, map(codes.__getitem__, indices))
+            for column, codes in self.codes.items()
+        }
+        return OperatorColumns(columns, self.dictionaries)
+
+
+class OperatorColumns:
+    """
+    A column-oriented batch of generated operators.
+
+    String columns (name, country, mcc, mnc) are dictionary-encoded: the column
+    holds codes into the matching entry of `dictionaries`. The size column holds
+    codes into SIZE_CODES and is_mvno holds 0/1 flags. All columns are compact
+    arrays, so no per-row objects are created.
+    """
+
+    __slots__ = ("columns", "dictionaries")
+
+    def __init__(self, columns: Dict[str, array], dictionaries: Dict[str, Tuple[str, ...]]) -> None:
+        """
+        Create a column batch.
+
+        Args:
+            columns: The code arrays, keyed by column name
+            dictionaries: The string tables of the dictionary-encoded columns
+        """
+        self.columns = columns
+        self.dictionaries = dictionaries
+
+    def __len__(self) -> int:
+        return len(self.columns["is_mvno"])
+
+    def __getitem__(self, column: str) -> array:
+        return self.columns[column]
+
+    def decode(self, column: str) -> List[Any]:
+        """
+        Decode a column to plain Python values.
+
+        Args:
+            column: The column name
+
+        Returns:
+            A list with one value per row
+        """
+        codes = self.columns[column]
+        if column in STRING_COLUMNS:
+            return list(map(self.dictionaries[column].__getitem__, codes))
+        if column == "size":
+            return [SIZE_CODES[code].value for code in codes]
+        return [bool(flag) for flag in codes]
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """
+        Decode all columns, e.g. for pandas.DataFrame(columns.to_pydict()).
+
+        Returns:
+            A dictionary of decoded value lists keyed by column name
+        """
+        return {column: self.decode(column) for column in COLUMN_NAMES}
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over the decoded rows in COLUMN_NAMES order.
+
+        Yields:
+            One tuple of values per row
+        """
+        return zip(*(self.decode(column) for column in COLUMN_NAMES))
+
+    def to_arrow(self):
+        """
+        Convert the batch to a pyarrow Table with dictionary-encoded string columns.
+
+        Returns:
+            A pyarrow.Table
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = require_pyarrow()
+        arrays = []
+        for column in STRING_COLUMNS:
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(self.columns[column], type=pa.int32()),
+                pa.array(self.dictionaries[column], type=pa.string())
+            ))
+        arrays.append(pa.DictionaryArray.from_arrays(
+            pa.array(self.columns["size"], type=pa.int8()),
+            pa.array([size.value for size in SIZE_CODES], type=pa.string())
+        ))
+        arrays.append(pa.array(self.columns["is_mvno"], type=pa.uint8()).cast(pa.bool_()))
+        return pa.Table.from_arrays(arrays, names=list(COLUMN_NAMES))
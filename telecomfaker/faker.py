@@ -1,8 +1,21 @@
 import random
-from typing import Dict, Any, Union, List, Optional
+import time
+from contextlib import nullcontext
+from itertools import chain, islice
+from typing import Dict, Any, AsyncIterator, Callable, ContextManager, Union, List, Optional, Iterator, Iterable, Sequence, Hashable, TextIO, Tuple, TYPE_CHECKING
 
-from telecomfaker.models import TelecomOperator, OperatorSize
-from telecomfaker.providers import LocalJsonProvider
+from telecomfaker.columns import OperatorColumns
+from telecomfaker.records import OperatorSize, Operator, RECORD_TYPES
+from telecomfaker.providers import AsyncDataProvider, LocalJsonProvider
+from telecomfaker.rng import Seed, counter_uniforms, derive_seed
+from telecomfaker.sampling import iter_shuffled
+from telecomfaker.table import OperatorTable
+
+if TYPE_CHECKING:
+    from telecomfaker.instrumentation import GenerationStats
+    from telecomfaker.numbering import NumberGenerator
+    from telecomfaker.sinks import Sink
+    from telecomfaker.traffic import TrafficGenerator, TrafficProfile
 
 
 class TelecomFaker:
@@ -10,17 +23,33 @@ class TelecomFaker:
     A class for generating realistic telecom operator test data.
     """
     
-    def __init__(self, data_provider=None) -> None:
+    def __init__(self, data_provider=None, seed: Optional[Seed] = None, weighted: bool = False,
+                 stats: Optional['GenerationStats'] = None) -> None:
         """
         Initialize the TelecomFaker with a data provider.
         
+        Each instance owns its own random stream, so seeding one instance
+        never affects another instance or the global random module.
+        
         Args:
             data_provider: A data provider instance. If None, uses the default LocalJsonProvider.
+            seed: An optional random seed, equivalent to calling set_seed()
+            weighted: Draw operators by market share instead of uniformly. Weights
+                      come from the data's weight or subscribers field, or from
+                      the operator size.
+            stats: Optional GenerationStats that time the stages of generation.
+                   Without stats, nothing is measured.
         """
         self.data_provider = data_provider or LocalJsonProvider()
-        self.random = random
+        self.random = random.Random()
+        self.weighted = weighted
+        self.stats = stats
+        self.seed: Optional[Seed] = None
+        self._spawn_count = 0
+        if seed is not None:
+            self.set_seed(seed)
     
-    def set_seed(self, seed: Union[int, float, str, bytes, bytearray]) -> None:
+    def set_seed(self, seed: Seed) -> None:
         """
         Set a random seed for consistent data generation.
         
@@ -49,65 +78,907 @@ class TelecomFaker:
             assert operator1 == operator2
             ```
         """
+        self.seed = seed
+        self._spawn_count = 0
         self.random.seed(seed)
     
-    def generate_operator(self) -> TelecomOperator:
+    def spawn(self, key: Optional[Hashable] = None) -> 'TelecomFaker':
+        """
+        Create a child TelecomFaker with an independent random stream.
+        
+        The child shares this instance's data provider and stats. Its seed is derived
+        from this instance's seed and the key, so a seeded parent always
+        produces the same children. This makes sharded or threaded generation
+        reproducible from a single seed.
+        
+        Args:
+            key: A value identifying the child stream, e.g. a shard number.
+                 If None, children are numbered in the order they are spawned.
+                 
+        Returns:
+            A new TelecomFaker instance
+            
+        Example:
+            ```python
+            faker = TelecomFaker(seed=42)
+            shards = [faker.spawn(shard) for shard in range(4)]
+            ```
+        """
+        if key is None:
+            key = self._spawn_count
+            self._spawn_count += 1
+        
+        # An unseeded parent hands out unpredictable but independent children
+        parent_seed = self.seed if self.seed is not None else self.random.getrandbits(64)
+        return type(self)(self.data_provider, seed=derive_seed(parent_seed, key), weighted=self.weighted,
+                          stats=self.stats)
+    
+    def generate_operator(self, country: Optional[str] = None, mcc: Optional[str] = None,
+                          size: Optional[Union[OperatorSize, str]] = None,
+                          is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> Operator:
         """
         Generate a random telecom operator with realistic information.
         
+        Filters are looked up in an index built when the data is loaded, so
+        filtered draws cost the same as unfiltered ones. Under the same seed,
+        n calls return the same operators as one generate_operators(n) call.
+        
+        Args:
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
         Returns:
-            A TelecomOperator instance with validated data
+            A TelecomOperator instance with validated data, or an OperatorRecord
             
         Raises:
+            ValueError: If no operator matches the filters or record_type is unknown
             RuntimeError: If the data source is unavailable or contains no operators
         """
-        try:
-            # Get the data from the provider
-            data = self.data_provider.get_data()
-            
-            # Select a random operator from the data source
-            operators = data.get('operators', [])
-            if not operators:
-                raise ValueError("No operators found in the data source")
-            
-            operator_data = self.random.choice(operators)
-            
-            # Convert size string to enum if needed
-            size = operator_data.get('size', 'medium')
-            if isinstance(size, str):
-                try:
-                    size = OperatorSize(size.lower())
-                except ValueError:
-                    size = OperatorSize.MEDIUM
-            
-            # Create and return a validated TelecomOperator instance
-            return TelecomOperator(
-                name=operator_data.get('name', ''),
-                country=operator_data.get('country', ''),
-                mcc=operator_data.get('mcc', ''),
-                mnc=operator_data.get('mnc', ''),
-                size=size,
-                is_mvno=operator_data.get('is_mvno', False)
-            )
-        except Exception as e:
-            # Wrap the exception with a more informative message
-            raise RuntimeError(f"Failed to generate operator: {str(e)}. Please check the data source.") from e
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        emit = self._emitter(table, record_type)
+        
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        # Same draw as a batch of one, so n calls match generate_operators(n) under a seed
+        index = self._sample_indices(table, candidates, 1)[0]
+        if stats is None:
+            return emit(index)
+        
+        built = time.perf_counter()
+        operator = emit(index)
+        stats.record("sample", built - start, 1)
+        stats.record("build", time.perf_counter() - built, 1)
+        return operator
     
-    def generate_operators(self, count: int = 1) -> List[TelecomOperator]:
+    def generate_operators(self, count: int = 1, country: Optional[str] = None, mcc: Optional[str] = None,
+                           size: Optional[Union[OperatorSize, str]] = None,
+                           is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> List[Operator]:
         """
         Generate multiple random telecom operators.
         
         Args:
             count: Number of operators to generate
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            A list of TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If count is less than 1, no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        return self._draw(table, candidates, count, self._emitter(table, record_type))
+    
+    def iter_operators(self, count: Optional[int] = None, chunk_size: int = 10000,
+                       country: Optional[str] = None, mcc: Optional[str] = None,
+                       size: Optional[Union[OperatorSize, str]] = None,
+                       is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> Iterator[Operator]:
+        """
+        Lazily generate random telecom operators.
+        
+        Operators are drawn in chunks, so memory use stays constant no matter
+        how many operators are consumed. With the same seed, the first N
+        operators match the result of generate_operators(N).
+        
+        Args:
+            count: Number of operators to generate. If None, generates indefinitely.
+            chunk_size: Number of operators drawn from the random stream at a time
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Yields:
+            TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If count or chunk_size is less than 1, no operator matches the filters
+                        or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        if count is not None and count < 1:
+            raise ValueError("Count must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        
+        # Validate and load eagerly so errors surface before iteration starts
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        return self._iter_operators(table, self._emitter(table, record_type), candidates, count, chunk_size)
+    
+    async def agenerate_operator(self, country: Optional[str] = None, mcc: Optional[str] = None,
+                                 size: Optional[Union[OperatorSize, str]] = None,
+                                 is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> Operator:
+        """
+        Generate a random telecom operator without blocking the event loop.
+        
+        The data is loaded without blocking on first use (see _aload_table());
+        arguments and errors are the same as for generate_operator().
+        
+        Returns:
+            A TelecomOperator instance with validated data, or an OperatorRecord
+        """
+        await self._aload_table()
+        return self.generate_operator(country=country, mcc=mcc, size=size, is_mvno=is_mvno,
+                                      record_type=record_type)
+    
+    async def agenerate_operators(self, count: int = 1, country: Optional[str] = None, mcc: Optional[str] = None,
+                                  size: Optional[Union[OperatorSize, str]] = None,
+                                  is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> List[Operator]:
+        """
+        Generate multiple random telecom operators without blocking the event loop.
+        
+        The data is loaded without blocking on first use (see _aload_table());
+        arguments and errors are the same as for generate_operators().
+        
+        Returns:
+            A list of TelecomOperator instances or OperatorRecords
+        """
+        await self._aload_table()
+        return self.generate_operators(count, country=country, mcc=mcc, size=size, is_mvno=is_mvno,
+                                       record_type=record_type)
+    
+    async def aiter_operators(self, count: Optional[int] = None, chunk_size: int = 10000,
+                              country: Optional[str] = None, mcc: Optional[str] = None,
+                              size: Optional[Union[OperatorSize, str]] = None,
+                              is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> AsyncIterator[Operator]:
+        """
+        Lazily generate random telecom operators in async code.
+        
+        Operators are drawn chunk by chunk like iter_operators(), and control
+        returns to the event loop after every chunk, so long streams do not
+        starve other tasks. Arguments and errors are the same as for
+        iter_operators().
+        
+        Yields:
+            TelecomOperator instances or OperatorRecords
+        """
+        import asyncio
+        
+        await self._aload_table()
+        operators = self.iter_operators(count, chunk_size, country=country, mcc=mcc, size=size,
+                                        is_mvno=is_mvno, record_type=record_type)
+        while True:
+            chunk = list(islice(operators, chunk_size))
+            if not chunk:
+                return
+            for operator in chunk:
+                yield operator
+            await asyncio.sleep(0)
+    
+    def sample_operators(self, k: int, unique: bool = True, country: Optional[str] = None,
+                         mcc: Optional[str] = None, size: Optional[Union[OperatorSize, str]] = None,
+                         is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> List[Operator]:
+        """
+        Draw k operators, by default without repeating any operator.
+        
+        Unique samples are taken with a lazy Fisher-Yates shuffle that only
+        remembers the positions it has swapped, so they cost O(k) time and
+        memory however many operators match. Unique samples are always
+        uniform; with unique=False this is the same as generate_operators().
+        
+        Args:
+            k: Number of operators to draw
+            unique: Never return the same operator twice
+            country: Only draw operators from this country
+            mcc: Only draw operators with this Mobile Country Code
+            size: Only draw operators of this size
+            is_mvno: Only draw MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            A list of k TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If k is less than 1, a unique sample is larger than the number of
+                        matching operators, no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        if not unique:
+            return self.generate_operators(k, country=country, mcc=mcc, size=size,
+                                           is_mvno=is_mvno, record_type=record_type)
+        if k < 1:
+            raise ValueError("Count must be at least 1")
+        
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        if k > len(candidates):
+            raise ValueError(f"Cannot draw {k} unique operators: only {len(candidates)} operators match")
+        
+        emit = self._emitter(table, record_type)
+        if self.stats is None:
+            return list(map(emit, islice(iter_shuffled(candidates, self.random), k)))
+        
+        with self._timer("sample", k):
+            indices = list(islice(iter_shuffled(candidates, self.random), k))
+        with self._timer("build", k):
+            return list(map(emit, indices))
+    
+    def iter_shuffled(self, country: Optional[str] = None, mcc: Optional[str] = None,
+                      size: Optional[Union[OperatorSize, str]] = None,
+                      is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> Iterator[Operator]:
+        """
+        Iterate over every matching operator exactly once, in random order.
+        
+        The order is drawn lazily, so consuming the first k operators costs
+        O(k) time and memory even for very large data sets.
+        
+        Args:
+            country: Only include operators from this country
+            mcc: Only include operators with this Mobile Country Code
+            size: Only include operators of this size
+            is_mvno: Only include MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Yields:
+            TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        # Validate and load eagerly so errors surface before iteration starts
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        return map(self._emitter(table, record_type), iter_shuffled(candidates, self.random))
+    
+    def operator_at(self, seed: Seed, index: int, country: Optional[str] = None, mcc: Optional[str] = None,
+                    size: Optional[Union[OperatorSize, str]] = None, is_mvno: Optional[bool] = None,
+                    record_type: str = "pydantic") -> Operator:
+        """
+        Get row index of the stateless operator sequence for a seed.
+        
+        Unlike generate_operator(), this uses no random state: every row is
+        computed from (seed, index) with a counter-based SplitMix64 stream,
+        so any row costs O(1) however far into the sequence it is, and the
+        result is the same in every process. This makes exports resumable
+        and lets slices be regenerated in parallel.
+        
+        The sequence depends on the seed, the data, the filters and whether
+        this instance is weighted; it is not the sequence of set_seed().
+        
+        Args:
+            seed: The seed of the sequence
+            index: The row, starting at 0
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecords
+            
+        Returns:
+            A TelecomOperator instance or an OperatorRecord
+            
+        Raises:
+            ValueError: If index is negative, no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+            
+        Example:
+            ```python
+            faker.operator_at(42, 40000000) == faker.operators_range(42, 40000000, 40000001)[0]
+            ```
+        """
+        return self.operators_range(seed, index, index + 1, country=country, mcc=mcc, size=size,
+                                    is_mvno=is_mvno, record_type=record_type)[0]
+    
+    def operators_range(self, seed: Seed, start: int, stop: int, country: Optional[str] = None,
+                        mcc: Optional[str] = None, size: Optional[Union[OperatorSize, str]] = None,
+                        is_mvno: Optional[bool] = None, record_type: str = "pydantic") -> List[Operator]:
+        """
+        Get rows start to stop - 1 of the stateless operator sequence for a seed.
+        
+        See operator_at(). Slices can be generated in any order and in any
+        process: operators_range(seed, 0, 10) is always operators_range(seed, 0, 4)
+        followed by operators_range(seed, 4, 10).
+        
+        Args:
+            seed: The seed of the sequence
+            start: The first row, starting at 0
+            stop: The row after the last one
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecords
+            
+        Returns:
+            A list of max(0, stop - start) TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If start is negative, no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        if start < 0:
+            raise ValueError("Start must not be negative")
+        
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        emit = self._emitter(table, record_type)
+        count = max(0, stop - start)
+        with self._timer("sample", count):
+            uniforms = counter_uniforms(derive_seed(seed), start, stop)
+            if self.weighted:
+                indices = table.alias_table(candidates).pick(uniforms)
+            else:
+                total = len(candidates)
+                indices = [candidates[int(uniform * total)] for uniform in uniforms]
+        with self._timer("build", count):
+            return list(map(emit, indices))
+    
+    def generate_operators_parallel(self, count: int, workers: Optional[int] = None,
+                                    seed: Optional[Seed] = None, record_type: str = "pydantic") -> List[Operator]:
+        """
+        Generate multiple random telecom operators across a process pool.
+        
+        The work is split into fixed-size shards, each with its own seed derived
+        from the given seed. The result only depends on the seed and count, so
+        it is identical for any number of workers.
+        
+        Args:
+            count: Number of operators to generate
+            workers: Number of worker processes. None or 1 generates in this process.
+            seed: Seed for the shard seeds. Defaults to this instance's seed,
+                  or a random seed if none was set.
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+                  
+        Returns:
+            A list of TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If count is less than 1 or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        return list(self.iter_operators_parallel(count, workers=workers, seed=seed, record_type=record_type))
+    
+    def iter_operators_parallel(self, count: int, workers: Optional[int] = None,
+                                seed: Optional[Seed] = None, record_type: str = "pydantic") -> Iterator[Operator]:
+        """
+        Lazily generate operators across a process pool, shard by shard.
+        
+        See generate_operators_parallel() for how shards are seeded. Memory
+        use is bounded by a few shards per worker.
+        
+        Args:
+            count: Number of operators to generate
+            workers: Number of worker processes. None or 1 generates in this process.
+            seed: Seed for the shard seeds. Defaults to this instance's seed,
+                  or a random seed if none was set.
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+                  
+        Yields:
+            TelecomOperator instances or OperatorRecords
+            
+        Raises:
+            ValueError: If count is less than 1 or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        from telecomfaker.parallel import iter_shard_indices
+        
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        if seed is None:
+            seed = self.seed if self.seed is not None else self.random.getrandbits(64)
+        table = self._load_table()
+        emit = self._emitter(table, record_type)
+        shards = iter_shard_indices(table, count, seed, workers, weighted=self.weighted)
+        stats = self.stats
+        if stats is None:
+            return chain.from_iterable(map(emit, indices) for indices in shards)
+        
+        build = lambda indices: list(map(emit, indices))
+        return chain.from_iterable(stats.timed_map("build", build, stats.timed("sample", shards)))
+    
+    def write_operators(self, out: TextIO, count: int, output_format: str = "json", compact: bool = False,
+                        backend: str = "json", workers: Optional[int] = None, seed: Optional[Seed] = None) -> int:
+        """
+        Generate operators straight into a text stream.
+        
+        Every operator of the data set is encoded once; writing a row then
+        only means joining pre-encoded fragments, so no operator objects are
+        created. The rows match iter_operators_parallel() for the same seed.
+        
+        Args:
+            out: The text stream to write to, e.g. an open file or sys.stdout
+            count: Number of operators to generate
+            output_format: "json" for a JSON array, "ndjson" for one JSON object
+                           per line, or "text" for plain text records
+            compact: Write JSON without indentation or spaces
+            backend: The JSON encoder: "json", "orjson", or "auto" for orjson
+                     when it is installed
+            workers: Number of worker processes. None or 1 generates in this process.
+            seed: Seed for the shard seeds. Defaults to this instance's seed,
+                  or a random seed if none was set.
+            
+        Returns:
+            The number of operators written
+            
+        Raises:
+            ValueError: If count is less than 1, or the format or backend is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        from telecomfaker.parallel import iter_shard_indices
+        from telecomfaker.serialize import FragmentWriter
+        
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        if seed is None:
+            seed = self.seed if self.seed is not None else self.random.getrandbits(64)
+        table = self._load_table()
+        with self._timer("build", len(table)):
+            writer = FragmentWriter(table, output_format, compact, backend)
+        shards = iter_shard_indices(table, count, seed, workers, weighted=self.weighted)
+        if self.stats is None:
+            return writer.write(shards, out)
+        return writer.write(self.stats.timed("sample", shards), out, self.stats)
+    
+    def write_to(self, sink: 'Sink', count: int, workers: Optional[int] = None, seed: Optional[Seed] = None) -> int:
+        """
+        Generate operators into an output sink, e.g. a SQLite database or a compressed file.
+        
+        Operators are handed to the sink in batches of its batch size. Sinks
+        write in their own I/O thread by default, so generating the next
+        batch overlaps with writing the previous one. The rows match
+        iter_operators_parallel() for the same seed.
+        
+        Args:
+            sink: The sink, e.g. a telecomfaker.sinks.SqliteSink or StreamSink
+            count: Number of operators to generate
+            workers: Number of worker processes. None or 1 generates in this process.
+            seed: Seed for the shard seeds. Defaults to this instance's seed,
+                  or a random seed if none was set.
             
         Returns:
-            A list of TelecomOperator instances
+            The number of operators written
             
         Raises:
             ValueError: If count is less than 1
             RuntimeError: If the data source is unavailable
+            
+        Example:
+            ```python
+            from telecomfaker.sinks import SqliteSink
+            
+            faker.write_to(SqliteSink("test.db"), 1000000)
+            ```
         """
+        from telecomfaker.parallel import iter_shard_indices
+        
         if count < 1:
             raise ValueError("Count must be at least 1")
+        
+        if seed is None:
+            seed = self.seed if self.seed is not None else self.random.getrandbits(64)
+        table = self._load_table()
+        shards = iter_shard_indices(table, count, seed, workers, weighted=self.weighted)
+        if self.stats is not None:
+            shards = self.stats.timed("sample", shards)
+        return sink.consume(table, shards, self.stats)
+    
+    def generate_columns(self, count: int, country: Optional[str] = None, mcc: Optional[str] = None,
+                         size: Optional[Union[OperatorSize, str]] = None,
+                         is_mvno: Optional[bool] = None) -> OperatorColumns:
+        """
+        Generate a column-oriented batch of random operators.
+        
+        No per-row objects are created: every column is a compact array of
+        precomputed codes. With the same seed, the rows match
+        generate_operators(count).
+        
+        Args:
+            count: Number of operators to generate
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            
+        Returns:
+            An OperatorColumns batch
+            
+        Raises:
+            ValueError: If count is less than 1 or no operator matches the filters
+            RuntimeError: If the data source is unavailable
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        table = self._load_table()
+        candidates = self._select(table, country, mcc, size, is_mvno)
+        return self._draw(table, candidates, count, table.columns.take, batch=True)
+    
+    def iter_columns_parallel(self, count: int, workers: Optional[int] = None,
+                              seed: Optional[Seed] = None) -> Iterator[OperatorColumns]:
+        """
+        Lazily generate column batches across a process pool, one per shard.
+        
+        The rows match iter_operators_parallel() for the same seed and count.
+        
+        Args:
+            count: Number of operators to generate
+            workers: Number of worker processes. None or 1 generates in this process.
+            seed: Seed for the shard seeds. Defaults to this instance's seed,
+                  or a random seed if none was set.
+                  
+        Yields:
+            OperatorColumns batches
             
-        return [self.generate_operator() for _ in range(count)] 
\ No newline at end of file
+        Raises:
+            ValueError: If count is less than 1
+            RuntimeError: If the data source is unavailable
+        """
+        from telecomfaker.parallel import iter_shard_indices
+        
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        if seed is None:
+            seed = self.seed if self.seed is not None else self.random.getrandbits(64)
+        table = self._load_table()
+        encoding = table.columns
+        shards = iter_shard_indices(table, count, seed, workers, weighted=self.weighted)
+        if self.stats is None:
+            return map(encoding.take, shards)
+        return self.stats.timed_map("build", encoding.take, self.stats.timed("sample", shards))
+    
+    def numbering(self, operator: Operator, calling_code: Optional[str] = None) -> 'NumberGenerator':
+        """
+        Create a generator of unique subscriber numbers for an operator.
+        
+        The generator hands out IMSIs, MSISDNs and ICCIDs in batches. Numbers
+        of each kind never repeat within one generator, and a seeded
+        TelecomFaker always creates generators with the same numbers.
+        
+        Args:
+            operator: The operator the numbers belong to, e.g. from generate_operator()
+            calling_code: The country calling code for MSISDNs and ICCIDs.
+                          Defaults to the code of the operator's MCC.
+            
+        Returns:
+            A NumberGenerator for the operator
+            
+        Raises:
+            ValueError: If the operator's codes are not valid digits
+            
+        Example:
+            ```python
+            numbers = faker.numbering(faker.generate_operator())
+            subscribers = numbers.identities(1000000)
+            ```
+        """
+        from telecomfaker.numbering import NumberGenerator
+        
+        return NumberGenerator(operator, random.Random(self.random.getrandbits(64)), calling_code)
+    
+    def traffic(self, rate: float = 1000.0, profile: Optional['TrafficProfile'] = None,
+                start: Optional[float] = None) -> 'TrafficGenerator':
+        """
+        Create a generator of synthetic call, SMS and data records (CDRs).
+        
+        Events pair a subscriber's home operator with the network it used,
+        which is an operator in another country (MCC) for roaming events.
+        The generator draws from its own child random stream (see spawn()),
+        so a seeded TelecomFaker always creates the same traffic.
+        
+        Args:
+            rate: Target events per second; timestamps advance at this rate
+            profile: The event mix, roaming rate and other distributions.
+                     Defaults to TrafficProfile().
+            start: Timestamp of the start of the stream, in seconds since the epoch.
+                   Defaults to the current time.
+            
+        Returns:
+            A TrafficGenerator
+            
+        Raises:
+            ValueError: If the rate is not greater than zero
+            RuntimeError: If the data source is unavailable
+            
+        Example:
+            ```python
+            traffic = faker.traffic(rate=5000)
+            for batch in traffic.stream(1000000, batch_size=10000):
+                sink.write(batch)
+            ```
+        """
+        from telecomfaker.traffic import TrafficGenerator
+        
+        return TrafficGenerator(self.spawn(), rate, profile, start)
+    
+    def lookup(self, mcc: str, mnc: str, record_type: str = "pydantic") -> Optional[Operator]:
+        """
+        Find the operator with the given Mobile Country Code and Mobile Network Code.
+        
+        Args:
+            mcc: Mobile Country Code, e.g. "262"
+            mnc: Mobile Network Code, e.g. "02"
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            The matching operator, or None if the codes are unknown
+            
+        Raises:
+            RuntimeError: If the data source is unavailable
+        """
+        table = self._load_table()
+        index = table.find(mcc, mnc)
+        return None if index is None else self._emitter(table, record_type)(index)
+    
+    def lookup_imsi(self, imsi: str, record_type: str = "pydantic") -> Optional[Operator]:
+        """
+        Find the operator that issued an IMSI.
+        
+        The IMSI is matched on its longest known MCC+MNC prefix, so 3-digit
+        MNCs are told apart from 2-digit MNCs.
+        
+        Args:
+            imsi: An IMSI, e.g. "262021234567890"
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            The matching operator, or None if no operator matches
+            
+        Raises:
+            RuntimeError: If the data source is unavailable
+        """
+        table = self._load_table()
+        index = table.find_imsi(imsi)
+        return None if index is None else self._emitter(table, record_type)(index)
+    
+    def lookup_many(self, codes: Iterable[Tuple[str, str]], record_type: str = "pydantic") -> List[Optional[Operator]]:
+        """
+        Find the operators for many (MCC, MNC) pairs at once.
+        
+        Args:
+            codes: An iterable of (mcc, mnc) tuples
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            A list with the matching operator, or None, for every pair
+            
+        Raises:
+            RuntimeError: If the data source is unavailable
+        """
+        table = self._load_table()
+        return self._resolve(self._emitter(table, record_type), map(table.codes.get, codes))
+    
+    def lookup_imsis(self, imsis: Iterable[str], record_type: str = "pydantic") -> List[Optional[Operator]]:
+        """
+        Find the issuing operators for many IMSIs at once.
+        
+        Args:
+            imsis: An iterable of IMSIs
+            record_type: "pydantic" for TelecomOperator models, or "record" for
+                         lightweight shared OperatorRecord tuples
+            
+        Returns:
+            A list with the matching operator, or None, for every IMSI
+            
+        Raises:
+            RuntimeError: If the data source is unavailable
+        """
+        table = self._load_table()
+        get = table.imsi_prefixes.get
+        return self._resolve(self._emitter(table, record_type), (get(imsi[:6]) for imsi in imsis))
+    
+    def _resolve(self, emit: Callable[[int], Operator], indices: Iterable[Optional[int]]) -> List[Optional[Operator]]:
+        """Turn looked-up table indices into operators, keeping None for misses."""
+        return [None if index is None else emit(index) for index in indices]
+    
+    def _iter_operators(self, table: OperatorTable, emit: Callable[[int], Operator], candidates: Sequence[int],
+                        count: Optional[int], chunk_size: int) -> Iterator[Operator]:
+        """Yield operators chunk by chunk for iter_operators()."""
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            if self.stats is None:
+                yield from map(emit, self._sample_indices(table, candidates, size))
+            else:
+                yield from self._draw(table, candidates, size, emit)
+            if remaining is not None:
+                remaining -= size
+    
+    def _draw(self, table: OperatorTable, candidates: Sequence[int], count: int,
+              emit: Callable, batch: bool = False) -> Any:
+        """
+        Draw a batch of indices and build the output from them.
+        
+        Args:
+            table: The table the candidates belong to
+            candidates: The table indices to draw from
+            count: Number of indices to draw
+            emit: Builds one operator from an index, or the whole batch if batch is True
+            batch: Pass all indices to emit at once
+            
+        Returns:
+            A list of operators, or whatever emit returns for the batch
+        """
+        if self.stats is None:
+            indices = self._sample_indices(table, candidates, count)
+            return emit(indices) if batch else list(map(emit, indices))
+        
+        with self._timer("sample", count):
+            indices = self._sample_indices(table, candidates, count)
+        with self._timer("build", count):
+            return emit(indices) if batch else list(map(emit, indices))
+    
+    def _timer(self, stage: str, rows: int = 0) -> ContextManager[None]:
+        """Time a block as a stage if stats are enabled."""
+        if self.stats is None:
+            return nullcontext()
+        return _StageTimer(self.stats, stage, rows)
+    
+    def _emitter(self, table: OperatorTable, record_type: str) -> Callable[[int], Operator]:
+        """
+        Get the function that turns a table index into an output operator.
+        
+        Raises:
+            ValueError: If record_type is unknown
+        """
+        if record_type == "record":
+            # Records are immutable, so the shared instances can be handed out
+            return table.records.__getitem__
+        if record_type == "pydantic":
+            # Deferred so pydantic is only imported once a model is needed
+            from telecomfaker.models import copy_operator
+            
+            operators = table.operators
+            return lambda index: copy_operator(operators[index])
+        
+        raise ValueError(f"Unknown record type: {record_type!r}. Expected one of: {', '.join(RECORD_TYPES)}")
+    
+    async def _aload_table(self) -> OperatorTable:
+        """
+        Load the operator table without blocking the event loop.
+        
+        Async providers fetch their data with a single shared fetch. Other
+        providers load in a worker thread, since they may read files.
+        
+        Returns:
+            The provider's OperatorTable
+            
+        Raises:
+            RuntimeError: If the data source is unavailable or contains no operators
+        """
+        import asyncio
+        
+        if not isinstance(self.data_provider, AsyncDataProvider):
+            return await asyncio.get_running_loop().run_in_executor(None, self._load_table)
+        
+        try:
+            await self.data_provider.aget_data()
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate operator: {str(e)}. Please check the data source.") from e
+        
+        return self._load_table()
+    
+    def _load_table(self) -> OperatorTable:
+        """
+        Get the operator table from the data provider.
+        
+        Returns:
+            The provider's OperatorTable
+            
+        Raises:
+            RuntimeError: If the data source is unavailable or contains no operators
+        """
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        try:
+            table = self.data_provider.get_table()
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate operator: {str(e)}. Please check the data source.") from e
+        if stats is not None:
+            stats.record("load", time.perf_counter() - start, len(table))
+        
+        if not table.records:
+            raise RuntimeError("Failed to generate operator: No operators found in the data source. Please check the data source.")
+        
+        return table
+    
+    def _select(self, table: OperatorTable, country: Optional[str], mcc: Optional[str],
+                size: Optional[Union[OperatorSize, str]], is_mvno: Optional[bool]) -> Sequence[int]:
+        """
+        Look up the operator indices matching the filters.
+        
+        Returns:
+            A non-empty sequence of table indices
+            
+        Raises:
+            ValueError: If size is invalid or no operator matches the filters
+        """
+        candidates = table.select(country=country, mcc=mcc, size=size, is_mvno=is_mvno)
+        if not candidates:
+            filters = {'country': country, 'mcc': mcc, 'size': size, 'is_mvno': is_mvno}
+            active = ", ".join(f"{name}={value!r}" for name, value in filters.items() if value is not None)
+            raise ValueError(f"No operators match the filters: {active}")
+        
+        return candidates
+    
+    def _sample_indices(self, table: OperatorTable, candidates: Sequence[int], count: int) -> List[int]:
+        """
+        Draw all operator indices for a batch.
+        
+        Weighted draws go through the bucket's cached alias table, so they
+        stay O(1) per index like uniform draws.
+        
+        Args:
+            table: The table the candidates belong to
+            candidates: The table indices to draw from
+            count: Number of indices to draw
+            
+        Returns:
+            A list of table indices
+        """
+        if self.weighted:
+            return table.alias_table(candidates).sample(self.random, count)
+        # randrange() is the draw random.choice() makes, which keeps the
+        # seeded sequences of earlier versions
+        randrange = self.random.randrange
+        size = len(candidates)
+        return [candidates[randrange(size)] for _ in range(count)]
+
+
+class _StageTimer:
+    """Records the duration of a with block as a stage of generation."""
+    
+    __slots__ = ("stats", "stage", "rows", "start")
+    
+    def __init__(self, stats: 'GenerationStats', stage: str, rows: int) -> None:
+        self.stats = stats
+        self.stage = stage
+        self.rows = rows
+    
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stats.record(self.stage, time.perf_counter() - self.start, self.rows)
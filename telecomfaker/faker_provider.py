@@ -0,0 +1,210 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from telecomfaker.faker import TelecomFaker
+from telecomfaker.numbering import IMSI_DIGITS
+from telecomfaker.records import Operator, OperatorSize
+
+
+def require_faker():
+    """
+    Import faker, which is an optional dependency.
+
+    Returns:
+        The faker module
+
+    Raises:
+        ImportError: If faker is not installed
+    """
+    try:
+        import faker.providers
+    except ImportError as e:
+        raise ImportError("faker is required for the Faker provider. Install it with: pip install faker") from e
+
+    return faker
+
+
+BaseProvider = require_faker().providers.BaseProvider
+
+
+class TelecomProvider(BaseProvider):
+    """
+    A faker provider for telecom operators, MCCs and IMSIs.
+
+    Adding it to a faker.Faker instance adds fake.telecom_operator(),
+    fake.mcc() and fake.imsi(), plus telecom_operators() and imsis() to
+    draw many values in one call. Every draw uses the host faker's random
+    stream, so fake.seed_instance() and Faker.seed() make telecom data
+    reproducible together with the rest of the fixture.
+
+    The operator data is loaded once and shared through the data provider's
+    cache and indexed table, so calls cost one draw each, filters included.
+    Operators are returned as OperatorRecords by default; those are
+    hashable, which fake.unique needs.
+
+    Example:
+        ```python
+        from faker import Faker
+        from telecomfaker.faker_provider import TelecomProvider
+
+        fake = Faker()
+        fake.add_provider(TelecomProvider)
+        fake.seed_instance(42)
+        fake.telecom_operator(country="Germany")
+        fake.unique.imsi()
+        ```
+    """
+
+    def __init__(self, generator, data_provider=None, weighted: bool = False) -> None:
+        """
+        Create the provider for a faker generator.
+
+        faker.Faker.add_provider() creates it with the generator alone. To use
+        other data or weighted draws, create it yourself and add the instance.
+
+        Args:
+            generator: The faker generator the provider belongs to
+            data_provider: A TelecomFaker data provider. If None, uses the default LocalJsonProvider.
+            weighted: Draw operators by market share instead of uniformly
+        """
+        super().__init__(generator)
+        self._telecom = TelecomFaker(data_provider, weighted=weighted)
+        # IMSI template and MSIN range by (mcc, mnc)
+        self._imsi_formats: Dict[Tuple[str, str], Tuple[str, int]] = {}
+
+    def _faker(self) -> TelecomFaker:
+        """Get the TelecomFaker, drawing from the host faker's current random stream."""
+        # Looked up on every call: seed_instance() replaces the generator's random instance
+        telecom = self._telecom
+        telecom.random = self.generator.random
+        return telecom
+
+    def _imsi_format(self, operator: Operator) -> Tuple[str, int]:
+        """
+        Get the IMSI template of an operator and the number of MSINs it has.
+
+        Raises:
+            ValueError: If the operator's codes are not digits or leave no room for an MSIN
+        """
+        key = (operator.mcc, operator.mnc)
+        imsi_format = self._imsi_formats.get(key)
+        if imsi_format is None:
+            prefix = operator.mcc + operator.mnc
+            msin_digits = IMSI_DIGITS - len(prefix)
+            if not prefix.isdigit() or msin_digits < 1:
+                raise ValueError(f"MCC {operator.mcc!r} and MNC {operator.mnc!r} cannot start an IMSI")
+            imsi_format = self._imsi_formats[key] = (f"{prefix}{{:0{msin_digits}d}}", 10 ** msin_digits)
+        return imsi_format
+
+    def telecom_operator(self, country: Optional[str] = None, mcc: Optional[str] = None,
+                         size: Optional[Union[OperatorSize, str]] = None, is_mvno: Optional[bool] = None,
+                         record_type: str = "record") -> Operator:
+        """
+        Generate a random telecom operator.
+
+        Args:
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "record" for hashable OperatorRecords, or "pydantic" for
+                         TelecomOperator models
+
+        Returns:
+            An OperatorRecord or a TelecomOperator instance
+
+        Raises:
+            ValueError: If no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        return self._faker().generate_operator(country=country, mcc=mcc, size=size, is_mvno=is_mvno,
+                                               record_type=record_type)
+
+    def telecom_operators(self, count: int, country: Optional[str] = None, mcc: Optional[str] = None,
+                          size: Optional[Union[OperatorSize, str]] = None, is_mvno: Optional[bool] = None,
+                          record_type: str = "record") -> List[Operator]:
+        """
+        Generate many random telecom operators in one draw.
+
+        Args:
+            count: Number of operators to generate
+            country: Only generate operators from this country
+            mcc: Only generate operators with this Mobile Country Code
+            size: Only generate operators of this size
+            is_mvno: Only generate MVNOs (True) or network operators (False)
+            record_type: "record" for hashable OperatorRecords, or "pydantic" for
+                         TelecomOperator models
+
+        Returns:
+            A list of OperatorRecords or TelecomOperator instances
+
+        Raises:
+            ValueError: If no operator matches the filters or record_type is unknown
+            RuntimeError: If the data source is unavailable
+        """
+        return self._faker().generate_operators(count, country=country, mcc=mcc, size=size, is_mvno=is_mvno,
+                                                record_type=record_type)
+
+    def mcc(self, country: Optional[str] = None) -> str:
+        """
+        Generate the Mobile Country Code of a random operator.
+
+        Args:
+            country: Only use operators from this country
+
+        Returns:
+            A 3-digit MCC string
+
+        Raises:
+            ValueError: If no operator is based in the country
+        """
+        return self.telecom_operator(country=country).mcc
+
+    def imsi(self, country: Optional[str] = None, mcc: Optional[str] = None,
+             operator: Optional[Operator] = None) -> str:
+        """
+        Generate a random IMSI of a random operator.
+
+        Args:
+            country: Only use operators from this country
+            mcc: Only use operators with this Mobile Country Code
+            operator: Use this operator instead of a random one
+
+        Returns:
+            A 15-digit IMSI string
+
+        Raises:
+            ValueError: If no operator matches the filters or its codes cannot start an IMSI
+        """
+        return self.imsis(1, country=country, mcc=mcc, operator=operator)[0]
+
+    def imsis(self, count: int, country: Optional[str] = None, mcc: Optional[str] = None,
+              operator: Optional[Operator] = None) -> List[str]:
+        """
+        Generate many random IMSIs in one draw.
+
+        IMSIs are drawn independently and may repeat; use fake.unique.imsi()
+        or TelecomFaker.numbering() for IMSIs that never repeat.
+
+        Args:
+            count: Number of IMSIs to generate
+            country: Only use operators from this country
+            mcc: Only use operators with this Mobile Country Code
+            operator: Use this operator instead of random ones
+
+        Returns:
+            A list of 15-digit IMSI strings
+
+        Raises:
+            ValueError: If no operator matches the filters or its codes cannot start an IMSI
+        """
+        telecom = self._faker()
+        if operator is not None:
+            formats = [self._imsi_format(operator)] * count
+        else:
+            table = telecom._load_table()
+            candidates = telecom._select(table, country, mcc, None, None)
+            records = table.records
+            formats = [self._imsi_format(records[index])
+                       for index in telecom._sample_indices(table, candidates, count)]
+        randrange = telecom.random.randrange
+        return [template.format(randrange(upper)) for template, upper in formats]
@@ -0,0 +1,281 @@
+import sys
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, TypeVar
+
+# Stages of generation that are timed: loading the operator table, drawing
+# table indices, turning indices into operators or fragments, and writing output
+STAGES = ("load", "sample", "build", "serialize")
+
+# Upper bounds of the timing histogram buckets, in seconds: 1 us doubling up to about 18 minutes
+BUCKET_BOUNDS = tuple(2 ** exponent / 1e6 for exponent in range(31))
+
+# Called with (stage, seconds, rows) after every timed step
+StatsCallback = Callable[[str, float, int], None]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Histogram:
+    """A timing histogram with power-of-two buckets from 1 us upwards."""
+
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(BUCKET_BOUNDS)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add one timing."""
+        # Bucket i holds timings below 2**i microseconds
+        bucket = min(int(seconds * 1e6).bit_length(), len(BUCKET_BOUNDS) - 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile from the buckets.
+
+        Args:
+            fraction: The percentile as a fraction, e.g. 0.99
+
+        Returns:
+            The upper bound of the bucket holding the percentile, capped at the
+            largest timing; 0.0 if there are no timings
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the histogram; buckets are keyed by their upper bound in seconds."""
+        return {
+            "count": self.count,
+            "seconds": self.total,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "buckets": {f"{bound:g}": count for bound, count in zip(BUCKET_BOUNDS, self.counts) if count},
+        }
+
+
+def peak_rss() -> Optional[int]:
+    """Get the peak resident memory of this process in bytes, or None where it is unknown."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class GenerationStats:
+    """
+    Counters and timing histograms for the stages of generation.
+
+    Attach an instance to a TelecomFaker to see where generation time goes.
+    Every batch, chunk or shard is timed as a whole, never row by row, so
+    the cost of measuring stays small even when enabled. A TelecomFaker
+    without stats skips all of it.
+
+    Instances are thread-safe, so generators spawned from one TelecomFaker
+    can share them. Steps run in worker processes are not measured
+    separately; the parent sees them as the time spent waiting for shards.
+    """
+
+    def __init__(self, callbacks: Iterable[StatsCallback] = (), track_memory: bool = False) -> None:
+        """
+        Create empty stats.
+
+        Args:
+            callbacks: Functions called with (stage, seconds, rows) after every
+                       timed step, e.g. to forward timings to a metrics system
+            track_memory: Trace Python allocations with tracemalloc to report the
+                          peak allocated memory. This slows allocation down.
+        """
+        self.callbacks: List[StatsCallback] = list(callbacks)
+        self.track_memory = track_memory
+        self._lock = threading.Lock()
+        self._tracing = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and timings and restart the clock."""
+        with self._lock:
+            self.histograms: Dict[str, Histogram] = {}
+            self.rows: Dict[str, int] = {}
+            self.started = time.perf_counter()
+        if self.track_memory:
+            import tracemalloc
+
+            # Restarting is the only way to reset the peak on Python 3.8
+            if self._tracing:
+                tracemalloc.stop()
+            tracemalloc.start()
+            self._tracing = True
+
+    def close(self) -> None:
+        """Stop tracing allocations, if this instance started it."""
+        if self._tracing:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._tracing = False
+
+    def add_callback(self, callback: StatsCallback) -> None:
+        """Register a function to call with (stage, seconds, rows) after every timed step."""
+        self.callbacks.append(callback)
+
+    def record(self, stage: str, seconds: float, rows: int = 0) -> None:
+        """
+        Record one timed step.
+
+        Args:
+            stage: The stage, usually one of STAGES
+            seconds: How long the step took
+            rows: Number of rows the step handled
+        """
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.add(seconds)
+            self.rows[stage] = self.rows.get(stage, 0) + rows
+        for callback in self.callbacks:
+            callback(stage, seconds, rows)
+
+    def timed(self, stage: str, batches: Iterable[T]) -> Iterator[T]:
+        """
+        Time how long each batch of an iterator takes to produce.
+
+        Args:
+            stage: The stage to record
+            batches: Sized batches, e.g. shards of table indices
+
+        Yields:
+            The batches, unchanged
+        """
+        clock = time.perf_counter
+        iterator = iter(batches)
+        while True:
+            start = clock()
+            try:
+                batch = next(iterator)
+            except StopIteration:
+                return
+            self.record(stage, clock() - start, len(batch))
+            yield batch
+
+    def timed_map(self, stage: str, func: Callable[[T], R], batches: Iterable[T]) -> Iterator[R]:
+        """
+        Apply a function to every batch, timing each call.
+
+        Args:
+            stage: The stage to record
+            func: The function to apply
+            batches: Sized batches, e.g. shards of table indices
+
+        Yields:
+            The result of func for every batch
+        """
+        clock = time.perf_counter
+        for batch in batches:
+            start = clock()
+            result = func(batch)
+            self.record(stage, clock() - start, len(batch))
+            yield result
+
+    def timed_consumer(self, stage: str, batches: Iterable[T]) -> Iterator[T]:
+        """
+        Time how long the consumer of an iterator spends on each batch.
+
+        The time between handing out a batch and being asked for the next
+        one is recorded, e.g. the time a writer takes to write the batch.
+
+        Args:
+            stage: The stage to record
+            batches: Sized batches, e.g. column batches
+
+        Yields:
+            The batches, unchanged
+        """
+        clock = time.perf_counter
+        for batch in batches:
+            start = clock()
+            yield batch
+            self.record(stage, clock() - start, len(batch))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize the stats so far.
+
+        Rows are the rows drawn in the sample stage; rows per second relate
+        them to the wall-clock time since the stats were created or reset.
+
+        Returns:
+            A JSON-serializable dictionary
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            rows = self.rows.get("sample", 0)
+            stages = {stage: dict(histogram.to_dict(), rows=self.rows[stage])
+                      for stage, histogram in self.histograms.items()}
+
+        peak_memory = None
+        if self._tracing:
+            import tracemalloc
+
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        return {
+            "elapsed": elapsed,
+            "rows": rows,
+            "rows_per_sec": rows / elapsed if elapsed else 0.0,
+            "peak_memory": peak_memory,
+            "peak_rss": peak_rss(),
+            "stages": stages,
+        }
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    """Format a byte count in MiB."""
+    return "n/a" if size is None else f"{size / 2 ** 20:,.1f} MiB"
+
+
+def format_stats(snapshot: Dict[str, Any]) -> str:
+    """
+    Format a stats snapshot as a table for humans.
+
+    Args:
+        snapshot: The result of GenerationStats.snapshot()
+
+    Returns:
+        A multi-line summary
+    """
+    lines = [f"{'stage':<10} {'calls':>8} {'rows':>12} {'total ms':>10} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    stages = snapshot["stages"]
+    # Known stages in pipeline order, then any custom ones
+    for stage in sorted(stages, key=lambda name: (STAGES.index(name) if name in STAGES else len(STAGES), name)):
+        result = stages[stage]
+        lines.append(f"{stage:<10} {result['count']:>8,} {result['rows']:>12,} {result['seconds'] * 1000:>10.1f} "
+                     f"{result['p50'] * 1000:>9.3f} {result['p99'] * 1000:>9.3f} {result['max'] * 1000:>9.3f}")
+    lines.append(f"{snapshot['rows']:,} rows in {snapshot['elapsed']:.3f} s ({snapshot['rows_per_sec']:,.0f} rows/sec)")
+    memory = f"peak RSS {_format_bytes(snapshot['peak_rss'])}"
+    if snapshot["peak_memory"] is not None:
+        memory += f", peak traced {_format_bytes(snapshot['peak_memory'])}"
+    lines.append(memory)
+    return "\n".join(lines)
@@ -1,13 +1,8 @@
-from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
 
-
-class OperatorSize(str, Enum):
-    """Enum representing the size of a telecom operator."""
-    SMALL = "small"
-    MEDIUM = "medium"
-    LARGE = "large"
+# The lightweight types live in records so they can be used without pydantic
+from telecomfaker.records import OperatorSize, OperatorRecord, Operator, RECORD_TYPES, operator_to_dict
 
 
 class TelecomOperator(BaseModel):
@@ -34,4 +29,21 @@ class TelecomOperator(BaseModel):
                 "size": "large",
                 "is_mvno": False
             }
-        } 
\ No newline at end of file
+        }
+
+
+# Pydantic v2 renamed copy() to model_copy()
+_copy_operator = getattr(TelecomOperator, 'model_copy', None) or TelecomOperator.copy
+
+
+def copy_operator(operator: TelecomOperator) -> TelecomOperator:
+    """
+    Create a copy of an already validated TelecomOperator without re-validating it.
+    
+    Args:
+        operator: A validated TelecomOperator instance
+        
+    Returns:
+        A new TelecomOperator instance with the same field values
+    """
+    return _copy_operator(operator)
@@ -0,0 +1,298 @@
+from math import gcd
+from random import Random
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from telecomfaker.records import Operator
+
+# ITU-T E.164 country calling codes by Mobile Country Code
+CALLING_CODES: Dict[str, str] = {
+    "202": "30", "204": "31", "206": "32", "208": "33", "212": "377", "213": "376",
+    "214": "34", "216": "36", "218": "387", "219": "385", "220": "381", "222": "39",
+    "226": "40", "228": "41", "230": "420", "231": "421", "232": "43", "234": "44",
+    "235": "44", "238": "45", "240": "46", "242": "47", "244": "358", "246": "370",
+    "247": "371", "248": "372", "250": "7", "255": "380", "257": "375", "259": "373",
+    "260": "48", "262": "49", "266": "350", "268": "351", "270": "352", "272": "353",
+    "274": "354", "276": "355", "278": "356", "280": "357", "282": "995", "283": "374",
+    "284": "359", "286": "90", "293": "386", "294": "389", "297": "382",
+    "302": "1", "310": "1", "311": "1", "312": "1", "313": "1", "314": "1", "315": "1",
+    "316": "1", "334": "52", "338": "1",
+    "400": "994", "401": "7", "404": "91", "405": "91", "410": "92", "412": "93",
+    "413": "94", "414": "95", "415": "961", "416": "962", "417": "963", "418": "964",
+    "419": "965", "420": "966", "421": "967", "422": "968", "424": "971", "425": "972",
+    "426": "973", "427": "974", "428": "976", "429": "977", "432": "98", "434": "998",
+    "436": "992", "437": "996", "438": "993", "440": "81", "441": "81", "450": "82",
+    "452": "84", "454": "852", "455": "853", "456": "855", "457": "856", "460": "86",
+    "466": "886", "470": "880", "502": "60", "505": "61", "510": "62", "515": "63",
+    "520": "66", "525": "65", "528": "673", "530": "64",
+    "602": "20", "603": "213", "604": "212", "605": "216", "606": "218", "608": "221",
+    "620": "233", "621": "234", "624": "237", "630": "243", "636": "251", "639": "254",
+    "640": "255", "641": "256", "645": "260", "648": "263", "655": "27",
+    "704": "502", "706": "503", "708": "504", "710": "505", "712": "506", "714": "507",
+    "716": "51", "722": "54", "724": "55", "730": "56", "732": "57", "734": "58",
+    "736": "591", "740": "593", "744": "595", "748": "598",
+}
+
+# Total digits of an IMSI (MCC + MNC + MSIN)
+IMSI_DIGITS = 15
+
+# Digits of the national significant number of an MSISDN
+NATIONAL_DIGITS = 10
+
+# Digits of an ICCID without its check digit ("89" + calling code + MNC + account)
+ICCID_PAYLOAD_DIGITS = 18
+
+# ICCIDs start with the telecom industry identifier
+ICCID_INDUSTRY_PREFIX = "89"
+
+
+def _double(digit: int) -> int:
+    """Double a digit the way the Luhn algorithm does."""
+    return digit * 2 - 9 if digit > 4 else digit * 2
+
+
+def _build_luhn_chunks() -> Tuple[int, ...]:
+    """
+    Precompute the Luhn sum of every 4-digit chunk.
+
+    The rightmost digit of a chunk is doubled. Chunks have an even length, so
+    every chunk of a payload that ends in that chunk's position is aligned the
+    same way and the sums of its chunks simply add up.
+    """
+    return tuple(
+        _double(value % 10) + value // 10 % 10 + _double(value // 100 % 10) + value // 1000
+        for value in range(10000)
+    )
+
+
+LUHN_CHUNKS = _build_luhn_chunks()
+
+
+def luhn_check_digit(payload: str) -> int:
+    """
+    Compute the Luhn check digit of a string of digits.
+
+    Args:
+        payload: The digits to protect, e.g. an ICCID without its check digit
+
+    Returns:
+        The check digit
+    """
+    total = sum(
+        _double(int(digit)) if position % 2 == 0 else int(digit)
+        for position, digit in enumerate(reversed(payload))
+    )
+    return (10 - total % 10) % 10
+
+
+class AffinePermutation:
+    """
+    A seeded permutation of range(size): position -> (a * position + b) % size.
+
+    The multiplier is coprime to the size, so every position maps to a
+    distinct value. Walking the positions in order therefore yields unique,
+    scattered values without remembering any of them.
+    """
+
+    __slots__ = ("size", "multiplier", "offset")
+
+    def __init__(self, size: int, rng: Random) -> None:
+        """
+        Pick a random permutation of range(size).
+
+        Args:
+            size: The number of values
+            rng: The random stream that picks the permutation
+        """
+        multiplier = 1
+        if size > 2:
+            # Prefer large multipliers so neighbouring positions land far apart
+            multiplier = rng.randrange(size // 3, size)
+            while gcd(multiplier, size) != 1:
+                multiplier = rng.randrange(size // 3, size)
+        self.size = size
+        self.multiplier = multiplier
+        self.offset = rng.randrange(size)
+
+    def take(self, start: int, count: int) -> List[int]:
+        """
+        Get the values at positions start to start + count - 1.
+
+        Args:
+            start: The first position
+            count: The number of positions
+
+        Returns:
+            A list of distinct values
+        """
+        size, multiplier, offset = self.size, self.multiplier, self.offset
+        return [(multiplier * position + offset) % size for position in range(start, start + count)]
+
+
+class SubscriberIdentity(NamedTuple):
+    """The numbers identifying one subscriber of an operator."""
+
+    imsi: str
+    msisdn: str
+    iccid: str
+
+
+class NumberGenerator:
+    """
+    Generates unique IMSIs, MSISDNs and ICCIDs for one operator.
+
+    Each kind of number walks its own seeded permutation of the operator's
+    number range, so numbers never repeat within a generator no matter how
+    many batches are drawn, and no set of issued numbers is kept. Batches are
+    formatted with precomputed prefixes; ICCID check digits are added up from
+    a table of 4-digit chunk sums instead of digit by digit.
+    """
+
+    def __init__(self, operator: Operator, rng: Random, calling_code: Optional[str] = None) -> None:
+        """
+        Set up the number ranges of an operator.
+
+        Args:
+            operator: The operator the numbers belong to
+            rng: The random stream that picks the permutations
+            calling_code: The country calling code for MSISDNs and ICCIDs.
+                          Defaults to the code of the operator's MCC.
+
+        Raises:
+            ValueError: If the operator's codes or the calling code are not digits,
+                        or leave no room for subscriber numbers
+        """
+        if not (operator.mcc + operator.mnc).isdigit():
+            raise ValueError(f"Invalid operator codes: MCC {operator.mcc!r} and MNC {operator.mnc!r} must be digits")
+        calling_code = calling_code or CALLING_CODES.get(operator.mcc)
+        if calling_code is not None and not (calling_code.isascii() and calling_code.isdigit()):
+            raise ValueError(f"Invalid calling code {calling_code!r}: must be digits, without a leading '+'")
+        self.operator = operator
+        self.calling_code = calling_code
+
+        imsi_prefix = f"{operator.mcc}{operator.mnc}"
+        msin_digits = IMSI_DIGITS - len(imsi_prefix)
+        if msin_digits < 1:
+            raise ValueError(f"MCC {operator.mcc} and MNC {operator.mnc} leave no room for an IMSI")
+        self._imsi = (f"{imsi_prefix}{{:0{msin_digits}d}}", AffinePermutation(10 ** msin_digits, rng))
+
+        self._msisdn = None
+        self._iccid = None
+        if calling_code is not None:
+            # National numbers never start with 0 or 1
+            low = 2 * 10 ** (NATIONAL_DIGITS - 1)
+            self._msisdn = (f"{calling_code}{{}}", AffinePermutation(10 ** NATIONAL_DIGITS - low, rng), low)
+
+            iccid_prefix = f"{ICCID_INDUSTRY_PREFIX}{calling_code}{operator.mnc}"
+            account_digits = ICCID_PAYLOAD_DIGITS - len(iccid_prefix)
+            if account_digits < 1:
+                raise ValueError(f"Calling code {calling_code} and MNC {operator.mnc} leave no room for an ICCID")
+            # The prefix's share of the Luhn sum is the same for every ICCID
+            prefix_sum = sum(
+                _double(int(digit)) if (position + account_digits) % 2 == 0 else int(digit)
+                for position, digit in enumerate(reversed(iccid_prefix))
+            )
+            self._iccid = (f"{iccid_prefix}{{:0{account_digits}d}}{{}}",
+                           AffinePermutation(10 ** account_digits, rng), prefix_sum)
+
+        self._positions = {"imsi": 0, "msisdn": 0, "iccid": 0}
+
+    def _check_room(self, kind: str, permutation: AffinePermutation, count: int) -> None:
+        """Make sure a permutation has count unused values left."""
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        left = permutation.size - self._positions[kind]
+        if count > left:
+            raise ValueError(f"The {kind} range of {self.operator.name} has only {left} unused numbers left")
+
+    def _advance(self, kind: str, permutation: AffinePermutation, count: int) -> List[int]:
+        """Take the next count values of a permutation."""
+        self._check_room(kind, permutation, count)
+        start = self._positions[kind]
+        self._positions[kind] = start + count
+        return permutation.take(start, count)
+
+    def _require_calling_code(self) -> None:
+        """Make sure numbers that need a country calling code can be built."""
+        if self.calling_code is None:
+            raise ValueError(f"No country calling code is known for MCC {self.operator.mcc}; "
+                             f"pass calling_code to generate MSISDNs and ICCIDs")
+
+    def imsis(self, count: int) -> List[str]:
+        """
+        Generate unique IMSIs (MCC + MNC + MSIN, 15 digits).
+
+        Args:
+            count: Number of IMSIs to generate
+
+        Returns:
+            A list of IMSI strings
+
+        Raises:
+            ValueError: If count is negative or the operator's IMSI range is exhausted
+        """
+        template, permutation = self._imsi
+        return list(map(template.format, self._advance("imsi", permutation, count)))
+
+    def msisdns(self, count: int) -> List[str]:
+        """
+        Generate unique MSISDNs in E.164 format without the leading "+".
+
+        Args:
+            count: Number of MSISDNs to generate
+
+        Returns:
+            A list of MSISDN strings
+
+        Raises:
+            ValueError: If count is negative, the range is exhausted or no calling code is known
+        """
+        self._require_calling_code()
+        template, permutation, low = self._msisdn
+        return [template.format(low + value) for value in self._advance("msisdn", permutation, count)]
+
+    def iccids(self, count: int) -> List[str]:
+        """
+        Generate unique ICCIDs (19 digits including the Luhn check digit).
+
+        Args:
+            count: Number of ICCIDs to generate
+
+        Returns:
+            A list of ICCID strings
+
+        Raises:
+            ValueError: If count is negative, the range is exhausted or no calling code is known
+        """
+        self._require_calling_code()
+        chunks = LUHN_CHUNKS
+
+        template, permutation, prefix_sum = self._iccid
+        accounts = self._advance("iccid", permutation, count)
+        # Accounts have at most 13 digits, so four 4-digit chunks cover them all
+        checks = [
+            -(prefix_sum + chunks[account % 10000] + chunks[account // 10000 % 10000]
+              + chunks[account // 100000000 % 10000] + chunks[account // 1000000000000]) % 10
+            for account in accounts
+        ]
+        return list(map(template.format, accounts, checks))
+
+    def identities(self, count: int) -> List[SubscriberIdentity]:
+        """
+        Generate complete subscriber identities: an IMSI, MSISDN and ICCID each.
+
+        Args:
+            count: Number of subscribers to generate
+
+        Returns:
+            A list of SubscriberIdentity tuples
+
+        Raises:
+            ValueError: If count is negative, a range is exhausted or no calling code is known;
+                        no range is advanced then, so later identities still line up
+        """
+        self._require_calling_code()
+        # Check every range first, so a failure cannot leave some of them advanced
+        self._check_room("imsi", self._imsi[1], count)
+        self._check_room("msisdn", self._msisdn[1], count)
+        self._check_room("iccid", self._iccid[1], count)
+        return list(map(SubscriberIdentity, self.imsis(count), self.msisdns(count), self.iccids(count)))
@@ -0,0 +1,105 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional, Tuple
+
+from telecomfaker.rng import Seed, derive_seed
+from telecomfaker.table import OperatorTable
+
+# Number of operators drawn per shard. Shard boundaries depend only on the
+# count, never on the number of workers, which keeps the output identical
+# for any worker count.
+SHARD_SIZE = 100000
+
+# (seed, shard number, number of operators)
+ShardTask = Tuple[Seed, int, int]
+
+# Per-process generator and the parent's table, set once by the pool initializer
+_worker_faker = None
+_worker_table = None
+
+
+def _init_worker(table: OperatorTable, weighted: bool) -> None:
+    """Create the worker's generator for the table the parent draws for."""
+    global _worker_faker, _worker_table
+    from telecomfaker.faker import TelecomFaker
+
+    _worker_faker = TelecomFaker(weighted=weighted)
+    _worker_table = table
+
+
+def _draw_shard(faker, table: OperatorTable, task: ShardTask) -> array:
+    """
+    Draw the operator indices of one shard.
+
+    Args:
+        faker: The TelecomFaker used to draw the indices
+        table: The table the indices refer to
+        task: The shard to draw
+
+    Returns:
+        An array of operator table indices
+    """
+    seed, shard, size = task
+    faker.set_seed(derive_seed(seed, shard))
+    return array('I', faker._sample_indices(table, table.select(), size))
+
+
+def _run_worker_shard(task: ShardTask) -> array:
+    """Draw one shard inside a worker process."""
+    return _draw_shard(_worker_faker, _worker_table, task)
+
+
+def _iter_tasks(count: int, seed: Seed, shard_size: int) -> Iterator[ShardTask]:
+    """Split a count into shard tasks."""
+    for shard, start in enumerate(range(0, count, shard_size)):
+        yield seed, shard, min(shard_size, count - start)
+
+
+def iter_shard_indices(table: OperatorTable, count: int, seed: Seed, workers: Optional[int] = None,
+                       shard_size: int = SHARD_SIZE, weighted: bool = False) -> Iterator[array]:
+    """
+    Draw operator indices shard by shard, optionally across a process pool.
+
+    Every shard is seeded with derive_seed(seed, shard number) and results are
+    yielded in shard order, so the indices only depend on the seed and count.
+    At most two shards per worker are in flight, which keeps memory bounded.
+
+    Workers draw for the given table, which is pickled once per worker
+    process, so the indices always refer to it even if the data provider
+    has reloaded its data in the meantime.
+
+    Args:
+        table: The operator table the indices refer to
+        count: Total number of indices to draw
+        seed: The seed all shard seeds are derived from
+        workers: Number of worker processes. None or 1 draws in this process.
+        shard_size: Number of indices per shard
+        weighted: Draw indices by market share instead of uniformly
+
+    Yields:
+        Arrays of operator table indices, one per shard
+    """
+    tasks = _iter_tasks(count, seed, shard_size)
+
+    if workers is None or workers <= 1:
+        from telecomfaker.faker import TelecomFaker
+
+        faker = TelecomFaker(weighted=weighted)
+        for task in tasks:
+            yield _draw_shard(faker, table, task)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(table, weighted)) as pool:
+        pending = deque()
+        try:
+            for task in tasks:
+                pending.append(pool.submit(_run_worker_shard, task))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Don't keep drawing shards nobody will consume
+            for future in pending:
+                future.cancel()
@@ -1,7 +1,10 @@
-from telecomfaker.providers.base import DataProvider
+from telecomfaker.providers.base import DataProvider, AsyncDataProvider
+from telecomfaker.providers.http_json import HttpJsonProvider
 from telecomfaker.providers.local_json import LocalJsonProvider
+from telecomfaker.providers.reloading import ReloadingJsonProvider, DataChanges
+from telecomfaker.providers.snapshot import SnapshotProvider, compile_snapshot
 
 # Keep StaticDataProvider for backward compatibility
 StaticDataProvider = LocalJsonProvider
 
-__all__ = ['DataProvider', 'LocalJsonProvider', 'StaticDataProvider']
\ No newline at end of file
+__all__ = ['AsyncDataProvider', 'DataChanges', 'DataProvider', 'HttpJsonProvider', 'LocalJsonProvider', 'ReloadingJsonProvider', 'SnapshotProvider', 'StaticDataProvider', 'compile_snapshot']
\ No newline at end of file
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 
+from telecomfaker.table import OperatorTable
+
 class DataProvider(ABC):
     """
     Abstract base class for telecom data providers.
@@ -19,4 +21,132 @@ class DataProvider(ABC):
         Raises:
             Exception: If the data cannot be retrieved
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def get_table(self) -> OperatorTable:
+        """
+        Get the precomputed operator table for the provider's data.
+        
+        The table is built on first use and rebuilt only when get_data()
+        returns a different data object. After changing the data in place,
+        call invalidate_table() so the change is generated too.
+        
+        Returns:
+            An OperatorTable for the current data
+        
+        Raises:
+            Exception: If the data cannot be retrieved
+        """
+        data = self.get_data()
+        table = getattr(self, '_table', None)
+        if table is None or table.source is not data:
+            table = OperatorTable(data)
+            self._table = table
+        
+        return table
+    
+    def invalidate_table(self) -> None:
+        """
+        Forget the operator table, so the next get_table() rebuilds it from get_data().
+        
+        Needed only when the data returned by get_data() was changed in place;
+        returning a new data object rebuilds the table by itself.
+        """
+        self._table = None
+
+
+class AsyncDataProvider(DataProvider):
+    """
+    Abstract base class for data providers backed by slow or remote sources.
+    
+    Subclasses implement fetch_data() as a coroutine. The data is loaded once
+    with aget_data() (or TelecomFaker's async methods); concurrent callers
+    share a single in-flight fetch. Once loaded, the data is also available
+    through the synchronous get_data() and get_table().
+    """
+    
+    def __init__(self):
+        self.data = None
+        self._table = None
+        self._loading = None
+    
+    @abstractmethod
+    async def fetch_data(self) -> Dict[str, Any]:
+        """
+        Fetch the telecom data from the source.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        
+        Raises:
+            Exception: If the data cannot be retrieved
+        """
+        pass
+    
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Get the loaded telecom data.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        
+        Raises:
+            RuntimeError: If the data has not been loaded with aget_data() yet
+        """
+        if self.data is None:
+            raise RuntimeError(f"{type(self).__name__} has not loaded its data yet; await aget_data() first")
+        
+        return self.data
+    
+    async def aget_data(self) -> Dict[str, Any]:
+        """
+        Get the telecom data, fetching it on first use.
+        
+        Concurrent callers wait for the same fetch instead of starting their
+        own. If the fetch fails, every waiter gets the error and the next
+        call tries again.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        
+        Raises:
+            Exception: If the data cannot be retrieved
+        """
+        import asyncio
+        
+        if self.data is not None:
+            return self.data
+        
+        loop = asyncio.get_running_loop()
+        loading = self._loading
+        if loading is None or loading.get_loop() is not loop:
+            loading = self._loading = loop.create_task(self._load())
+        # A cancelled caller must not cancel the fetch the others are waiting for
+        return await asyncio.shield(loading)
+    
+    async def aget_table(self) -> OperatorTable:
+        """
+        Get the precomputed operator table, fetching the data on first use.
+        
+        Returns:
+            An OperatorTable for the current data
+        
+        Raises:
+            Exception: If the data cannot be retrieved
+        """
+        await self.aget_data()
+        return self.get_table()
+    
+    async def _load(self) -> Dict[str, Any]:
+        """Run one fetch and publish its result."""
+        try:
+            self.data = await self.fetch_data()
+            return self.data
+        finally:
+            self._loading = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickled copies get the loaded data, but not the event loop's task
+        state = self.__dict__.copy()
+        state.update(_table=None, _loading=None)
+        return state
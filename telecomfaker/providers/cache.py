@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from telecomfaker.table import OperatorTable
+
+# (modification time in ns, size in bytes) of a cached file
+FileStamp = Tuple[int, int]
+
+
+def copy_json(value: Any) -> Any:
+    """
+    Copy parsed JSON, including every nested dictionary and list.
+    
+    Much faster than copy.deepcopy(), since JSON holds nothing but
+    dictionaries, lists and immutable scalars.
+    
+    Args:
+        value: A value returned by json.load()
+        
+    Returns:
+        An independent copy of the value
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+class CacheEntry:
+    """
+    A parsed data file shared by every provider that loads the same file.
+    
+    Only the immutable OperatorTable is shared. The parsed data stays inside
+    the entry; providers hand out their own copies of it, which callers are
+    free to change or serialize.
+    """
+    
+    def __init__(self, stamp: FileStamp, data: Dict[str, Any]) -> None:
+        self.stamp = stamp
+        self._data = data
+        self._table: Optional[OperatorTable] = None
+        self._lock = threading.Lock()
+    
+    def get_table(self) -> OperatorTable:
+        """
+        Get the operator table for the cached data, building it once.
+        
+        Returns:
+            The shared OperatorTable
+        """
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    self._table = OperatorTable(self._data)
+        return self._table
+    
+    def copy_data(self) -> Dict[str, Any]:
+        """
+        Get a copy of the parsed data.
+        
+        Returns:
+            A new dictionary containing telecom operator data
+        """
+        return copy_json(self._data)
+
+
+_entries: Dict[str, CacheEntry] = {}
+_lock = threading.Lock()
+
+
+def load_json(file_path: str) -> CacheEntry:
+    """
+    Load a JSON data file through the process-wide cache.
+    
+    Files are keyed by their real path and re-parsed only when their
+    modification time or size changes. Parsing happens under a lock, so
+    concurrent loads of the same file parse it once.
+    
+    Args:
+        file_path: Path to the JSON data file
+        
+    Returns:
+        The CacheEntry holding the parsed data
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    path = os.path.realpath(file_path)
+    with _lock:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = _entries.get(path)
+        if entry is None or entry.stamp != stamp:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = CacheEntry(stamp, json.load(f))
+            _entries[path] = entry
+        return entry
+
+
+def invalidate(file_path: Optional[str] = None) -> None:
+    """
+    Drop cached data so the next load re-parses the file.
+    
+    Providers that already loaded the data keep using it until they are
+    invalidated themselves (see LocalJsonProvider.invalidate()).
+    
+    Args:
+        file_path: The file to drop. If None, clears the whole cache.
+    """
+    with _lock:
+        if file_path is None:
+            _entries.clear()
+            return
+        _entries.pop(os.path.realpath(file_path), None)
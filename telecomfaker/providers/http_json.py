@@ -0,0 +1,79 @@
+import json
+from typing import Dict, Any
+
+from telecomfaker.providers.base import AsyncDataProvider
+
+class HttpJsonProvider(AsyncDataProvider):
+    """
+    A data provider that downloads telecom data in JSON format over HTTP.
+    
+    In async code, the download runs in a worker thread so it never blocks
+    the event loop. Synchronous callers can use get_data() directly, which
+    downloads the data in the calling thread.
+    """
+    
+    def __init__(self, url: str, timeout: float = 10.0):
+        """
+        Initialize the HTTP JSON data provider.
+        
+        Args:
+            url: URL of the JSON data, in the same format as the bundled data file
+            timeout: Seconds to wait for the server before giving up
+        """
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+    
+    def _download(self) -> Dict[str, Any]:
+        """
+        Download and parse the data.
+        
+        Raises:
+            ConnectionError: If the server cannot be reached or returns an error
+            ValueError: If the response is not valid JSON
+        """
+        # Deferred because urllib.request is slow to import
+        from urllib.error import URLError
+        from urllib.request import urlopen
+        
+        try:
+            with urlopen(self.url, timeout=self.timeout) as response:
+                body = response.read()
+        except (URLError, OSError) as e:
+            raise ConnectionError(f"Could not download data from {self.url}: {e}") from e
+        
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in data from: {self.url}")
+    
+    async def fetch_data(self) -> Dict[str, Any]:
+        """
+        Download the data in a worker thread.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        
+        Raises:
+            ConnectionError: If the server cannot be reached or returns an error
+            ValueError: If the response is not valid JSON
+        """
+        import asyncio
+        
+        return await asyncio.get_running_loop().run_in_executor(None, self._download)
+    
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Get the telecom data, downloading it in the calling thread if needed.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        
+        Raises:
+            ConnectionError: If the server cannot be reached or returns an error
+            ValueError: If the response is not valid JSON
+        """
+        if self.data is None:
+            self.data = self._download()
+        
+        return self.data
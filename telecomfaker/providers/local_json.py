@@ -1,23 +1,34 @@
 import json
-import pkg_resources
-from typing import Dict, Any
+import os
+from typing import Callable, Dict, Any, TypeVar
 
+from telecomfaker.providers import cache
 from telecomfaker.providers.base import DataProvider
+from telecomfaker.table import OperatorTable
+
+T = TypeVar('T')
 
 class LocalJsonProvider(DataProvider):
     """
     A data provider that loads telecom data from a local JSON file.
+    
+    By default the parsed data and its operator table come from a process-wide
+    cache, so any number of providers for the same file parse it only once
+    and share one operator table.
     """
     
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, use_cache: bool = True):
         """
         Initialize the local JSON data provider.
         
         Args:
             file_path: Path to the JSON data file. If None, uses the default path.
+            use_cache: Whether to share parsed data through the process-wide cache
         """
         self.file_path = file_path or self._get_default_data_path()
+        self.use_cache = use_cache
         self.data = None
+        self._entry = None
     
     def _get_default_data_path(self):
         """
@@ -26,12 +37,29 @@ class LocalJsonProvider(DataProvider):
         Returns:
             The path to the default data file
         """
-        return pkg_resources.resource_filename('telecomfaker', 'data/telecom_data.json')
+        # The bundled file sits next to the package on a regular install, which
+        # avoids importing importlib.resources on startup
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = os.path.join(package_dir, 'data', 'telecom_data.json')
+        if os.path.exists(path):
+            return path
+        
+        try:
+            from importlib.resources import files
+        except ImportError:
+            # Python 3.8 has no importlib.resources.files(); reading the path
+            # then reports the missing file
+            return path
+        return str(files('telecomfaker.data').joinpath('telecom_data.json'))
     
     def get_data(self) -> Dict[str, Any]:
         """
         Get the telecom data.
         
+        With the cache, each provider gets its own copy of the shared data,
+        made on the first call. Once it has been handed out, the operator
+        table is built from this copy, so changes to it are generated too.
+        
         Returns:
             A dictionary containing telecom operator data
             
@@ -39,12 +67,66 @@ class LocalJsonProvider(DataProvider):
             Exception: If the data cannot be retrieved
         """
         if self.data is None:
-            try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Data file not found: {self.file_path}")
-            except json.JSONDecodeError:
-                raise ValueError(f"Invalid JSON in data file: {self.file_path}")
-        
-        return self.data 
\ No newline at end of file
+            if self.use_cache:
+                self.data = self._load_entry().copy_data()
+            else:
+                self.data = self._read(self._parse)
+        
+        return self.data
+    
+    def get_table(self) -> OperatorTable:
+        """
+        Get the precomputed operator table, shared through the cache when possible.
+        
+        The shared table is only used while it matches what get_data() would
+        return: not for subclasses that override get_data(), and not after
+        get_data() has handed out this provider's own copy of the data.
+        
+        Returns:
+            An OperatorTable for the current data
+            
+        Raises:
+            Exception: If the data cannot be retrieved
+        """
+        if self.use_cache and self.data is None and type(self).get_data is LocalJsonProvider.get_data:
+            return self._load_entry().get_table()
+        
+        return super().get_table()
+    
+    def _load_entry(self) -> cache.CacheEntry:
+        """Get the cache entry of the data file, loading it on first use."""
+        if self._entry is None:
+            self._entry = self._read(lambda: cache.load_json(self.file_path))
+        return self._entry
+    
+    def _parse(self) -> Dict[str, Any]:
+        """Parse the data file without the cache."""
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _read(self, load: Callable[[], T]) -> T:
+        """Run a load of the data file, turning its errors into readable ones."""
+        try:
+            return load()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {self.file_path}")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in data file: {self.file_path}")
+    
+    def invalidate(self) -> None:
+        """
+        Forget the loaded data and drop the file from the process-wide cache.
+        
+        The next call to get_data() re-reads the file.
+        """
+        cache.invalidate(self.file_path)
+        self.data = None
+        self._entry = None
+        self._table = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle only the configuration; copies load the file themselves (or
+        # find it in the cache a forked process inherits)
+        state = self.__dict__.copy()
+        state.update(data=None, _entry=None, _table=None)
+        return state 
\ No newline at end of file
@@ -0,0 +1,365 @@
+import json
+import os
+import threading
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, Tuple
+
+from telecomfaker.providers.base import DataProvider
+from telecomfaker.records import OperatorRecord
+from telecomfaker.table import OperatorTable, normalize_operator, operator_weight
+
+# Operators are matched across versions of the file by MCC, MNC and, for
+# repeated codes, the number of earlier operators with the same codes
+OperatorKey = Tuple[str, str, int]
+
+# (validated record, weight)
+_Entry = Tuple[OperatorRecord, float]
+
+
+class DataChanges(NamedTuple):
+    """
+    The operators added, removed and changed by a reload, by key.
+    
+    reloaded is False if the file was unchanged and not read at all.
+    """
+
+    added: Tuple[OperatorKey, ...]
+    removed: Tuple[OperatorKey, ...]
+    changed: Tuple[OperatorKey, ...]
+    reloaded: bool = True
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _keyed(operators) -> Dict[OperatorKey, Dict[str, Any]]:
+    """Key raw operator entries by MCC, MNC and occurrence, keeping file order."""
+    keyed: Dict[OperatorKey, Dict[str, Any]] = {}
+    seen: Dict[Tuple[Any, Any], int] = {}
+    for operator_data in operators:
+        codes = (operator_data.get('mcc', ''), operator_data.get('mnc', ''))
+        occurrence = seen.get(codes, 0)
+        seen[codes] = occurrence + 1
+        keyed[codes + (occurrence,)] = operator_data
+    return keyed
+
+
+class ReloadingJsonProvider(DataProvider):
+    """
+    A data provider for long-running processes that picks up changes to its JSON file.
+    
+    On every reload the file is diffed against the loaded operators, keyed by
+    MCC and MNC. Only added and changed operators are validated again, and
+    unchanged operators keep their records and models. The new operator table
+    is built on the side and published with a single assignment, so
+    generation never waits for a reload and never sees a half-updated table.
+    A generation call that already started keeps using the table it began with.
+    
+    Reloads happen when refresh() is called, or periodically after watch().
+    """
+    
+    def __init__(self, file_path: str, on_reload: Optional[Callable[[DataChanges], None]] = None):
+        """
+        Initialize the reloading JSON data provider and load the file.
+        
+        Args:
+            file_path: Path to the JSON data file
+            on_reload: Optional callback, called with the DataChanges of every
+                       reload after the first that changed the operators
+        
+        Raises:
+            FileNotFoundError: If the data file does not exist
+            ValueError: If the file is not valid JSON or has invalid operators
+        """
+        self.file_path = file_path
+        self.on_reload = on_reload
+        self.last_error: Optional[Exception] = None
+        self.data = None
+        self._table: Optional[OperatorTable] = None
+        # Raw data, table position and key of every loaded operator
+        self._raw: Dict[OperatorKey, Dict[str, Any]] = {}
+        self._positions: Dict[OperatorKey, int] = {}
+        self._keys: List[OperatorKey] = []
+        self._stamp = None
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self.refresh()
+    
+    def _read(self) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        """
+        Read the file and its (modification time, size) stamp.
+        
+        The stamp is taken before reading, so a write that lands while
+        reading changes it again and triggers another reload. The caller
+        keeps it only once the data has been applied, so a file that fails
+        to load is tried again on the next check.
+        """
+        try:
+            stat = os.stat(self.file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f), stamp
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {self.file_path}")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON in data file: {self.file_path}")
+    
+    def _is_modified(self) -> bool:
+        """Check the file's stamp without reading it."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) != self._stamp
+    
+    def refresh(self, force: bool = False) -> DataChanges:
+        """
+        Reload the file if it changed and apply the differences.
+        
+        A failed reload is also stored in last_error, which the next
+        successful reload clears. A failed reload changes nothing, so the
+        next check tries the file again and a broken file stays reported
+        until it is fixed.
+        
+        Args:
+            force: Reload even if the file's modification time and size are unchanged
+        
+        Returns:
+            The operators added, removed and changed by this reload;
+            reloaded tells whether the file was read at all
+        
+        Raises:
+            FileNotFoundError: If the data file does not exist
+            ValueError: If the file is not valid JSON or has invalid operators;
+                        the previously loaded operators stay in use
+        """
+        with self._lock:
+            if not force and self._table is not None and not self._is_modified():
+                return DataChanges((), (), (), reloaded=False)
+            
+            first = self._table is None
+            try:
+                changes = self._reload()
+            except Exception as e:
+                self.last_error = e
+                raise
+            self.last_error = None
+        
+        if changes and not first and self.on_reload is not None:
+            self.on_reload(changes)
+        return changes
+    
+    def _reload(self) -> DataChanges:
+        """
+        Read the file and publish its operators; the caller holds the lock.
+        
+        The new version is built on the side and committed only once it is
+        complete, so a failure leaves the loaded version fully in place.
+        """
+        data, stamp = self._read()
+        operators = _keyed(data.get('operators', []))
+        if self._table is None:
+            self._load(data, operators)
+            self._stamp = stamp
+            return DataChanges(tuple(operators), (), ())
+        
+        changes, updates = self._diff(operators)
+        if changes:
+            table, keys, positions = self._apply(data, changes, updates)
+            raw = dict(self._raw)
+            for key in changes.removed:
+                del raw[key]
+            for key in changes.added + changes.changed:
+                raw[key] = operators[key]
+            self._raw, self._keys, self._positions = raw, keys, positions
+        else:
+            table = self._table
+        
+        # Publish the new version; readers pick up either the old or the new table
+        self.data = data
+        self._table = table
+        self._stamp = stamp
+        return changes
+    
+    def _load(self, data: Dict[str, Any], operators: Dict[OperatorKey, Dict[str, Any]]) -> None:
+        """Build the first version of the table."""
+        entries = [self._entry(operator_data) for operator_data in operators.values()]
+        self._raw = dict(operators)
+        self._keys = list(operators)
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+        self.data = data
+        self._table = OperatorTable(data, records=[record for record, _ in entries],
+                                    weights=[weight for _, weight in entries])
+    
+    def _diff(self, operators: Dict[OperatorKey, Dict[str, Any]]) -> Tuple[DataChanges, Dict[OperatorKey, _Entry]]:
+        """
+        Compare new raw operators with the loaded ones.
+        
+        Returns:
+            The changes, and the validated record and weight of every added or changed operator
+        
+        Raises:
+            ValueError: If an added or changed operator is invalid
+        """
+        updates: Dict[OperatorKey, _Entry] = {}
+        changed: List[OperatorKey] = []
+        removed: List[OperatorKey] = []
+        for key, previous in self._raw.items():
+            operator_data = operators.get(key)
+            if operator_data is None:
+                removed.append(key)
+            elif operator_data != previous:
+                updates[key] = self._entry(operator_data)
+                changed.append(key)
+        
+        added = [key for key in operators if key not in self._raw]
+        for key in added:
+            updates[key] = self._entry(operators[key])
+        
+        return DataChanges(tuple(added), tuple(removed), tuple(changed)), updates
+    
+    def _apply(self, data: Dict[str, Any], changes: DataChanges,
+               updates: Dict[OperatorKey, _Entry]) -> Tuple[OperatorTable, List[OperatorKey], Dict[OperatorKey, int]]:
+        """
+        Build the next table by applying changes to the current one.
+        
+        Changed operators are updated in place. Added operators fill the
+        slots of removed ones before being appended, and slots still empty
+        are filled with operators moved from the end. Only the touched
+        positions are re-indexed, unless so many changed that rebuilding
+        the table is cheaper.
+        
+        The keys and positions are updated on copies, which the caller
+        commits together with the table.
+        
+        Returns:
+            The new table, and the key and position of every operator in it
+        """
+        current = self._table
+        records = list(current.records)
+        weights = list(current.weights)
+        keys, positions = list(self._keys), dict(self._positions)
+        touched = set()
+        
+        def place(position: int, key: OperatorKey, entry: _Entry) -> None:
+            records[position], weights[position] = entry
+            keys[position] = key
+            positions[key] = position
+            touched.add(position)
+        
+        for key in changes.changed:
+            place(positions[key], key, updates[key])
+        
+        # Pop the smallest slots first, so the table stays as compact as possible
+        holes = sorted((positions.pop(key) for key in changes.removed), reverse=True)
+        for key in changes.added:
+            if holes:
+                place(holes.pop(), key, updates[key])
+            else:
+                records.append(None)
+                weights.append(0.0)
+                keys.append(key)
+                place(len(records) - 1, key, updates[key])
+        
+        holes.reverse()
+        while holes:
+            last = len(records) - 1
+            touched.add(last)
+            if holes[-1] == last:
+                holes.pop()
+            else:
+                place(holes.pop(0), keys[last], (records[last], weights[last]))
+            del records[last], weights[last], keys[last]
+        
+        if len(touched) * 4 > len(records):
+            table = OperatorTable(data, records=records, weights=weights)
+            table.warm_from(current)
+        else:
+            table = current.patched(data, records, weights, touched)
+        return table, keys, positions
+    
+    @staticmethod
+    def _entry(operator_data: Dict[str, Any]) -> _Entry:
+        """Validate one raw operator."""
+        record = normalize_operator(operator_data)
+        return record, operator_weight(operator_data, record.size)
+    
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Get the currently loaded telecom data.
+        
+        Returns:
+            A dictionary containing telecom operator data
+        """
+        return self.data
+    
+    def get_table(self) -> OperatorTable:
+        """
+        Get the current operator table without waiting for reloads.
+        
+        Returns:
+            The OperatorTable of the latest successfully loaded version
+        """
+        return self._table
+    
+    def invalidate_table(self) -> None:
+        """
+        Re-read the file and apply its changes.
+        
+        The table of this provider always follows the file, not changes made
+        to the dictionary returned by get_data().
+        
+        Raises:
+            FileNotFoundError: If the data file does not exist
+            ValueError: If the file is not valid JSON or has invalid operators
+        """
+        self.refresh(force=True)
+    
+    def watch(self, interval: float = 1.0) -> None:
+        """
+        Check the file for changes in a background thread.
+        
+        A failed reload keeps the previous operators and stores the error in
+        last_error; the watcher keeps running.
+        
+        Args:
+            interval: Seconds between checks
+        """
+        if self._watcher is not None:
+            return
+        
+        self._stopped.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), daemon=True,
+                                         name=f"telecomfaker-reload-{os.path.basename(self.file_path)}")
+        self._watcher.start()
+    
+    def _watch(self, interval: float) -> None:
+        """Run the watcher loop until stop() is called."""
+        while not self._stopped.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                # refresh() has stored the error in last_error
+                pass
+    
+    def stop(self) -> None:
+        """Stop the background watcher, if it is running."""
+        watcher = self._watcher
+        if watcher is None:
+            return
+        self._stopped.set()
+        watcher.join()
+        self._watcher = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickled copies reload the file themselves and never watch it
+        state = self.__dict__.copy()
+        state.update(data=None, _table=None, _raw={}, _positions={}, _keys=[], _stamp=None, _lock=None,
+                     _watcher=None, _stopped=None, on_reload=None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.refresh()
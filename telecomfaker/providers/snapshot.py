@@ -0,0 +1,288 @@
+import collections.abc
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import Dict, Any, Iterator, List, Optional, Sequence
+
+from telecomfaker.columns import SIZE_CODES
+from telecomfaker.providers.base import DataProvider
+from telecomfaker.records import OperatorRecord
+from telecomfaker.table import OperatorTable, normalize_operator, operator_weight
+
+# Snapshot layout (all integers little-endian):
+#   header   magic, format version, record count, string count
+#   offsets  (string count + 1) uint32 offsets into the string blob
+#   blob     UTF-8 bytes of all distinct strings, padded to 8 bytes
+#   columns  one column per field, each holding a value for every record:
+#            float64 market-share weights; uint32 string ids of name,
+#            country, mcc and mnc; uint8 size codes; uint8 is_mvno flags
+# Fixed-width columns let records be decoded one at a time, straight from the mapping.
+MAGIC = b"TFSNAP\x00\x01"
+VERSION = 3
+HEADER = struct.Struct("<8sIII")
+STRING_COLUMNS = ("name", "country", "mcc", "mnc")
+
+
+def _padding(size: int) -> int:
+    """Number of bytes that align a position to 8 bytes."""
+    return -size % 8
+
+
+def _column(view: memoryview, typecode: str) -> Sequence:
+    """View a little-endian column of a mapped snapshot as a sequence of numbers."""
+    if sys.byteorder == 'little' or typecode == 'B':
+        return view.cast(typecode)
+    # Big-endian machines decode a swapped copy instead
+    column = array(typecode, view.tobytes())
+    column.byteswap()
+    return column
+
+
+def compile_snapshot(json_path: str, snapshot_path: str) -> None:
+    """
+    Compile a JSON data file into a binary snapshot.
+
+    Every operator is validated once here, so reading the snapshot only has
+    to decode fixed-width column values. The snapshot is written to a
+    temporary file and moved into place, so readers never see a partial file.
+
+    Args:
+        json_path: Path to the JSON data file
+        snapshot_path: Path of the snapshot to write
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist
+        ValueError: If the JSON is invalid or contains invalid operators
+    """
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON in data file: {json_path}")
+
+    operators = data.get('operators', [])
+    records = [normalize_operator(operator_data) for operator_data in operators]
+    weights = [operator_weight(operator_data, record.size) for operator_data, record in zip(operators, records)]
+
+    # Intern every distinct string once
+    string_ids: Dict[str, int] = {}
+    columns = [array('I') for _ in STRING_COLUMNS]
+    for record in records:
+        for column, value in zip(columns, record[:4]):
+            column.append(string_ids.setdefault(value, len(string_ids)))
+    sizes = array('B', (SIZE_CODES.index(record.size) for record in records))
+    flags = array('B', (record.is_mvno for record in records))
+    columns.insert(0, array('d', weights))
+    if sys.byteorder != 'little':
+        for column in columns:
+            column.byteswap()
+
+    blobs = [value.encode('utf-8') for value in string_ids]
+    offsets = array('I', [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    prefix_size = HEADER.size + 4 * len(offsets) + offsets[-1]
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    temp_path = f"{snapshot_path}.tmp{os.getpid()}"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), len(string_ids)))
+        f.write(offsets.tobytes())
+        f.write(b"".join(blobs))
+        f.write(bytes(_padding(prefix_size)))
+        for column in columns + [sizes, flags]:
+            f.write(column.tobytes())
+    os.replace(temp_path, snapshot_path)
+
+
+class MappedRecords(collections.abc.Sequence):
+    """
+    The operator records of a mapped snapshot, decoded on first access.
+
+    Every column is a view of the mapping, so nothing is copied when a
+    snapshot is opened. A record is decoded the first time it is read, and
+    each distinct string is decoded only once and shared by all records
+    that use it. Holding the records keeps the mapping open.
+    """
+
+    def __init__(self, buffer: mmap.mmap) -> None:
+        """
+        View the records of a mapped snapshot.
+
+        Args:
+            buffer: The mapped snapshot file, with a valid header
+
+        Raises:
+            ValueError: If the file is shorter than its header says
+        """
+        _, _, count, string_count = HEADER.unpack_from(buffer)
+        view = memoryview(buffer)
+        position = HEADER.size + 4 * (string_count + 1)
+        if len(view) < position:
+            raise ValueError("Snapshot file is truncated")
+        self._offsets = _column(view[HEADER.size:position], 'I')
+        self._blob = view[position:position + self._offsets[-1]]
+        position += self._offsets[-1]
+        position += _padding(position)
+        if len(view) < position + 14 * count:
+            raise ValueError("Snapshot file is truncated")
+
+        self.weights = _column(view[position:position + 8 * count], 'd')
+        position += 8 * count
+        self._ids = []
+        for _ in STRING_COLUMNS:
+            self._ids.append(_column(view[position:position + 4 * count], 'I'))
+            position += 4 * count
+        self._sizes = _column(view[position:position + count], 'B')
+        self._flags = _column(view[position + count:position + 2 * count], 'B')
+
+        self._count = count
+        self._records: List[Optional[OperatorRecord]] = [None] * count
+        self._strings: List[Optional[str]] = [None] * string_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, string_id: int) -> str:
+        """Decode a string of the blob, once."""
+        value = self._strings[string_id]
+        if value is None:
+            value = self._strings[string_id] = str(
+                self._blob[self._offsets[string_id]:self._offsets[string_id + 1]], 'utf-8')
+        return value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._count))]
+        record = self._records[index]
+        if record is None:
+            index %= self._count
+            name, country, mcc, mnc = (self._string(ids[index]) for ids in self._ids)
+            record = self._records[index] = OperatorRecord(
+                name, country, mcc, mnc, SIZE_CODES[self._sizes[index]], bool(self._flags[index]))
+        return record
+
+    def __iter__(self) -> Iterator[OperatorRecord]:
+        return map(self.__getitem__, range(self._count))
+
+
+class SnapshotProvider(DataProvider):
+    """
+    A data provider that memory-maps a compiled binary snapshot.
+
+    Loading a snapshot parses no JSON, validates nothing and decodes nothing
+    up front: the file is mapped read-only and its records are decoded when
+    they are first drawn (see MappedRecords). The mapping stays open for as
+    long as the table is used, so its pages come from the OS page cache
+    shared by every process reading the snapshot, and only the pages of the
+    records actually used are read. Filter and code indexes are built on the
+    first filtered draw or lookup.
+    """
+
+    def __init__(self, snapshot_path: str, source_path: Optional[str] = None):
+        """
+        Initialize the snapshot data provider.
+
+        Args:
+            snapshot_path: Path to the compiled snapshot file
+            source_path: Optional JSON data file. If given, the snapshot is
+                         (re)compiled whenever it is missing or older than this file.
+        """
+        self.snapshot_path = snapshot_path
+        self.source_path = source_path
+        self.data = None
+        self._table = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> mmap.mmap:
+        """Compile the snapshot if needed and map it into memory."""
+        if self.source_path is not None and self._is_stale():
+            compile_snapshot(self.source_path, self.snapshot_path)
+
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Snapshot file not found: {self.snapshot_path}")
+        except ValueError:
+            raise ValueError(f"Snapshot file is empty: {self.snapshot_path}")
+
+        magic, version, _, _ = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            buffer.close()
+            raise ValueError(f"Not a telecomfaker snapshot (or an unsupported version): {self.snapshot_path}")
+        return buffer
+
+    def _is_stale(self) -> bool:
+        """Check whether the snapshot is missing, older than its source file or of another format version."""
+        try:
+            if os.stat(self.snapshot_path).st_mtime_ns < os.stat(self.source_path).st_mtime_ns:
+                return True
+            with open(self.snapshot_path, 'rb') as f:
+                header = f.read(HEADER.size)
+        except FileNotFoundError:
+            return True
+        return len(header) < HEADER.size or HEADER.unpack(header)[:2] != (MAGIC, VERSION)
+
+    def get_table(self) -> OperatorTable:
+        """
+        Get the operator table, mapping the snapshot on first use.
+
+        Returns:
+            The OperatorTable for the snapshot
+
+        Raises:
+            FileNotFoundError: If the snapshot (and its source) does not exist
+            ValueError: If the file is not a valid snapshot
+        """
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    records = MappedRecords(self._open())
+                    self._table = OperatorTable(None, records=records, weights=records.weights)
+        return self._table
+
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Get the telecom data in the same shape as the JSON providers.
+
+        The dictionaries are only built when requested; generation uses
+        get_table() and never needs them.
+
+        Returns:
+            A dictionary containing telecom operator data
+        """
+        if self.data is None:
+            table = self.get_table()
+            self.data = {
+                'operators': [
+                    {**record._asdict(), 'size': record.size.value, 'weight': weight}
+                    for record, weight in zip(table.records, table.weights)
+                ]
+            }
+        return self.data
+
+    def invalidate(self) -> None:
+        """
+        Forget the decoded data so the next use maps the snapshot again.
+
+        The old mapping is closed once no table uses it anymore.
+        """
+        with self._lock:
+            self._table = None
+            self.data = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickled copies map the file themselves and share its pages
+        state = self.__dict__.copy()
+        state.update(data=None, _table=None, _lock=None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import NamedTuple, Union, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from telecomfaker.models import TelecomOperator
+
+
+class OperatorSize(str, Enum):
+    """Enum representing the size of a telecom operator."""
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+
+class OperatorRecord(NamedTuple):
+    """
+    Lightweight, immutable record of a telecom operator.
+    
+    Records carry the same fields as TelecomOperator but skip validation and
+    model overhead. They are built once per data set entry and shared, so
+    generating a record allocates nothing. Use record_type="record" to get them.
+    """
+    name: str
+    country: str
+    mcc: str
+    mnc: str
+    size: OperatorSize
+    is_mvno: bool
+    
+    def to_pydantic(self) -> 'TelecomOperator':
+        """
+        Convert the record to a validated TelecomOperator.
+        
+        Returns:
+            A TelecomOperator instance with the same field values
+        """
+        from telecomfaker.models import TelecomOperator
+        
+        return TelecomOperator(**self._asdict())
+
+
+# Any of the types the generator can emit
+Operator = Union['TelecomOperator', OperatorRecord]
+
+# Values accepted by the record_type parameter
+RECORD_TYPES = ("pydantic", "record")
+
+
+def operator_to_dict(operator: Operator) -> Dict[str, Any]:
+    """
+    Convert a TelecomOperator or an OperatorRecord to a dictionary.
+    
+    Args:
+        operator: The operator to convert
+        
+    Returns:
+        A dictionary of the operator's fields
+    """
+    if isinstance(operator, OperatorRecord):
+        return operator._asdict()
+    
+    # model_dump() replaces the deprecated dict() in pydantic 2
+    dump = getattr(operator, 'model_dump', None) or operator.dict
+    return dump()
@@ -0,0 +1,80 @@
+from typing import List, Union, Hashable
+
+Seed = Union[int, float, str, bytes, bytearray]
+
+# SplitMix64 constants: the state increment (the golden ratio in 64 bits) and the mixing multipliers
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MIX_MULTIPLIERS = (0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+MASK64 = (1 << 64) - 1
+
+
+def derive_seed(seed: Seed, *keys: Hashable) -> int:
+    """
+    Derive an independent 64-bit seed for a child random stream.
+    
+    The result depends only on the parent seed and the keys, so it is stable
+    across processes and Python versions (unlike the built-in hash()).
+    
+    Args:
+        seed: The parent seed
+        keys: Values identifying the child stream, e.g. a shard number
+        
+    Returns:
+        A 64-bit integer seed
+    """
+    # Imported here because hashlib is slow to load and rarely needed
+    import hashlib
+    
+    if isinstance(seed, bytearray):
+        seed = bytes(seed)
+    material = repr((seed,) + keys).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), 'big')
+
+
+def splitmix64(key: int, index: int) -> int:
+    """
+    Get output number index of a SplitMix64 generator seeded with key.
+    
+    SplitMix64 advances its state by a constant and hashes it, so any output
+    can be computed directly from the key and the index, in O(1).
+    
+    Args:
+        key: A 64-bit key, e.g. from derive_seed()
+        index: The position in the stream, starting at 0
+        
+    Returns:
+        A 64-bit integer
+    """
+    z = (key + (index + 1) * GOLDEN_GAMMA) & MASK64
+    z = ((z ^ (z >> 30)) * MIX_MULTIPLIERS[0]) & MASK64
+    z = ((z ^ (z >> 27)) * MIX_MULTIPLIERS[1]) & MASK64
+    return z ^ (z >> 31)
+
+
+def counter_uniforms(key: int, start: int, stop: int) -> List[float]:
+    """
+    Get uniform floats in [0, 1) for the positions start to stop - 1 of a keyed stream.
+    
+    Each float takes the top 53 bits of splitmix64(key, position), so it
+    only depends on the key and its position, never on earlier positions.
+    
+    Args:
+        key: A 64-bit key, e.g. from derive_seed()
+        start: The first position
+        stop: The position after the last one
+        
+    Returns:
+        A list of floats, one per position
+    """
+    multiply_low, multiply_high = MIX_MULTIPLIERS
+    mask, gamma, scale = MASK64, GOLDEN_GAMMA, 2.0 ** -53
+    state = (key + start * gamma) & mask
+    result = []
+    append = result.append
+    # splitmix64() inlined, advancing the state instead of recomputing it
+    for _ in range(start, stop):
+        state = (state + gamma) & mask
+        z = ((state ^ (state >> 30)) * multiply_low) & mask
+        z = ((z ^ (z >> 27)) * multiply_high) & mask
+        append(((z ^ (z >> 31)) >> 11) * scale)
+    return result
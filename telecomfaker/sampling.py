@@ -0,0 +1,138 @@
+from array import array
+from random import Random
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+
+class AliasTable:
+    """
+    A Walker/Vose alias table for drawing weighted indices in O(1).
+
+    Building the table is linear in the number of outcomes. Every draw then
+    costs one random number, one multiplication and one comparison, no matter
+    how many outcomes there are or how skewed their weights are.
+    """
+
+    __slots__ = ("outcomes", "probabilities", "aliases")
+
+    def __init__(self, outcomes: Sequence[int], weights: Sequence[float]) -> None:
+        """
+        Build the alias table with Vose's method.
+
+        Args:
+            outcomes: The values to draw, e.g. operator table indices
+            weights: A non-negative weight per outcome
+
+        Raises:
+            ValueError: If there are no outcomes, the lengths differ or the weights do not add up to more than zero
+        """
+        count = len(outcomes)
+        if count == 0:
+            raise ValueError("Cannot build an alias table without outcomes")
+        if len(weights) != count:
+            raise ValueError("Every outcome needs exactly one weight")
+        total = float(sum(weights))
+        if not total > 0:
+            raise ValueError("The weights of the outcomes must add up to more than zero")
+
+        # Scale so the average weight is 1, then pair every under-full slot
+        # with an over-full one that donates the rest of its probability
+        scaled = [weight * count / total for weight in weights]
+        probabilities = array('d', bytes(8 * count))
+        aliases = array('I', bytes(4 * count))
+        small = [slot for slot, value in enumerate(scaled) if value < 1.0]
+        large = [slot for slot, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            lower, upper = small.pop(), large.pop()
+            probabilities[lower] = scaled[lower]
+            aliases[lower] = upper
+            scaled[upper] -= 1.0 - scaled[lower]
+            (small if scaled[upper] < 1.0 else large).append(upper)
+        # Whatever is left is full up to rounding error
+        for slot in small + large:
+            probabilities[slot] = 1.0
+            aliases[slot] = slot
+
+        self.outcomes = outcomes
+        self.probabilities = probabilities
+        # Store the aliased outcomes directly so a draw needs no second lookup
+        self.aliases = [outcomes[slot] for slot in aliases]
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self, rng: Random, k: int) -> List[int]:
+        """
+        Draw k weighted outcomes, with replacement.
+
+        Args:
+            rng: The random stream to draw from
+            k: Number of outcomes to draw
+
+        Returns:
+            A list of k outcomes
+        """
+        outcomes, probabilities, aliases = self.outcomes, self.probabilities, self.aliases
+        count = len(probabilities)
+        random = rng.random
+        result = []
+        append = result.append
+        for _ in range(k):
+            # The integer part picks a slot, the fraction decides slot or alias
+            point = random() * count
+            slot = int(point)
+            append(outcomes[slot] if point - slot < probabilities[slot] else aliases[slot])
+        return result
+
+    def pick(self, uniforms: Iterable[float]) -> List[int]:
+        """
+        Map uniform numbers to weighted outcomes, one outcome per number.
+
+        This is the draw of sample() with the random numbers supplied by the
+        caller, e.g. from a counter-based stream.
+
+        Args:
+            uniforms: Floats in [0, 1)
+
+        Returns:
+            A list of outcomes
+        """
+        outcomes, probabilities, aliases = self.outcomes, self.probabilities, self.aliases
+        count = len(probabilities)
+        result = []
+        append = result.append
+        for uniform in uniforms:
+            point = uniform * count
+            slot = int(point)
+            append(outcomes[slot] if point - slot < probabilities[slot] else aliases[slot])
+        return result
+
+
+def iter_shuffled(population: Sequence[int], rng: Random) -> Iterator[int]:
+    """
+    Lazily yield every element of a population exactly once, in random order.
+
+    This is a Fisher-Yates shuffle that never copies the population: only the
+    positions that have been swapped are remembered, in a dictionary. Taking
+    the first k elements therefore costs O(k) time and memory, no matter how
+    large the population is.
+
+    Args:
+        population: The elements to shuffle, e.g. a bucket of operator indices
+        rng: The random stream to draw from
+
+    Yields:
+        The elements of the population in random order
+    """
+    size = len(population)
+    randbelow = rng.randrange
+    swapped: Dict[int, int] = {}
+    for position in range(size):
+        chosen = position + randbelow(size - position)
+        # Move whatever sits at the current position into the chosen slot; the
+        # current position is never visited again, so forget it
+        current = swapped.pop(position, position)
+        if chosen == position:
+            yield population[current]
+        else:
+            yield population[swapped.get(chosen, chosen)]
+            swapped[chosen] = current
@@ -0,0 +1,275 @@
+import json
+import time
+from typing import Callable, Dict, Any, Iterable, Optional, Sequence, TextIO, Tuple, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from telecomfaker.records import Operator, OperatorRecord, operator_to_dict
+from telecomfaker.table import OperatorTable
+
+if TYPE_CHECKING:
+    from telecomfaker.instrumentation import GenerationStats
+
+# Output formats that can be written from pre-encoded fragments
+FRAGMENT_FORMATS = ("json", "ndjson", "text", "csv", "copy")
+
+# Column order of CSV and COPY rows
+ROW_FIELDS = ("name", "country", "mcc", "mnc", "size", "is_mvno")
+
+# Characters escaped in PostgreSQL's COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# JSON encoder backends; "json" is the default, so output does not depend on
+# whether orjson is installed, and "auto" picks orjson when it is
+BACKENDS = ("auto", "json", "orjson")
+
+# Number of fragments joined into each write
+CHUNK_SIZE = 10000
+
+# Encoded fragments per table, keyed by (format, compact, backend)
+_fragments: 'WeakKeyDictionary[OperatorTable, Dict[Tuple[str, bool, str], Tuple[str, ...]]]' = WeakKeyDictionary()
+
+
+def resolve_backend(backend: str = "json") -> str:
+    """
+    Resolve the JSON backend to use.
+
+    Args:
+        backend: "json", "orjson", or "auto" for orjson when it is installed
+
+    Returns:
+        "json" or "orjson"
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If orjson is requested but not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend!r}. Expected one of: {', '.join(BACKENDS)}")
+    if backend == "json":
+        return backend
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError as e:
+        if backend == "orjson":
+            raise ImportError("orjson is not installed. Install it with: pip install orjson") from e
+        return "json"
+    return "orjson"
+
+
+def json_encoder(backend: str = "json", indent: bool = False, compact: bool = False) -> Callable[[Any], str]:
+    """
+    Get a function that encodes a value as a JSON string.
+
+    Both backends produce the same output for ASCII data. The json backend
+    escapes other characters, orjson writes them as UTF-8, which is why
+    orjson has to be asked for.
+
+    Args:
+        backend: "json", "orjson", or "auto" for orjson when it is installed
+        indent: Indent objects by two spaces per level
+        compact: Leave out the spaces after separators (ignored with indent)
+
+    Returns:
+        An encoding function
+    """
+    if resolve_backend(backend) == "orjson":
+        import orjson
+
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if not indent and not compact:
+            # orjson always writes compact JSON; keep the json module's default spacing
+            return lambda value: json.dumps(value)
+        return lambda value: orjson.dumps(value, option=option).decode("utf-8")
+
+    if indent:
+        return lambda value: json.dumps(value, indent=2)
+    if compact:
+        return lambda value: json.dumps(value, separators=(",", ":"))
+    return json.dumps
+
+
+def format_operator_as_text(operator: Operator) -> str:
+    """Format an operator as plain text."""
+    mvno_status = "MVNO" if operator.is_mvno else "MNO"
+
+    return (
+        f"Operator: {operator.name}\n"
+        f"Country: {operator.country}\n"
+        f"MCC: {operator.mcc}\n"
+        f"MNC: {operator.mnc}\n"
+        f"Size: {operator.size.value}\n"
+        f"Type: {mvno_status}\n"
+    )
+
+
+def operator_row(record: OperatorRecord) -> Tuple[str, str, str, str, str, bool]:
+    """Get the plain column values of an operator in ROW_FIELDS order."""
+    return (record.name, record.country, record.mcc, record.mnc, record.size.value, record.is_mvno)
+
+
+def format_operator_as_csv(record: OperatorRecord) -> str:
+    """Format an operator as one CSV line, like csv.writer with a \\n line terminator."""
+    import csv
+    import io
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(operator_row(record))
+    return buffer.getvalue()
+
+
+def format_operator_as_copy(record: OperatorRecord) -> str:
+    """Format an operator as one line of PostgreSQL's COPY text format (tab-separated, t/f booleans)."""
+    name, country, mcc, mnc, size, is_mvno = operator_row(record)
+    fields = [value.translate(_COPY_ESCAPES) for value in (name, country, mcc, mnc, size)]
+    fields.append("t" if is_mvno else "f")
+    return "\t".join(fields) + "\n"
+
+
+def _fragment_encoder(output_format: str, compact: bool, backend: str) -> Callable[[OperatorRecord], str]:
+    """Get the function that encodes one operator as a fragment of the output."""
+    if output_format == "text":
+        return format_operator_as_text
+    if output_format == "csv":
+        return format_operator_as_csv
+    if output_format == "copy":
+        return format_operator_as_copy
+    if output_format == "ndjson":
+        dumps = json_encoder(backend, compact=compact)
+        return lambda record: f"{dumps(record._asdict())}\n"
+    if output_format == "json":
+        if compact:
+            dumps = json_encoder(backend, compact=True)
+            return lambda record: dumps(record._asdict())
+        # Array items are indented one level deeper than a standalone object
+        dumps = json_encoder(backend, indent=True)
+        return lambda record: dumps(record._asdict()).replace("\n", "\n  ")
+
+    raise ValueError(f"Unknown output format: {output_format!r}. Expected one of: {', '.join(FRAGMENT_FORMATS)}")
+
+
+def encode_fragments(table: OperatorTable, output_format: str, compact: bool = False,
+                     backend: str = "json") -> Tuple[str, ...]:
+    """
+    Get the pre-encoded output fragment of every operator in a table.
+
+    Fragments are encoded once per table and format, so writing a row is a
+    tuple lookup instead of a conversion and an encoder call.
+
+    Args:
+        table: The operator table
+        output_format: One of FRAGMENT_FORMATS
+        compact: Use compact JSON without indentation or spaces
+        backend: The JSON backend, see resolve_backend()
+
+    Returns:
+        One fragment per table index
+
+    Raises:
+        ValueError: If the format or backend is unknown
+    """
+    backend = resolve_backend(backend)
+    key = (output_format, compact, backend)
+    cached = _fragments.setdefault(table, {})
+    fragments = cached.get(key)
+    if fragments is None:
+        fragments = cached[key] = tuple(map(_fragment_encoder(output_format, compact, backend), table.records))
+    return fragments
+
+
+class FragmentWriter:
+    """
+    Writes generated operators by joining their pre-encoded fragments.
+
+    Rows are given as table indices, which is what the generator draws, so
+    no operator objects are created at all. With the json backend, the
+    output matches operators_to_json() and json.dumps() byte for byte.
+
+    A writer produces one output: write() does it all at once, or call
+    write_batch() for every batch and finish() at the end.
+    """
+
+    def __init__(self, table: OperatorTable, output_format: str, compact: bool = False,
+                 backend: str = "json") -> None:
+        """
+        Prepare a writer for a table and format.
+
+        Args:
+            table: The table the indices refer to
+            output_format: One of FRAGMENT_FORMATS
+            compact: Use compact JSON without indentation or spaces
+            backend: The JSON backend, see resolve_backend()
+
+        Raises:
+            ValueError: If the format or backend is unknown
+        """
+        self.fragments = encode_fragments(table, output_format, compact, backend)
+        self.rows = 0
+        # (before the first row, between rows, after the last row, output without rows)
+        if output_format == "json":
+            self.framing = ("[", ",", "]", "[]") if compact else ("[\n  ", ",\n  ", "\n]", "[]")
+        elif output_format == "text":
+            self.framing = ("", "\n", "", "")
+        elif output_format == "csv":
+            header = ",".join(ROW_FIELDS) + "\n"
+            self.framing = (header, "", "", header)
+        else:
+            self.framing = ("", "", "", "")
+
+    def write_batch(self, indices: Sequence[int], out: TextIO) -> None:
+        """
+        Write one batch of rows, CHUNK_SIZE rows per write.
+
+        Args:
+            indices: Table indices of the rows
+            out: The text stream to write to
+        """
+        opening, separator, _, _ = self.framing
+        fragment = self.fragments.__getitem__
+        for start in range(0, len(indices), CHUNK_SIZE):
+            out.write(separator if self.rows else opening)
+            chunk = indices[start:start + CHUNK_SIZE]
+            out.write(separator.join(map(fragment, chunk)))
+            self.rows += len(chunk)
+
+    def finish(self, out: TextIO) -> None:
+        """Write whatever has to follow the last row."""
+        _, _, closing, empty = self.framing
+        out.write(closing if self.rows else empty)
+
+    def write(self, shards: Iterable[Sequence[int]], out: TextIO, stats: Optional['GenerationStats'] = None) -> int:
+        """
+        Write rows to a stream, CHUNK_SIZE rows per write.
+
+        Args:
+            shards: Batches of table indices, e.g. from iter_shard_indices()
+            out: The text stream to write to
+            stats: Optional GenerationStats; writing each shard is recorded as the serialize stage
+
+        Returns:
+            The number of rows written
+        """
+        for indices in shards:
+            if stats is not None:
+                started = time.perf_counter()
+            self.write_batch(indices, out)
+            if stats is not None:
+                stats.record("serialize", time.perf_counter() - started, len(indices))
+        self.finish(out)
+        return self.rows
+
+
+def operators_to_json(operators: Iterable[Operator], compact: bool = False, backend: str = "json") -> str:
+    """
+    Convert operators to a JSON array string.
+
+    Args:
+        operators: TelecomOperator instances or OperatorRecords
+        compact: Use compact JSON without indentation or spaces
+        backend: The JSON backend, see resolve_backend()
+
+    Returns:
+        The JSON string
+    """
+    dumps = json_encoder(backend, indent=not compact, compact=compact)
+    return dumps([operator_to_dict(operator) for operator in operators])
@@ -0,0 +1,394 @@
+import io
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from telecomfaker.serialize import FRAGMENT_FORMATS, FragmentWriter, operator_row
+from telecomfaker.table import OperatorTable
+
+if TYPE_CHECKING:
+    from telecomfaker.instrumentation import GenerationStats
+
+# Compression of file sinks; "auto" picks it from the file name suffix
+COMPRESSIONS = ("auto", "none", "gzip", "zstd")
+
+# File name suffixes that turn on compression with "auto"
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+# Default number of rows handed to a sink at a time
+DEFAULT_BATCH_SIZE = 50000
+
+# Column definitions of the operators table, valid for SQLite and PostgreSQL
+CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS {table} ("
+    "name TEXT NOT NULL, country TEXT NOT NULL, mcc TEXT NOT NULL, mnc TEXT NOT NULL, "
+    "size TEXT NOT NULL, is_mvno BOOLEAN NOT NULL)"
+)
+
+# Database rows per table, shared by all SQLite sinks
+_sql_rows: 'WeakKeyDictionary[OperatorTable, Tuple[tuple, ...]]' = WeakKeyDictionary()
+
+# Marks the end of the batches handed to the I/O thread
+_FINISH = object()
+_ABORT = object()
+
+
+def resolve_compression(path: Optional[str], compression: str = "auto") -> str:
+    """
+    Resolve the compression of a file sink.
+
+    Args:
+        path: The output file name, or None for a stream
+        compression: One of COMPRESSIONS
+
+    Returns:
+        "none", "gzip" or "zstd"
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression!r}. Expected one of: {', '.join(COMPRESSIONS)}")
+    if compression != "auto":
+        return compression
+    suffix = os.path.splitext(path)[1].lower() if path else ""
+    return COMPRESSION_SUFFIXES.get(suffix, "none")
+
+
+def require_zstandard():
+    """
+    Import zstandard, which is an optional dependency.
+
+    Returns:
+        The zstandard module
+
+    Raises:
+        ImportError: If zstandard is not installed
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstandard is required for zstd compression. Install it with: pip install zstandard") from e
+
+    return zstandard
+
+
+def open_output(path: str, compression: str = "auto", level: Optional[int] = None) -> TextIO:
+    """
+    Open a text file for writing, compressed if asked for.
+
+    Args:
+        path: The file to write
+        compression: One of COMPRESSIONS
+        level: The compression level; defaults to 6 for gzip and 3 for zstd
+
+    Returns:
+        A text stream; closing it finishes the compressed data
+
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd is requested but zstandard is not installed
+    """
+    compression = resolve_compression(path, compression)
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6 if level is None else level)
+    if compression == "zstd":
+        zstandard = require_zstandard()
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return io.TextIOWrapper(compressor.stream_writer(open(path, "wb")), encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def _rebatch(shards: Iterable[Sequence[int]], batch_size: int) -> Iterator[Sequence[int]]:
+    """Split shards of table indices into batches of at most batch_size."""
+    for indices in shards:
+        if len(indices) <= batch_size:
+            yield indices
+        else:
+            for start in range(0, len(indices), batch_size):
+                yield indices[start:start + batch_size]
+
+
+class Sink(ABC):
+    """
+    Base class for output sinks that take generated operators in batches.
+
+    The generator hands over table indices, batch by batch. With double
+    buffering, the sink is opened, written and closed in a separate I/O
+    thread, so the next batch is generated while the previous one is
+    written; compression, file writes and SQLite release the GIL while
+    they work. At most one batch waits between the two threads.
+
+    Subclasses implement write_batch(), and open() and close() where they
+    have something to set up or finish.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, double_buffer: bool = True) -> None:
+        """
+        Configure batching.
+
+        Args:
+            batch_size: Maximum rows per write_batch() call
+            double_buffer: Write in a separate I/O thread while the next batch is generated
+
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.batch_size = batch_size
+        self.double_buffer = double_buffer
+
+    def open(self, table: OperatorTable) -> None:
+        """Prepare to receive rows of a table."""
+
+    @abstractmethod
+    def write_batch(self, indices: Sequence[int]) -> None:
+        """Write the operators at the given table indices."""
+
+    def close(self, commit: bool = True) -> None:
+        """
+        Finish the output.
+
+        Args:
+            commit: False if generation failed and written rows should be discarded where possible
+        """
+
+    def consume(self, table: OperatorTable, shards: Iterable[Sequence[int]],
+                stats: Optional['GenerationStats'] = None) -> int:
+        """
+        Write all rows of a generation run.
+
+        Args:
+            table: The table the indices refer to
+            shards: Batches of table indices of any size, e.g. from iter_shard_indices()
+            stats: Optional GenerationStats; every written batch is recorded as the serialize stage
+
+        Returns:
+            The number of rows written
+        """
+        batches = _rebatch(shards, self.batch_size)
+        if self.double_buffer:
+            return self._consume_threaded(table, batches, stats)
+
+        self.open(table)
+        rows = 0
+        try:
+            for batch in batches:
+                self._write(batch, stats)
+                rows += len(batch)
+        except BaseException:
+            self.close(commit=False)
+            raise
+        self.close()
+        return rows
+
+    def _write(self, batch: Sequence[int], stats: Optional['GenerationStats']) -> None:
+        """Write a batch, timing it if stats are enabled."""
+        if stats is None:
+            self.write_batch(batch)
+            return
+        start = time.perf_counter()
+        self.write_batch(batch)
+        stats.record("serialize", time.perf_counter() - start, len(batch))
+
+    def _consume_threaded(self, table: OperatorTable, batches: Iterator[Sequence[int]],
+                          stats: Optional['GenerationStats']) -> int:
+        """Generate batches in this thread and write them in an I/O thread."""
+        # One batch waits while the I/O thread writes the previous one
+        pending: 'queue.Queue[object]' = queue.Queue(maxsize=1)
+        failures: List[BaseException] = []
+
+        def run() -> None:
+            finished = False
+            try:
+                self.open(table)
+                try:
+                    while True:
+                        batch = pending.get()
+                        if batch is _FINISH or batch is _ABORT:
+                            finished = True
+                            break
+                        self._write(batch, stats)
+                except BaseException:
+                    self.close(commit=False)
+                    raise
+                self.close(commit=batch is _FINISH)
+            except BaseException as e:
+                failures.append(e)
+                # Keep taking batches so the generating thread never blocks
+                while not finished:
+                    batch = pending.get()
+                    finished = batch is _FINISH or batch is _ABORT
+
+        writer = threading.Thread(target=run, name="telecomfaker-sink", daemon=True)
+        writer.start()
+        rows = 0
+        end = _ABORT
+        try:
+            for batch in batches:
+                if failures:
+                    break
+                pending.put(batch)
+                rows += len(batch)
+            end = _FINISH
+        finally:
+            pending.put(end)
+            writer.join()
+        if failures:
+            raise failures[0]
+        return rows
+
+
+class StreamSink(Sink):
+    """
+    Writes operators as text to a stream or a file, optionally gzip or zstd compressed.
+
+    Every format of telecomfaker.serialize.FRAGMENT_FORMATS is supported,
+    including "copy", the tab-separated text format of PostgreSQL's COPY
+    command. Rows are joined from fragments encoded once per operator.
+    """
+
+    def __init__(self, target: Union[str, TextIO], output_format: str = "ndjson", compression: str = "auto",
+                 compact: bool = False, backend: str = "json", level: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, double_buffer: bool = True) -> None:
+        """
+        Configure the sink.
+
+        Args:
+            target: A file name, or an open text stream that is flushed but not closed
+            output_format: One of FRAGMENT_FORMATS
+            compression: One of COMPRESSIONS; only used for file names
+            compact: Write JSON without indentation or spaces
+            backend: The JSON encoder, see telecomfaker.serialize.resolve_backend()
+            level: The compression level
+            batch_size: Maximum rows handed to the I/O thread at a time
+            double_buffer: Write in a separate I/O thread while the next batch is generated
+
+        Raises:
+            ValueError: If the format or compression is unknown, or a stream is combined with compression
+        """
+        super().__init__(batch_size, double_buffer)
+        if output_format not in FRAGMENT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format!r}. Expected one of: {', '.join(FRAGMENT_FORMATS)}")
+        path = target if isinstance(target, str) else None
+        self.compression = resolve_compression(path, compression)
+        if path is None and self.compression != "none":
+            raise ValueError("Compression needs an output file name")
+        self.target = target
+        self.output_format = output_format
+        self.compact = compact
+        self.backend = backend
+        self.level = level
+        self._out: Optional[TextIO] = None
+        self._writer: Optional[FragmentWriter] = None
+
+    def open(self, table: OperatorTable) -> None:
+        self._writer = FragmentWriter(table, self.output_format, self.compact, self.backend)
+        if isinstance(self.target, str):
+            self._out = open_output(self.target, self.compression, self.level)
+        else:
+            self._out = self.target
+
+    def write_batch(self, indices: Sequence[int]) -> None:
+        self._writer.write_batch(indices, self._out)
+
+    def close(self, commit: bool = True) -> None:
+        out, self._out = self._out, None
+        if out is None:
+            return
+        if commit:
+            self._writer.finish(out)
+        if out is self.target:
+            out.flush()
+        else:
+            out.close()
+
+
+def sql_rows(table: OperatorTable) -> Tuple[tuple, ...]:
+    """
+    Get the database row of every operator in a table, built once per table.
+
+    Args:
+        table: The operator table
+
+    Returns:
+        One (name, country, mcc, mnc, size, is_mvno) tuple per table index
+    """
+    rows = _sql_rows.get(table)
+    if rows is None:
+        rows = _sql_rows[table] = tuple(map(operator_row, table.records))
+    return rows
+
+
+class SqliteSink(Sink):
+    """
+    Inserts operators into a SQLite database with executemany() in large transactions.
+
+    The table is created if it does not exist. By default every row goes
+    into a single transaction, which is committed when generation
+    finishes and rolled back if it fails.
+    """
+
+    def __init__(self, database: str, table_name: str = "operators", batch_size: int = DEFAULT_BATCH_SIZE,
+                 transaction_rows: Optional[int] = None, double_buffer: bool = True) -> None:
+        """
+        Configure the sink.
+
+        Args:
+            database: Path of the SQLite database file
+            table_name: The table to insert into
+            batch_size: Rows per executemany() call
+            transaction_rows: Commit after at least this many rows; None commits once at the end
+            double_buffer: Insert in a separate I/O thread while the next batch is generated
+
+        Raises:
+            ValueError: If the table name is not a plain identifier or transaction_rows is less than 1
+        """
+        super().__init__(batch_size, double_buffer)
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name!r}")
+        if transaction_rows is not None and transaction_rows < 1:
+            raise ValueError("Transaction rows must be at least 1")
+        self.database = database
+        self.table_name = table_name
+        self.transaction_rows = transaction_rows
+        self._connection = None
+        self._rows: Sequence[tuple] = ()
+        self._uncommitted = 0
+
+    def open(self, table: OperatorTable) -> None:
+        # Deferred so the CLI does not pay for sqlite3 unless it is used
+        import sqlite3
+
+        self._rows = sql_rows(table)
+        # Transactions are started and committed explicitly
+        self._connection = sqlite3.connect(self.database, isolation_level=None)
+        self._connection.execute(CREATE_TABLE_SQL.format(table=self.table_name))
+        self._connection.execute("BEGIN")
+        self._uncommitted = 0
+
+    def write_batch(self, indices: Sequence[int]) -> None:
+        connection = self._connection
+        connection.executemany(f"INSERT INTO {self.table_name} VALUES (?, ?, ?, ?, ?, ?)",
+                               map(self._rows.__getitem__, indices))
+        self._uncommitted += len(indices)
+        if self.transaction_rows is not None and self._uncommitted >= self.transaction_rows:
+            connection.execute("COMMIT")
+            connection.execute("BEGIN")
+            self._uncommitted = 0
+
+    def close(self, commit: bool = True) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.execute("COMMIT" if commit else "ROLLBACK")
+        finally:
+            connection.close()
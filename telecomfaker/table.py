@@ -0,0 +1,520 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Any, Iterable, List, Set, Tuple, Optional, Sequence, Union, TYPE_CHECKING
+
+from telecomfaker.columns import ColumnEncoding
+from telecomfaker.records import OperatorSize, OperatorRecord
+from telecomfaker.sampling import AliasTable
+
+if TYPE_CHECKING:
+    from telecomfaker.models import TelecomOperator
+
+
+# (country, mcc, size, is_mvno), with None meaning "any value"
+FilterKey = Tuple[Optional[str], Optional[str], Optional[OperatorSize], Optional[bool]]
+
+# The filter key of the unfiltered bucket
+ANY: FilterKey = (None, None, None, None)
+
+# Market-share weights for operators whose data has no weight of its own
+SIZE_WEIGHTS: Dict[OperatorSize, float] = {
+    OperatorSize.SMALL: 1.0,
+    OperatorSize.MEDIUM: 5.0,
+    OperatorSize.LARGE: 25.0,
+}
+
+# Data fields that carry an operator's weight, in order of precedence
+WEIGHT_FIELDS = ('weight', 'subscribers')
+
+
+def normalize_operator(operator_data: Dict[str, Any]) -> OperatorRecord:
+    """
+    Normalize and validate a raw operator entry from a data source.
+
+    Well-typed entries are checked without importing pydantic. Entries with
+    loosely typed values, e.g. "is_mvno": 0, fall back to TelecomOperator
+    validation, so they are coerced exactly as the pydantic model would.
+
+    Args:
+        operator_data: A raw operator dictionary as returned by a data provider
+
+    Returns:
+        A validated OperatorRecord
+
+    Raises:
+        ValueError: If a field has a value the TelecomOperator model rejects
+    """
+    # Convert size string to enum if needed
+    size = operator_data.get('size', 'medium')
+    if isinstance(size, str):
+        try:
+            size = OperatorSize(size.lower())
+        except ValueError:
+            size = OperatorSize.MEDIUM
+
+    record = OperatorRecord(
+        name=operator_data.get('name', ''),
+        country=operator_data.get('country', ''),
+        mcc=operator_data.get('mcc', ''),
+        mnc=operator_data.get('mnc', ''),
+        size=size,
+        is_mvno=operator_data.get('is_mvno', False)
+    )
+    if (all(isinstance(value, str) for value in record[:4]) and isinstance(record.size, OperatorSize)
+            and isinstance(record.is_mvno, bool)):
+        return record
+
+    # Deferred so pydantic is only imported for data that needs coercion
+    from telecomfaker.models import TelecomOperator
+
+    # pydantic's ValidationError is a ValueError
+    operator = TelecomOperator(**record._asdict())
+    return OperatorRecord(operator.name, operator.country, operator.mcc, operator.mnc, operator.size,
+                          operator.is_mvno)
+
+
+def operator_weight(operator_data: Dict[str, Any], size: OperatorSize) -> float:
+    """
+    Get the market-share weight of a raw operator entry.
+
+    The weight comes from the entry's weight or subscribers field. Entries
+    without either are weighted by their size (see SIZE_WEIGHTS).
+
+    Args:
+        operator_data: A raw operator dictionary as returned by a data provider
+        size: The operator's normalized size
+
+    Returns:
+        A non-negative weight
+
+    Raises:
+        ValueError: If the weight is not a non-negative number
+    """
+    for field in WEIGHT_FIELDS:
+        value = operator_data.get(field)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not value >= 0:
+            raise ValueError(f"Invalid operator {field}: {value!r} is not a non-negative number")
+        return float(value)
+
+    return SIZE_WEIGHTS[size]
+
+
+def _single_key(field: int, value: Any) -> FilterKey:
+    """The filter key that matches one attribute value."""
+    return (None,) * field + (value,) + (None,) * (3 - field)
+
+
+def _prefix_claims(mcc: str, mnc: str) -> Tuple[str, ...]:
+    """The flattened IMSI prefixes an (MCC, MNC) pair claims, see OperatorTable._build_code_index()."""
+    prefix = f"{mcc}{mnc}"
+    if len(prefix) >= 6:
+        return (prefix[:6],)
+    return tuple(f"{prefix}{digit}" for digit in "0123456789")
+
+
+class OperatorTable:
+    """
+    A precomputed, read-only view of the operators of a data source.
+
+    The table is built once per loaded data set. Every entry is normalized
+    and validated up front, so generating a row only means drawing an index
+    and handing out the matching record (or a copy of the matching model).
+    The filter and code indexes are built on first use, so unfiltered
+    generation never pays for them.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]],
+                 records: Optional[Sequence[OperatorRecord]] = None,
+                 weights: Optional[Sequence[float]] = None) -> None:
+        """
+        Build the table from provider data.
+
+        Args:
+            data: The dictionary returned by a data provider's get_data()
+            records: Already validated records, e.g. from a compiled snapshot.
+                     If given, the operators in data are not parsed. Lists are
+                     copied; other sequences, e.g. records decoded lazily from
+                     a mapped snapshot, are used as they are.
+            weights: The market-share weight of every record. Defaults to the
+                     weights of the parsed data, or to size-based weights if
+                     records are given. Like records, only lists are copied.
+        """
+        self.source = data
+        if records is None:
+            operators = data.get('operators', [])
+            records = [normalize_operator(operator_data) for operator_data in operators]
+            if weights is None:
+                weights = [operator_weight(operator_data, record.size)
+                           for operator_data, record in zip(operators, records)]
+        self.records: Sequence[OperatorRecord] = tuple(records) if isinstance(records, list) else records
+        if weights is None:
+            weights = [SIZE_WEIGHTS[record.size] for record in self.records]
+        self.weights: Sequence[float] = array('d', weights) if isinstance(weights, list) else weights
+        self._alias_tables: Dict[int, Tuple[Sequence[int], AliasTable]] = {}
+        # The unfiltered bucket draws exactly like choosing from the full list
+        self._everything = range(len(self.records))
+        self._filters: Optional[List[Tuple[str, str, OperatorSize, bool]]] = None
+        self._buckets: Optional[Dict[FilterKey, Sequence[int]]] = None
+        # Buckets of combined filters, derived from the single-attribute ones on first use
+        self._combined: Dict[FilterKey, Sequence[int]] = {}
+        self._codes: Optional[Dict[Tuple[str, str], int]] = None
+        self._imsi_prefixes: Optional[Dict[str, int]] = None
+        self._operators: Optional[Tuple['TelecomOperator', ...]] = None
+        self._columns: Optional[ColumnEncoding] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get the records and weights; the indexes and models
+        # are rebuilt there on first use, and the provider data is not needed
+        records = self.records if isinstance(self.records, tuple) else tuple(self.records)
+        return {'records': records, 'weights': array('d', self.weights)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(None, records=list(state['records']), weights=list(state['weights']))
+
+    @property
+    def operators(self) -> Tuple['TelecomOperator', ...]:
+        """
+        The validated TelecomOperator models, one per record.
+
+        Built on first access, so pydantic is only imported once a model is needed.
+        """
+        if self._operators is None:
+            from telecomfaker.models import TelecomOperator
+
+            self._operators = tuple(TelecomOperator(**record._asdict()) for record in self.records)
+        return self._operators
+
+    @property
+    def buckets(self) -> Dict[FilterKey, Sequence[int]]:
+        """Operator indices by single filter attribute, built on first access (see _build_buckets())."""
+        if self._buckets is None:
+            buckets = self._build_buckets(self.records)
+            buckets[ANY] = self._everything
+            self._buckets = buckets
+        return self._buckets
+
+    @property
+    def codes(self) -> Dict[Tuple[str, str], int]:
+        """Operator indices by (MCC, MNC), built on first access."""
+        if self._codes is None:
+            self._codes, self._imsi_prefixes = self._build_code_index(self.records)
+        return self._codes
+
+    @property
+    def imsi_prefixes(self) -> Dict[str, int]:
+        """Operator indices by 6-digit IMSI prefix, built on first access."""
+        if self._imsi_prefixes is None:
+            self._codes, self._imsi_prefixes = self._build_code_index(self.records)
+        return self._imsi_prefixes
+
+    @property
+    def _filter_values(self) -> List[Tuple[str, str, OperatorSize, bool]]:
+        """The (country, mcc, size, is_mvno) of every record, built on first access."""
+        if self._filters is None:
+            self._filters = [(r.country, r.mcc, r.size, r.is_mvno) for r in self.records]
+        return self._filters
+
+    @property
+    def columns(self) -> ColumnEncoding:
+        """
+        The per-operator column codes used by columnar output.
+
+        Built on first access, since only the columnar paths need them.
+        """
+        if self._columns is None:
+            self._columns = ColumnEncoding(self.records)
+        return self._columns
+
+    def warm_from(self, previous: 'OperatorTable') -> None:
+        """
+        Build the lazy parts of the table that a previous version already built.
+
+        Models of records that did not change are reused instead of being
+        validated again. Call this before publishing a replacement table, so
+        readers of the new table never pay for building them.
+
+        Args:
+            previous: The table this one replaces
+        """
+        if previous._operators is not None:
+            from telecomfaker.models import TelecomOperator
+
+            models = dict(zip(previous.records, previous._operators))
+            self._operators = tuple(
+                models[record] if record in models else TelecomOperator(**record._asdict())
+                for record in self.records
+            )
+        if previous._columns is not None:
+            self.columns
+
+    def patched(self, data: Optional[Dict[str, Any]], records: Sequence[OperatorRecord],
+                weights: Sequence[float], positions: Iterable[int]) -> 'OperatorTable':
+        """
+        Build the table for an updated list of records by patching this table's indexes.
+
+        Only the buckets, codes and IMSI prefixes of the given positions are
+        updated, and models of unchanged records are reused. This table is
+        not modified, so readers still using it are unaffected.
+
+        Args:
+            data: The provider data of the new version
+            records: The records of the new version
+            weights: The weight of every new record
+            positions: Every position whose record differs between this table
+                       and the new version, including positions that only
+                       exist in one of them
+
+        Returns:
+            A new OperatorTable
+        """
+        old, new = self.records, tuple(records)
+        positions = sorted(set(positions))
+
+        table = object.__new__(type(self))
+        table.source = data
+        table.records = new
+        table.weights = array('d', weights)
+        table._alias_tables = {}
+        table._combined = {}
+        table._columns = None
+
+        filter_values = self._filter_values[:len(new)]
+        filter_values.extend([None] * (len(new) - len(filter_values)))
+        removals: Dict[FilterKey, List[int]] = {}
+        additions: Dict[FilterKey, List[int]] = {}
+        for position in positions:
+            before = self._filter_values[position] if position < len(old) else None
+            after = None
+            if position < len(new):
+                record = new[position]
+                after = filter_values[position] = (record.country, record.mcc, record.size, record.is_mvno)
+            for field in range(4):
+                if before is not None and after is not None and before[field] == after[field]:
+                    continue
+                if before is not None:
+                    removals.setdefault(_single_key(field, before[field]), []).append(position)
+                if after is not None:
+                    additions.setdefault(_single_key(field, after[field]), []).append(position)
+        table._filters = filter_values
+
+        # Combined buckets live apart and are derived again lazily, so this
+        # copy never races with a generation thread caching one on this table
+        buckets = dict(self.buckets)
+        for key in removals.keys() | additions.keys():
+            bucket = list(buckets.get(key, ()))
+            for position in removals.get(key, ()):
+                del bucket[bisect_left(bucket, position)]
+            for position in additions.get(key, ()):
+                insort(bucket, position)
+            if bucket:
+                buckets[key] = tuple(bucket)
+            else:
+                buckets.pop(key, None)
+        table._everything = buckets[ANY] = range(len(new))
+        table._buckets = buckets
+
+        table._codes, table._imsi_prefixes = self._patch_code_index(table, positions)
+
+        table._operators = None
+        if self._operators is not None:
+            from telecomfaker.models import TelecomOperator
+
+            reusable = {old[position]: self._operators[position] for position in positions if position < len(old)}
+            operators = list(self._operators[:len(new)])
+            operators.extend([None] * (len(new) - len(operators)))
+            for position in positions:
+                if position < len(new):
+                    record = new[position]
+                    model = reusable.get(record)
+                    operators[position] = model if model is not None else TelecomOperator(**record._asdict())
+            table._operators = tuple(operators)
+        if self._columns is not None:
+            table.columns
+
+        return table
+
+    def _patch_code_index(self, table: 'OperatorTable',
+                          positions: Sequence[int]) -> Tuple[Dict[Tuple[str, str], int], Dict[str, int]]:
+        """
+        Update the code and IMSI prefix indexes for the changed positions of a patched table.
+
+        Every affected code and prefix is resolved again with the same
+        precedence as _build_code_index(), looking only at the operators
+        with the same MCC.
+        """
+        old, new = self.records, table.records
+        affected: Set[Tuple[str, str]] = set()
+        for position in positions:
+            if position < len(old):
+                affected.add((old[position].mcc, old[position].mnc))
+            if position < len(new):
+                affected.add((new[position].mcc, new[position].mnc))
+
+        codes = dict(self.codes)
+        for mcc, mnc in affected:
+            bucket = table.buckets.get((None, mcc, None, None), ())
+            owner = next((index for index in bucket if new[index].mnc == mnc), None)
+            if owner is None:
+                codes.pop((mcc, mnc), None)
+            else:
+                codes[(mcc, mnc)] = owner
+
+        imsi_prefixes = dict(self.imsi_prefixes)
+        for prefix in {claim for code in affected for claim in _prefix_claims(*code)}:
+            # Longer MNCs win, then the operator that comes first
+            claims = [
+                (-len(mnc), index) for (mcc, mnc), index in (
+                    ((new[index].mcc, new[index].mnc), index)
+                    for index in table.buckets.get((None, prefix[:3], None, None), ())
+                )
+                if codes.get((mcc, mnc)) == index and prefix in _prefix_claims(mcc, mnc)
+            ]
+            if claims:
+                imsi_prefixes[prefix] = min(claims)[1]
+            else:
+                imsi_prefixes.pop(prefix, None)
+
+        return codes, imsi_prefixes
+
+    @staticmethod
+    def _build_buckets(operators: Sequence[OperatorRecord]) -> Dict[FilterKey, Sequence[int]]:
+        """
+        Bucket operator indices by each single filter attribute.
+
+        Buckets for combined filters are derived from these on first use
+        (see select()), which keeps building the table linear in the number
+        of operators even for very large data sets.
+        """
+        buckets: Dict[FilterKey, list] = {}
+        for index, operator in enumerate(operators):
+            values = (operator.country, operator.mcc, operator.size, operator.is_mvno)
+            for field, value in enumerate(values):
+                buckets.setdefault(_single_key(field, value), []).append(index)
+
+        return {key: tuple(indices) for key, indices in buckets.items()}
+
+    def _combine_buckets(self, key: FilterKey) -> Sequence[int]:
+        """
+        Build the bucket for a combination of filters from the single-attribute buckets.
+
+        Only the smallest matching bucket is scanned. The result is cached, so
+        every later draw with the same filters is a single lookup.
+        """
+        singles = []
+        for position, value in enumerate(key):
+            if value is not None:
+                singles.append((self.buckets.get(_single_key(position, value), ()), position, value))
+        smallest, _, _ = min(singles, key=lambda bucket: len(bucket[0]))
+
+        fields = [(position, value) for _, position, value in singles]
+        bucket = tuple(
+            index for index in smallest
+            if all(self._filter_values[index][position] == value for position, value in fields)
+        )
+        self._combined[key] = bucket
+        return bucket
+
+    @staticmethod
+    def _build_code_index(operators: Sequence[OperatorRecord]) -> Tuple[Dict[Tuple[str, str], int], Dict[str, int]]:
+        """
+        Index operator positions by (MCC, MNC) and by IMSI prefix.
+
+        IMSI prefixes are flattened to six digits: a 3-digit MNC claims its own
+        prefix, and a 2-digit MNC claims the ten prefixes it extends to unless a
+        3-digit MNC already owns them. Longest-prefix matching then becomes a
+        single dictionary lookup on the first six digits of an IMSI.
+        """
+        codes: Dict[Tuple[str, str], int] = {}
+        for index, operator in enumerate(operators):
+            codes.setdefault((operator.mcc, operator.mnc), index)
+
+        imsi_prefixes: Dict[str, int] = {}
+        # Register longer codes first so they take precedence
+        for (mcc, mnc), index in sorted(codes.items(), key=lambda item: -len(item[0][1])):
+            for prefix in _prefix_claims(mcc, mnc):
+                imsi_prefixes.setdefault(prefix, index)
+
+        return codes, imsi_prefixes
+
+    def alias_table(self, candidates: Sequence[int]) -> AliasTable:
+        """
+        Get the alias table for weighted draws from a bucket of operator indices.
+
+        Alias tables are built on first use and cached per bucket. Buckets
+        returned by select() are cached too, so every weighted draw with the
+        same filters reuses one table.
+
+        Args:
+            candidates: A bucket of operator indices, as returned by select()
+
+        Returns:
+            An AliasTable drawing from the candidates by market share
+
+        Raises:
+            ValueError: If all candidates have a weight of zero
+        """
+        # The cache holds on to the bucket, so its id cannot be reused while cached
+        cached = self._alias_tables.get(id(candidates))
+        if cached is not None and cached[0] is candidates:
+            return cached[1]
+
+        weights = self.weights
+        alias_table = AliasTable(candidates, [weights[index] for index in candidates])
+        self._alias_tables[id(candidates)] = (candidates, alias_table)
+        return alias_table
+
+    def find(self, mcc: str, mnc: str) -> Optional[int]:
+        """
+        Get the index of the operator with the given MCC and MNC.
+
+        Returns:
+            The operator index, or None if no operator has these codes
+        """
+        return self.codes.get((mcc, mnc))
+
+    def find_imsi(self, imsi: str) -> Optional[int]:
+        """
+        Get the index of the operator that issued an IMSI.
+
+        A 3-digit MNC match takes precedence over a 2-digit one.
+
+        Returns:
+            The operator index, or None if no operator matches the IMSI
+        """
+        return self.imsi_prefixes.get(imsi[:6])
+
+    def select(self, country: Optional[str] = None, mcc: Optional[str] = None,
+               size: Optional[Union[OperatorSize, str]] = None,
+               is_mvno: Optional[bool] = None) -> Sequence[int]:
+        """
+        Get the indices of all operators matching the given filters.
+
+        Args:
+            country: Only include operators from this country
+            mcc: Only include operators with this Mobile Country Code
+            size: Only include operators of this size
+            is_mvno: Only include MVNOs (True) or network operators (False)
+
+        Returns:
+            A sequence of operator indices, empty if nothing matches
+
+        Raises:
+            ValueError: If size is not a valid operator size
+        """
+        if isinstance(size, str):
+            size = OperatorSize(size.lower())
+
+        key = (country, mcc, size, is_mvno)
+        if key == ANY:
+            return self._everything
+        if sum(value is not None for value in key) == 1:
+            return self.buckets.get(key, ())
+        bucket = self._combined.get(key)
+        if bucket is not None:
+            return bucket
+        return self._combine_buckets(key)
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Synthetic call, SMS and data records (CDRs) built on the operator data.
+
+Run with: telecomfaker traffic --count 100000 --rate 5000 --format ndjson
+"""
+
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass, field
+from itertools import accumulate
+from math import ceil, log
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple, TYPE_CHECKING
+
+from telecomfaker.records import OperatorRecord
+
+if TYPE_CHECKING:
+    from telecomfaker.faker import TelecomFaker
+
+# Kinds of traffic events
+EVENT_TYPES = ("voice", "sms", "data")
+
+# How event timestamps are spaced: exponential gaps (a Poisson process) or fixed gaps
+ARRIVALS = ("poisson", "constant")
+
+# Draws of a visited network that may land in the home country before giving up on rejection sampling
+MAX_REJECTIONS = 32
+
+
+class TrafficEvent(NamedTuple):
+    """One call detail record."""
+
+    timestamp: float
+    event_type: str
+    imsi: str
+    msisdn: str
+    home_mcc: str
+    home_mnc: str
+    visited_mcc: str
+    visited_mnc: str
+    roaming: bool
+    duration: int
+    volume: int
+
+
+# Column order of CSV output
+EVENT_FIELDS = TrafficEvent._fields
+
+
+@dataclass(frozen=True)
+class TrafficProfile:
+    """
+    The distributions traffic events are drawn from.
+
+    Settings are checked when the profile is created.
+
+    Attributes:
+        mix: Relative share of each event type, e.g. {"voice": 1, "data": 3}
+        roaming_rate: Fraction of events made on a network in another country (MCC)
+        arrivals: "poisson" for exponential gaps between events, "constant" for fixed gaps
+        mean_call_duration: Mean voice call duration in seconds (exponentially distributed)
+        mean_session_duration: Mean data session duration in seconds (exponentially distributed)
+        median_data_volume: Median bytes of a data session (log-normally distributed)
+        data_volume_sigma: Spread of data volumes; the sigma of the underlying normal distribution
+        subscribers_per_operator: Number of distinct subscribers that make the traffic of an operator
+
+    Raises:
+        ValueError: If a setting is out of range
+    """
+
+    mix: Dict[str, float] = field(default_factory=lambda: {"voice": 0.3, "sms": 0.2, "data": 0.5})
+    roaming_rate: float = 0.05
+    arrivals: str = "poisson"
+    mean_call_duration: float = 90.0
+    mean_session_duration: float = 90.0
+    median_data_volume: float = 500000.0
+    data_volume_sigma: float = 1.0
+    subscribers_per_operator: int = 1000
+
+    def __post_init__(self) -> None:
+        unknown = set(self.mix) - set(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}. Expected: {', '.join(EVENT_TYPES)}")
+        if any(share < 0 for share in self.mix.values()):
+            raise ValueError("Event shares must not be negative")
+        if not sum(self.mix.values()) > 0:
+            raise ValueError("The event mix must add up to more than zero")
+        if not 0.0 <= self.roaming_rate <= 1.0:
+            raise ValueError("Roaming rate must be between 0 and 1")
+        if self.arrivals not in ARRIVALS:
+            raise ValueError(f"Unknown arrivals: {self.arrivals!r}. Expected one of: {', '.join(ARRIVALS)}")
+        if not self.mean_call_duration > 0:
+            raise ValueError("Mean call duration must be greater than zero")
+        if not self.mean_session_duration > 0:
+            raise ValueError("Mean session duration must be greater than zero")
+        if not self.median_data_volume > 0:
+            raise ValueError("Median data volume must be greater than zero")
+        if not self.data_volume_sigma >= 0:
+            raise ValueError("Data volume sigma must not be negative")
+        if self.subscribers_per_operator < 1:
+            raise ValueError("Subscribers per operator must be at least 1")
+
+
+class TrafficGenerator:
+    """
+    Generates a stream of timestamped traffic events.
+
+    Each event belongs to a subscriber of a home operator drawn from the data
+    set (weighted by market share if the TelecomFaker is). Roaming events are
+    made on a visited operator with a different MCC; all other events on the
+    home network. Timestamps advance at the target rate, so the stream
+    describes that many events per second of traffic.
+
+    Events are drawn a batch at a time and only a pool of subscribers per
+    operator in use is kept, so memory stays bounded however long the
+    stream runs.
+    """
+
+    def __init__(self, faker: 'TelecomFaker', rate: float = 1000.0,
+                 profile: Optional[TrafficProfile] = None, start: Optional[float] = None) -> None:
+        """
+        Set up the generator.
+
+        Args:
+            faker: The TelecomFaker whose data, weighting and random stream are used
+            rate: Target events per second of traffic
+            profile: The distributions to draw from. Defaults to TrafficProfile().
+            start: Timestamp of the start of the stream, in seconds since the epoch.
+                   Defaults to the current time.
+
+        Raises:
+            ValueError: If the rate is not greater than zero
+            RuntimeError: If the data source is unavailable
+        """
+        if not rate > 0:
+            raise ValueError("Rate must be greater than zero")
+        if profile is None:
+            profile = TrafficProfile()
+
+        self.faker = faker
+        self.random = faker.random
+        self.rate = rate
+        self.profile = profile
+        self.start = time.time() if start is None else start
+        # Timestamp of the last event so far, and the number of events so far
+        self.clock = self.start
+        self.emitted = 0
+        self.table = faker._load_table()
+        self._everyone = self.table.select()
+        self._types = list(profile.mix)
+        self._type_weights = list(accumulate(profile.mix.values()))
+        self._subscribers: Dict[int, Sequence[Tuple[str, str]]] = {}
+        # Operators outside each MCC, for data sets where rejection sampling keeps failing
+        self._abroad: Dict[str, Sequence[int]] = {}
+
+    def _subscriber_pool(self, index: int) -> Sequence[Tuple[str, str]]:
+        """Get the (IMSI, MSISDN) pairs of an operator's subscribers, creating them on first use."""
+        pool = self._subscribers.get(index)
+        if pool is None:
+            numbers = self.faker.numbering(self.table.records[index])
+            count = self.profile.subscribers_per_operator
+            imsis = numbers.imsis(count)
+            # Operators of countries without a known calling code still get IMSIs
+            msisdns = numbers.msisdns(count) if numbers.calling_code is not None else [""] * count
+            pool = self._subscribers[index] = list(zip(imsis, msisdns))
+        return pool
+
+    def _visit_abroad(self, home: OperatorRecord, draw: int) -> Optional[int]:
+        """
+        Pick a visited operator in another country than the home operator.
+
+        Args:
+            home: The roaming subscriber's operator
+            draw: An operator index already drawn for this event
+
+        Returns:
+            A table index, or None if every operator shares the home MCC
+        """
+        records = self.table.records
+        for _ in range(MAX_REJECTIONS):
+            if records[draw].mcc != home.mcc:
+                return draw
+            draw = self.faker._sample_indices(self.table, self._everyone, 1)[0]
+
+        abroad = self._abroad.get(home.mcc)
+        if abroad is None:
+            abroad = self._abroad[home.mcc] = [index for index in self._everyone if records[index].mcc != home.mcc]
+        return self.random.choice(abroad) if abroad else None
+
+    def _timestamps(self, count: int) -> List[float]:
+        """Advance the clock by count events."""
+        start, rate, emitted = self.start, self.rate, self.emitted
+        if self.profile.arrivals == "constant":
+            # Counted from the start so rounding errors do not add up
+            stamps = [start + position / rate for position in range(emitted + 1, emitted + count + 1)]
+        else:
+            expovariate = self.random.expovariate
+            stamps = list(accumulate((expovariate(rate) for _ in range(count)), initial=self.clock))[1:]
+        self.clock = stamps[-1]
+        self.emitted = emitted + count
+        return stamps
+
+    def batch(self, count: int) -> List[TrafficEvent]:
+        """
+        Generate the next count events of the stream.
+
+        Args:
+            count: Number of events
+
+        Returns:
+            A list of events in timestamp order
+
+        Raises:
+            ValueError: If count is less than 1
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+
+        profile, rng, table = self.profile, self.random, self.table
+        records = table.records
+        stamps = self._timestamps(count)
+        types = rng.choices(self._types, cum_weights=self._type_weights, k=count)
+        homes = self.faker._sample_indices(table, self._everyone, count)
+        visits = self.faker._sample_indices(table, self._everyone, count) if profile.roaming_rate else homes
+
+        random_value, expovariate, lognormvariate = rng.random, rng.expovariate, rng.lognormvariate
+        roaming_rate = profile.roaming_rate
+        call_rate = 1.0 / profile.mean_call_duration
+        session_rate = 1.0 / profile.mean_session_duration
+        volume_mu, volume_sigma = log(profile.median_data_volume), profile.data_volume_sigma
+
+        events = []
+        append = events.append
+        for timestamp, event_type, home_index, visit_index in zip(stamps, types, homes, visits):
+            home = records[home_index]
+            visited = home
+            if roaming_rate and random_value() < roaming_rate:
+                abroad = self._visit_abroad(home, visit_index)
+                if abroad is not None:
+                    visited = records[abroad]
+            imsi, msisdn = rng.choice(self._subscriber_pool(home_index))
+
+            duration = volume = 0
+            if event_type == "voice":
+                duration = max(1, ceil(expovariate(call_rate)))
+            elif event_type == "data":
+                duration = max(1, ceil(expovariate(session_rate)))
+                volume = int(lognormvariate(volume_mu, volume_sigma))
+            append(TrafficEvent(timestamp, event_type, imsi, msisdn, home.mcc, home.mnc,
+                                visited.mcc, visited.mnc, visited is not home, duration, volume))
+        return events
+
+    def stream(self, count: Optional[int] = None, batch_size: int = 1000) -> Iterator[List[TrafficEvent]]:
+        """
+        Generate events lazily, batch by batch.
+
+        Args:
+            count: Number of events. If None, generates indefinitely.
+            batch_size: Number of events per batch
+
+        Yields:
+            Lists of at most batch_size events
+
+        Raises:
+            ValueError: If count or batch_size is less than 1
+        """
+        if count is not None and count < 1:
+            raise ValueError("Count must be at least 1")
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        return self._stream(count, batch_size)
+
+    def _stream(self, count: Optional[int], batch_size: int) -> Iterator[List[TrafficEvent]]:
+        """Yield batches for stream()."""
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            yield self.batch(size)
+            if remaining is not None:
+                remaining -= size
+
+    def replay(self, count: Optional[int] = None, batch_size: int = 1000, speed: float = 1.0,
+               clock: Callable[[], float] = time.monotonic,
+               sleep: Callable[[float], None] = time.sleep) -> Iterator[List[TrafficEvent]]:
+        """
+        Generate events in real time, e.g. to replay traffic against a local sink.
+
+        Each batch is held back until the wall-clock time since the start
+        of the replay catches up with its last event, so events arrive at
+        the target rate times speed.
+
+        Args:
+            count: Number of events. If None, replays indefinitely.
+            batch_size: Number of events per batch; smaller batches arrive more smoothly
+            speed: Replay speed; 2.0 replays twice as fast as real time
+            clock: Monotonic clock, in seconds
+            sleep: Function that waits for a number of seconds
+
+        Yields:
+            Lists of at most batch_size events
+
+        Raises:
+            ValueError: If count or batch_size is less than 1 or speed is not positive
+        """
+        if not speed > 0:
+            raise ValueError("Speed must be greater than zero")
+        batches = self.stream(count, batch_size)
+        return self._replay(batches, speed, clock, sleep)
+
+    def _replay(self, batches: Iterator[List[TrafficEvent]], speed: float,
+                clock: Callable[[], float], sleep: Callable[[float], None]) -> Iterator[List[TrafficEvent]]:
+        """Pace batches for replay()."""
+        origin = clock()
+        first = self.clock
+        for batch in batches:
+            delay = (batch[-1].timestamp - first) / speed - (clock() - origin)
+            if delay > 0:
+                sleep(delay)
+            yield batch
+
+
+def write_ndjson(batches: Iterator[List[TrafficEvent]], out: TextIO) -> int:
+    """Write events as newline-delimited JSON, flushing after every batch. Returns the number of events."""
+    from telecomfaker.serialize import json_encoder
+
+    dumps = json_encoder()
+    rows = 0
+    for batch in batches:
+        out.write("".join([f"{dumps(event._asdict())}\n" for event in batch]))
+        out.flush()
+        rows += len(batch)
+    return rows
+
+
+def write_csv(batches: Iterator[List[TrafficEvent]], out: TextIO) -> int:
+    """Write events as CSV with a header row, flushing after every batch. Returns the number of events."""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(EVENT_FIELDS)
+    rows = 0
+    for batch in batches:
+        writer.writerows(batch)
+        out.flush()
+        rows += len(batch)
+    return rows
+
+
+WRITERS = {
+    "ndjson": write_ndjson,
+    "csv": write_csv,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Generate traffic events from the command line."""
+    from telecomfaker import TelecomFaker
+
+    parser = argparse.ArgumentParser(prog="telecomfaker traffic", description="Generate synthetic traffic events (CDRs).")
+    parser.add_argument("--count", type=int, help="Number of events (default: unlimited)")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Target events per second (default: 1000)")
+    parser.add_argument("--roaming-rate", type=float, default=TrafficProfile().roaming_rate,
+                        help=f"Fraction of roaming events (default: {TrafficProfile().roaming_rate})")
+    parser.add_argument("--mix", default="voice=0.3,sms=0.2,data=0.5",
+                        help="Share of each event type (default: voice=0.3,sms=0.2,data=0.5)")
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="poisson", help="Spacing of events (default: poisson)")
+    parser.add_argument("--start", type=float, help="Timestamp of the first event in seconds since the epoch (default: now)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Events per batch (default: 1000)")
+    parser.add_argument("--replay", action="store_true", help="Emit events in real time at the target rate")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor (default: 1.0)")
+    parser.add_argument("--weighted", action="store_true", help="Draw home operators by market share")
+    parser.add_argument("--seed", type=int, help="Random seed for consistent generation")
+    parser.add_argument("--format", choices=list(WRITERS), default="ndjson", help="Output format (default: ndjson)")
+    parser.add_argument("--output", help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = {name: float(share) for name, share in (item.split("=") for item in args.mix.split(","))}
+    except ValueError:
+        parser.error(f"--mix must look like voice=0.3,sms=0.2,data=0.5, not {args.mix!r}")
+
+    faker = TelecomFaker(seed=args.seed, weighted=args.weighted)
+    try:
+        profile = TrafficProfile(mix=mix, roaming_rate=args.roaming_rate, arrivals=args.arrivals)
+        generator = faker.traffic(rate=args.rate, profile=profile, start=args.start)
+        if args.replay:
+            batches = generator.replay(args.count, args.batch_size, speed=args.speed)
+        else:
+            batches = generator.stream(args.count, args.batch_size)
+    except ValueError as e:
+        parser.error(str(e))
+
+    write = WRITERS[args.format]
+    try:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                write(batches, f)
+        else:
+            write(batches, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()